@@ -119,3 +119,26 @@ def initialize_config_manager(base_dir=None):
 def get_config_manager():
     """Get the global config manager instance"""
     return config_manager
+
+def write_config_file(config_path, config):
+    """
+    Write a configuration dictionary to a JSON file atomically.
+    
+    The JSON goes to a temporary file next to config_path that then replaces
+    it, so an interrupted write can't leave a truncated config file behind.
+    
+    Args:
+        config_path: Path of the config file to write
+        config: Configuration dictionary
+    """
+    # Serialize in one go and write once; json.dump writes every token separately
+    config_text = json.dumps(config, indent=4)
+    temp_path = f"{config_path}.tmp"
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as config_file:
+            config_file.write(config_text)
+        os.replace(temp_path, config_path)
+    finally:
+        # Only left over if writing or replacing failed
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
@@ -1,104 +1,410 @@
+import io
 import os
+import re
+import time
+import shutil
+import mmap
+import struct
+import operator
+import tempfile
 import datetime
-from PySide6.QtWidgets import QFileDialog
-from core.utils.logger import log, debug, warning, error, exception
+import functools
+import importlib
+import threading
+import subprocess
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from PySide6.QtWidgets import QFileDialog, QDialog, QListView, QTreeView, QAbstractItemView
+from core.utils.logger import log, debug, warning, error, exception, is_debug_enabled
 from database.db_project_files import ProjectFilesModel
 
 # Global operation ID - will be regenerated for each new file operation
 # This ensures all files opened in one operation get the same ID
 _current_operation_id = None
 
+# Optional modules imported on first use, or the import error message if unavailable
+_lazy_modules = {}
+
+# Last operation ID issued as an int, seeded from the database on first use; None
+# until the database could be read
+_last_operation_id = None
+_operation_id_lock = threading.Lock()
+
+# Date parts (year, month, day) per operation ID, so every file in one operation
+# shares the date computed for its first file
+_operation_date_cache = {}
+
+# Maximum number of threads used to read file details in parallel
+_MAX_DETAIL_WORKERS = 8
+
+# Least recently used cache of image dimensions keyed by (filepath, mtime_ns, size),
+# so entries for files that changed on disk are never hit again
+_DIMENSIONS_CACHE_SIZE = 4096
+_dimensions_cache = OrderedDict()
+_dimensions_cache_lock = threading.Lock()
+
+# Serializes pyexiv2 calls, which are not thread-safe
+_pyexiv2_lock = threading.Lock()
+
+# JPEG start-of-frame markers, which carry the image size (DHT, JPG and DAC are excluded)
+_JPEG_SOF_MARKERS = frozenset(range(0xc0, 0xd0)) - {0xc4, 0xc8, 0xcc}
+
+# User's home directory, used as the default start directory for file dialogs
+_HOME_DIR = os.path.expanduser('~')
+
+# EXIF 0th IFD tag numbers written by the piexif fallback
+# (piexif.ImageIFD.ImageDescription and piexif.ImageIFD.DocumentName)
+_EXIF_IMAGE_DESCRIPTION_TAG = 0x010e
+_EXIF_DOCUMENT_NAME_TAG = 0x010d
+
+# Image file extensions that support writing embedded metadata
+_METADATA_WRITE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.tiff', '.tif'})
+
+# Supported image file extensions (without dot) and their file type names.
+# This is the single source for extension lists, categories and dialog filters.
+_IMAGE_FILE_TYPES = {
+    'jpg': 'JPEG Image',
+    'jpeg': 'JPEG Image',
+    'png': 'PNG Image',
+    'gif': 'GIF Image',
+    'bmp': 'Bitmap Image',
+    'tiff': 'TIFF Image',
+    'tif': 'TIFF Image',
+    'webp': 'WebP Image',
+    'svg': 'SVG Image',
+    'ico': 'Icon File',
+    'heif': 'HEIF Image',
+    'heic': 'HEIC Image',
+    'psd': 'Photoshop Image',
+    'raw': 'RAW Image',
+    'cr2': 'Canon RAW',
+    'nef': 'Nikon RAW',
+    'arw': 'Sony RAW'
+}
+
+# Supported video file extensions (without dot) and their file type names
+_VIDEO_FILE_TYPES = {
+    'mp4': 'MP4 Video',
+    'avi': 'AVI Video',
+    'mov': 'QuickTime Video',
+    'mkv': 'Matroska Video',
+    'wmv': 'Windows Media Video',
+    'flv': 'Flash Video',
+    'webm': 'WebM Video',
+    'm4v': 'M4V Video',
+    '3gp': '3GP Video',
+    'mpg': 'MPEG Video',
+    'mpeg': 'MPEG Video',
+    'ts': 'Transport Stream',
+    'mts': 'AVCHD Video'
+}
+
+# (file_type, category, sub_category) per extension, built once from the tables above
+_FILE_TYPE_CATEGORIES = {
+    **{ext: (file_type, 'Image', 'Photo') for ext, file_type in _IMAGE_FILE_TYPES.items()},
+    **{ext: (file_type, 'Video', 'Movie') for ext, file_type in _VIDEO_FILE_TYPES.items()}
+}
+
+# Supported extensions including the dot, for O(1) membership tests
+_IMAGE_EXTENSIONS = frozenset(f'.{ext}' for ext in _IMAGE_FILE_TYPES)
+_VIDEO_EXTENSIONS = frozenset(f'.{ext}' for ext in _VIDEO_FILE_TYPES)
+_MEDIA_EXTENSIONS = _IMAGE_EXTENSIONS | _VIDEO_EXTENSIONS
+
+# File dialog filters built from the extension tables above
+_IMAGE_FILE_FILTER = "Image Files (" + " ".join(f"*.{ext}" for ext in _IMAGE_FILE_TYPES) + ");;All Files (*.*)"
+_VIDEO_FILE_FILTER = "Video Files (" + " ".join(f"*.{ext}" for ext in _VIDEO_FILE_TYPES) + ");;All Files (*.*)"
+
+@dataclass(frozen=True)
+class FileDetails:
+    """
+    Details of a single file as returned by get_file_details.
+    
+    Backed by __slots__ so large batches of files stay compact in memory.
+    Use to_dict() where a plain dictionary is needed, e.g. for database inserts.
+    """
+    __slots__ = (
+        'year', 'month', 'day', 'item_id', 'status', 'title', 'description', 'tags',
+        'filename', 'extension', 'filepath', 'filesize', 'file_type',
+        'image_width', 'image_height', 'dimensions', 'category', 'sub_category',
+        'title_length', 'tags_count', 'created_at', 'updated_at', 'deleted_at'
+    )
+    
+    year: str
+    month: str
+    day: str
+    item_id: str
+    status: str
+    title: str
+    description: str
+    tags: str
+    filename: str
+    extension: str
+    filepath: str
+    filesize: int
+    file_type: str
+    image_width: int
+    image_height: int
+    dimensions: str
+    category: str
+    sub_category: str
+    title_length: int
+    tags_count: int
+    created_at: str
+    updated_at: str
+    deleted_at: str
+    
+    def to_dict(self):
+        """Return the file details as a new dictionary keyed by field name."""
+        return dict(zip(self.__slots__, _file_details_values(self)))
+
+# Reads every FileDetails field in one C-level call, in __slots__ order
+_file_details_values = operator.attrgetter(*FileDetails.__slots__)
+
+def _lazy_import(module_name):
+    """
+    Import an optional module on first use and cache the result.
+    
+    A failed import is cached as well, so a missing optional library is only
+    searched for once instead of on every file.
+    
+    Args:
+        module_name (str): Dotted module name, e.g. 'PIL.Image'
+        
+    Returns:
+        module: The imported module
+        
+    Raises:
+        ImportError: If the module is not available
+    """
+    module = _lazy_modules.get(module_name)
+    if module is None:
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError as e:
+            module = str(e)
+        _lazy_modules[module_name] = module
+    if isinstance(module, str):
+        # Raise a fresh error each time so tracebacks don't pile up on one instance
+        raise ImportError(module)
+    return module
+
 def get_new_operation_id():
     """
-    Generate a sequential 4-digit operation ID from the database.
+    Generate a sequential 4-digit operation ID.
+    
+    The database is only queried until it could be read once, later IDs come
+    from a lock-guarded in-memory counter. The issued IDs are persisted
+    implicitly as the item_id of the files added with them.
     
     Returns:
         str: A 4-digit sequential operation ID
     """
-    global _current_operation_id
-    try:
-        # Get the next available ID from the database
-        project_model = ProjectFilesModel()
-        _current_operation_id = project_model.get_next_item_id()
-        return _current_operation_id
-    except Exception as e:
-        # Fallback to simple incrementing if database fails
-        warning(f"Failed to get sequential ID from database: {str(e)}")
-        _current_operation_id = "0001"  # Default to "0001" if no previous ID exists
+    global _current_operation_id, _last_operation_id
+    with _operation_id_lock:
+        _operation_date_cache.clear()
+        
+        if _last_operation_id is None:
+            # Continue after the last ID stored in the database
+            last_id = ProjectFilesModel().get_last_item_id()
+            if last_id is None:
+                # Start at "0001" for now, but don't keep it as the seed so the next call retries
+                warning("Failed to get sequential ID from database")
+                _current_operation_id = f"{1:04d}"
+                return _current_operation_id
+            _last_operation_id = last_id
+        
+        _last_operation_id += 1
+        _current_operation_id = f"{_last_operation_id:04d}"
         return _current_operation_id
 
-def get_image_dimensions(filepath):
+def advance_operation_id(item_id):
     """
-    Get image dimensions from file.
+    Record an item_id assigned without get_new_operation_id, so it is never issued again.
+    
+    Args:
+        item_id (str): The assigned 4-digit item_id
+    """
+    global _last_operation_id
+    try:
+        assigned_id = int(item_id)
+    except (TypeError, ValueError):
+        return
+    
+    with _operation_id_lock:
+        # Before seeding, the database query picks the assigned ID up anyway
+        if _last_operation_id is not None and assigned_id > _last_operation_id:
+            _last_operation_id = assigned_id
+
+def _read_header_image_size(fd):
+    """
+    Read width and height straight from the header of a PNG, GIF, WebP or JPEG file.
+    
+    Args:
+        fd (file): Opened binary file object
+        
+    Returns:
+        tuple: (width, height), or None if the format is not recognized
+    """
+    fd.seek(0)
+    head = fd.read(30)
+    
+    if head[:8] == b'\x89PNG\r\n\x1a\n' and head[12:16] == b'IHDR':
+        return struct.unpack('>II', head[16:24])
+    
+    if head[:6] in (b'GIF87a', b'GIF89a'):
+        return struct.unpack('<HH', head[6:10])
+    
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP' and len(head) == 30:
+        chunk = head[12:16]
+        if chunk == b'VP8 ':
+            # Lossy: 14 bit width and height follow the frame start code
+            width, height = struct.unpack('<HH', head[26:30])
+            return width & 0x3fff, height & 0x3fff
+        if chunk == b'VP8L':
+            # Lossless: 14 bit width-1 and height-1 packed after the signature byte
+            bits = int.from_bytes(head[21:25], 'little')
+            return (bits & 0x3fff) + 1, ((bits >> 14) & 0x3fff) + 1
+        if chunk == b'VP8X':
+            # Extended: 24 bit canvas width-1 and height-1
+            return int.from_bytes(head[24:27], 'little') + 1, int.from_bytes(head[27:30], 'little') + 1
+        return None
+    
+    if head[:2] == b'\xff\xd8':
+        # Walk the JPEG segments until a start-of-frame marker
+        fd.seek(2)
+        while True:
+            byte = fd.read(1)
+            while byte and byte != b'\xff':
+                byte = fd.read(1)
+            while byte == b'\xff':
+                byte = fd.read(1)
+            if not byte:
+                return None
+            
+            marker = byte[0]
+            if marker == 0x01 or 0xd0 <= marker <= 0xd8:
+                # Standalone markers carry no length
+                continue
+            
+            length_bytes = fd.read(2)
+            if len(length_bytes) < 2:
+                return None
+            length = struct.unpack('>H', length_bytes)[0]
+            
+            if marker in _JPEG_SOF_MARKERS:
+                frame = fd.read(5)
+                if len(frame) < 5:
+                    return None
+                height, width = struct.unpack('>HH', frame[1:5])
+                return width, height
+            
+            fd.seek(length - 2, os.SEEK_CUR)
+    
+    return None
+
+def _read_image_dimensions(filepath, fd=None):
+    """
+    Read image dimensions from the file header.
+    
+    Common formats are parsed directly, anything else goes through PIL.
     
     Args:
         filepath (str): Path to the image file
+        fd (file, optional): Already opened binary file object for filepath, reused instead of reopening
         
     Returns:
         tuple: (width, height, dimensions_string) or (None, None, None) if not an image
     """
+    if fd is None:
+        # Open the file once for both the header parser and PIL; a missing
+        # file makes open() raise, so no separate existence check is needed
+        try:
+            with open(filepath, 'rb') as image_fd:
+                return _read_image_dimensions(filepath, image_fd)
+        except OSError as e:
+            if is_debug_enabled():
+                debug(f"Could not get image dimensions for {filepath}: {str(e)}")
+            return None, None, None
+    
+    try:
+        size = _read_header_image_size(fd)
+        if size and size[0] and size[1]:
+            width, height = size
+            return width, height, f"{width} x {height}"
+    except Exception as e:
+        if is_debug_enabled():
+            debug(f"Could not parse image header for {filepath}: {str(e)}")
+    
     try:
-        from PIL import Image
-        if filepath and os.path.exists(filepath):
-            with Image.open(filepath) as img:
-                width, height = img.size
-                dimensions_str = f"{width} x {height}"
-                return width, height, dimensions_str
+        Image = _lazy_import('PIL.Image')
+        fd.seek(0)
+        with Image.open(fd) as img:
+            width, height = img.size
+            dimensions_str = f"{width} x {height}"
+            return width, height, dimensions_str
     except Exception as e:
-        debug(f"Could not get image dimensions for {filepath}: {str(e)}")
+        if is_debug_enabled():
+            debug(f"Could not get image dimensions for {filepath}: {str(e)}")
     return None, None, None
 
+def get_image_dimensions(filepath, fd=None, stat_info=None):
+    """
+    Get image dimensions from file.
+    
+    Results are cached by (filepath, modification time, size), so re-importing
+    unchanged files does not parse their headers again.
+    
+    Args:
+        filepath (str): Path to the image file
+        fd (file, optional): Already opened binary file object for filepath, reused instead of reopening
+        stat_info (os.stat_result, optional): Stat result for filepath if the caller already has one
+        
+    Returns:
+        tuple: (width, height, dimensions_string) or (None, None, None) if not an image
+    """
+    try:
+        if stat_info is None:
+            stat_info = os.fstat(fd.fileno()) if fd is not None else os.stat(filepath)
+    except (OSError, ValueError) as e:
+        if is_debug_enabled():
+            debug(f"Could not get image dimensions for {filepath}: {str(e)}")
+        return None, None, None
+    
+    cache_key = (filepath, stat_info.st_mtime_ns, stat_info.st_size)
+    with _dimensions_cache_lock:
+        dimensions = _dimensions_cache.get(cache_key)
+        if dimensions is not None:
+            _dimensions_cache.move_to_end(cache_key)
+            return dimensions
+    
+    dimensions = _read_image_dimensions(filepath, fd)
+    
+    with _dimensions_cache_lock:
+        _dimensions_cache[cache_key] = dimensions
+        if len(_dimensions_cache) > _DIMENSIONS_CACHE_SIZE:
+            _dimensions_cache.popitem(last=False)
+    return dimensions
+
 def get_file_type_category(extension):
     """
     Determine file type category based on extension.
     
     Args:
-        extension (str): File extension without dot
+        extension (str): Lowercase file extension without dot
         
     Returns:
         tuple: (file_type, category, sub_category)
     """
-    extension = extension.lower()
-    
-    # Image files
-    image_extensions = {
-        'jpg': 'JPEG Image',
-        'jpeg': 'JPEG Image', 
-        'png': 'PNG Image',
-        'gif': 'GIF Image',
-        'bmp': 'Bitmap Image',
-        'tiff': 'TIFF Image',
-        'tif': 'TIFF Image',
-        'webp': 'WebP Image',
-        'svg': 'SVG Image',
-        'ico': 'Icon File',
-        'raw': 'RAW Image',
-        'cr2': 'Canon RAW',
-        'nef': 'Nikon RAW',
-        'arw': 'Sony RAW'
-    }    # Video files
-    video_extensions = {
-        'mp4': 'MP4 Video',
-        'avi': 'AVI Video',
-        'mov': 'QuickTime Video',
-        'mkv': 'Matroska Video',
-        'wmv': 'Windows Media Video',
-        'flv': 'Flash Video',
-        'webm': 'WebM Video',
-        'm4v': 'M4V Video',
-        '3gp': '3GP Video',
-        'mpg': 'MPEG Video',
-        'mpeg': 'MPEG Video',
-        'ts': 'Transport Stream',
-        'mts': 'AVCHD Video'
-    }
-    
-    if extension in image_extensions:
-        return image_extensions[extension], 'Image', 'Photo'
-    elif extension in video_extensions:
-        return video_extensions[extension], 'Video', 'Movie'
-    else:
-        return extension.upper() + ' File', 'Other', 'Unknown'
+    file_type_category = _FILE_TYPE_CATEGORIES.get(extension)
+    if file_type_category is None:
+        return _unknown_file_type_category(extension)
+    return file_type_category
+
+@functools.lru_cache(maxsize=256)
+def _unknown_file_type_category(extension):
+    """Build the (file_type, category, sub_category) tuple for an unsupported extension."""
+    return extension.upper() + ' File', 'Other', 'Unknown'
 
 def calculate_title_length(title):
     """Calculate the length of title text."""
@@ -110,9 +416,8 @@ def calculate_tags_count(tags):
     """Calculate the number of tags."""
     if not tags or tags == '-':
         return 0
-    # Count tags by splitting on common separators
-    tags_list = [tag.strip() for tag in str(tags).replace(',', ' ').split() if tag.strip()]
-    return len(tags_list)
+    # Count tags by splitting on common separators; split() already drops empty parts
+    return len(str(tags).replace(',', ' ').split())
 
 def get_current_operation_id():
     """
@@ -126,12 +431,14 @@ def get_current_operation_id():
         return get_new_operation_id()
     return _current_operation_id
 
-def extract_file_metadata(filepath):
+def extract_file_metadata(filepath, fd=None, stat_info=None):
     """
     Extract metadata (title, description, tags) from file using pyexiv2 and other methods.
     
     Args:
         filepath (str): Path to the file
+        fd (file, optional): Already opened binary file object for filepath, reused instead of reopening
+        stat_info (os.stat_result, optional): Stat result for filepath if the caller already has one
         
     Returns:
         dict: Dictionary containing extracted metadata
@@ -142,182 +449,215 @@ def extract_file_metadata(filepath):
         'tags': None
     }
     
+    # Empty files cannot carry any metadata, no need to parse them
+    if stat_info is not None and stat_info.st_size == 0:
+        return metadata
+    
+    # Video containers are not supported by any of the readers below
+    extension = os.path.splitext(filepath)[1].lower().lstrip('.')
+    if get_file_type_category(extension)[1] == 'Video':
+        return metadata
+    
     try:
         # Try to extract metadata using pyexiv2 (most comprehensive)
         try:
-            import pyexiv2
+            pyexiv2 = _lazy_import('pyexiv2')
+            
+            image_data = None
+            if fd is not None:
+                # Read the already opened file once, outside the lock so reads still overlap
+                fd.seek(0)
+                image_data = fd.read()
+            
+            # pyexiv2 is not thread-safe, and get_multiple_file_details calls this from several threads
+            with _pyexiv2_lock:
+                if image_data is not None:
+                    # Let pyexiv2 parse the buffer instead of reopening the file
+                    img_source = pyexiv2.ImageData(image_data)
+                else:
+                    img_source = pyexiv2.Image(filepath)
             
-            with pyexiv2.Image(filepath) as img_metadata:
-                title = None
-                description = None
-                tags = set()
+                with img_source as img_metadata:
+                    title = None
+                    description = None
+                    tags = set()
                 
-                # Read XMP metadata first (highest priority)
-                try:
-                    xmp = img_metadata.read_xmp() or {}
+                    # Read XMP metadata first (highest priority)
+                    try:
+                        xmp = img_metadata.read_xmp() or {}
                     
-                    # Extract title from XMP
-                    if 'Xmp.dc.title' in xmp:
-                        title = xmp['Xmp.dc.title']
-                        if isinstance(title, dict):
-                            title = next(iter(title.values()))
+                        # Extract title from XMP
+                        if 'Xmp.dc.title' in xmp:
+                            title = xmp['Xmp.dc.title']
+                            if isinstance(title, dict):
+                                title = next(iter(title.values()))
                     
-                    # Extract description from XMP
-                    if 'Xmp.dc.description' in xmp:
-                        description = xmp['Xmp.dc.description']
-                        if isinstance(description, dict):
-                            description = next(iter(description.values()))
+                        # Extract description from XMP
+                        if 'Xmp.dc.description' in xmp:
+                            description = xmp['Xmp.dc.description']
+                            if isinstance(description, dict):
+                                description = next(iter(description.values()))
                     
-                    # Extract tags/keywords from XMP
-                    if 'Xmp.dc.subject' in xmp:
-                        tags.update(t for t in xmp['Xmp.dc.subject'] if isinstance(t, str))
+                        # Extract tags/keywords from XMP
+                        if 'Xmp.dc.subject' in xmp:
+                            tags.update(t for t in xmp['Xmp.dc.subject'] if isinstance(t, str))
                     
-                    # Additional XMP fields for description
-                    if not description and 'Xmp.dc.rights' in xmp:
-                        description = xmp['Xmp.dc.rights']
-                        if isinstance(description, dict):
-                            description = next(iter(description.values()))
+                        # Additional XMP fields for description
+                        if not description and 'Xmp.dc.rights' in xmp:
+                            description = xmp['Xmp.dc.rights']
+                            if isinstance(description, dict):
+                                description = next(iter(description.values()))
                             
-                except Exception as e:
-                    debug(f"Could not read XMP metadata from {filepath}: {str(e)}")
+                    except Exception as e:
+                        if is_debug_enabled():
+                            debug(f"Could not read XMP metadata from {filepath}: {str(e)}")
                 
-                # Read IPTC metadata if we don't have complete data
-                try:
-                    iptc = img_metadata.read_iptc() or {}
+                    # Read IPTC metadata if we don't have complete data
+                    try:
+                        iptc = img_metadata.read_iptc() or {}
                     
-                    # Extract title from IPTC if not found in XMP
-                    if not title and 'Iptc.Application2.ObjectName' in iptc:
-                        title = iptc['Iptc.Application2.ObjectName']
+                        # Extract title from IPTC if not found in XMP
+                        if not title and 'Iptc.Application2.ObjectName' in iptc:
+                            title = iptc['Iptc.Application2.ObjectName']
                     
-                    # Extract description from IPTC
-                    if not description and 'Iptc.Application2.Caption' in iptc:
-                        description = iptc['Iptc.Application2.Caption']
+                        # Extract description from IPTC
+                        if not description and 'Iptc.Application2.Caption' in iptc:
+                            description = iptc['Iptc.Application2.Caption']
                     
-                    # Extract keywords from IPTC
-                    if 'Iptc.Application2.Keywords' in iptc:
-                        iptc_keywords = iptc['Iptc.Application2.Keywords']
-                        if isinstance(iptc_keywords, list):
-                            tags.update(t for t in iptc_keywords if isinstance(t, str))
-                        elif isinstance(iptc_keywords, str):
-                            tags.add(iptc_keywords)
+                        # Extract keywords from IPTC
+                        if 'Iptc.Application2.Keywords' in iptc:
+                            iptc_keywords = iptc['Iptc.Application2.Keywords']
+                            if isinstance(iptc_keywords, list):
+                                tags.update(t for t in iptc_keywords if isinstance(t, str))
+                            elif isinstance(iptc_keywords, str):
+                                tags.add(iptc_keywords)
                     
-                    # Additional IPTC fields for description
-                    if not description and 'Iptc.Application2.Headline' in iptc:
-                        description = iptc['Iptc.Application2.Headline']
+                        # Additional IPTC fields for description
+                        if not description and 'Iptc.Application2.Headline' in iptc:
+                            description = iptc['Iptc.Application2.Headline']
                         
-                except Exception as e:
-                    debug(f"Could not read IPTC metadata from {filepath}: {str(e)}")
+                    except Exception as e:
+                        if is_debug_enabled():
+                            debug(f"Could not read IPTC metadata from {filepath}: {str(e)}")
                 
-                # Read EXIF metadata as fallback
-                try:
-                    exif = img_metadata.read_exif() or {}
+                    # Read EXIF metadata as fallback
+                    try:
+                        exif = img_metadata.read_exif() or {}
                     
-                    # Extract title from EXIF if not found elsewhere
-                    if not title and 'Exif.Image.DocumentName' in exif:
-                        title = exif['Exif.Image.DocumentName']
+                        # Extract title from EXIF if not found elsewhere
+                        if not title and 'Exif.Image.DocumentName' in exif:
+                            title = exif['Exif.Image.DocumentName']
                     
-                    # Extract description from EXIF
-                    if not description and 'Exif.Image.ImageDescription' in exif:
-                        description = exif['Exif.Image.ImageDescription']
+                        # Extract description from EXIF
+                        if not description and 'Exif.Image.ImageDescription' in exif:
+                            description = exif['Exif.Image.ImageDescription']
                     
-                    # Extract artist as potential tag
-                    if 'Exif.Image.Artist' in exif:
-                        artist = exif['Exif.Image.Artist']
-                        if artist and isinstance(artist, str):
-                            tags.add(f"Artist: {artist}")
+                        # Extract artist as potential tag
+                        if 'Exif.Image.Artist' in exif:
+                            artist = exif['Exif.Image.Artist']
+                            if artist and isinstance(artist, str):
+                                tags.add(f"Artist: {artist}")
                     
-                    # Extract copyright as potential tag
-                    if 'Exif.Image.Copyright' in exif:
-                        copyright_info = exif['Exif.Image.Copyright']
-                        if copyright_info and isinstance(copyright_info, str):
-                            tags.add(f"Copyright: {copyright_info}")
+                        # Extract copyright as potential tag
+                        if 'Exif.Image.Copyright' in exif:
+                            copyright_info = exif['Exif.Image.Copyright']
+                            if copyright_info and isinstance(copyright_info, str):
+                                tags.add(f"Copyright: {copyright_info}")
                             
-                except Exception as e:
-                    debug(f"Could not read EXIF metadata from {filepath}: {str(e)}")
+                    except Exception as e:
+                        if is_debug_enabled():
+                            debug(f"Could not read EXIF metadata from {filepath}: {str(e)}")
                 
-                # Clean and assign metadata
-                if title:
-                    metadata['title'] = str(title).strip()
-                if description:
-                    metadata['description'] = str(description).strip()
-                if tags:
-                    metadata['tags'] = ', '.join(sorted(list(tags)))
+                    # Clean and assign metadata
+                    if title:
+                        metadata['title'] = str(title).strip()
+                    if description:
+                        metadata['description'] = str(description).strip()
+                    if tags:
+                        metadata['tags'] = ', '.join(sorted(list(tags)))
                     
         except ImportError:
             debug("pyexiv2 module not available, falling back to PIL and exifread")
             
             # Fallback to PIL + exifread method
-            if filepath.lower().endswith(('.jpg', '.jpeg', '.tiff', '.tif')):
-                try:
-                    from PIL import Image
-                    from PIL.ExifTags import TAGS
+            try:
+                Image = _lazy_import('PIL.Image')
+                TAGS = _lazy_import('PIL.ExifTags').TAGS
+                
+                if fd is not None:
+                    fd.seek(0)
+                with Image.open(fd if fd is not None else filepath) as img:
+                    # getexif() works for every format PIL reads, not only JPEG/TIFF
+                    exif_data = dict(img.getexif() or {})
                     
-                    with Image.open(filepath) as img:
-                        exif_data = img._getexif()
-                        
-                        if exif_data:
-                            for tag_id, value in exif_data.items():
-                                tag = TAGS.get(tag_id, tag_id)
-                                
-                                if tag == 'ImageDescription':
-                                    metadata['description'] = str(value).strip()
-                                elif tag == 'XPTitle':
-                                    if isinstance(value, bytes):
-                                        metadata['title'] = value.decode('utf-16le', errors='ignore').strip('\x00')
-                                    else:
-                                        metadata['title'] = str(value).strip()
-                                elif tag == 'XPComment':
-                                    if isinstance(value, bytes):
-                                        metadata['description'] = value.decode('utf-16le', errors='ignore').strip('\x00')
-                                    else:
-                                        metadata['description'] = str(value).strip()
-                                elif tag == 'XPKeywords':
-                                    if isinstance(value, bytes):
-                                        metadata['tags'] = value.decode('utf-16le', errors='ignore').strip('\x00')
-                                    else:
-                                        metadata['tags'] = str(value).strip()
-                                elif tag == 'DocumentName' and not metadata['title']:
+                    if exif_data:
+                        for tag_id, value in exif_data.items():
+                            tag = TAGS.get(tag_id, tag_id)
+                            
+                            if tag == 'ImageDescription':
+                                metadata['description'] = str(value).strip()
+                            elif tag == 'XPTitle':
+                                if isinstance(value, bytes):
+                                    metadata['title'] = value.decode('utf-16le', errors='ignore').strip('\x00')
+                                else:
                                     metadata['title'] = str(value).strip()
-                                elif tag == 'Artist' and not metadata['tags']:
+                            elif tag == 'XPComment':
+                                if isinstance(value, bytes):
+                                    metadata['description'] = value.decode('utf-16le', errors='ignore').strip('\x00')
+                                else:
+                                    metadata['description'] = str(value).strip()
+                            elif tag == 'XPKeywords':
+                                if isinstance(value, bytes):
+                                    metadata['tags'] = value.decode('utf-16le', errors='ignore').strip('\x00')
+                                else:
                                     metadata['tags'] = str(value).strip()
-                                    
-                except Exception as e:
+                            elif tag == 'DocumentName' and not metadata['title']:
+                                metadata['title'] = str(value).strip()
+                            elif tag == 'Artist' and not metadata['tags']:
+                                metadata['tags'] = str(value).strip()
+                                
+            except Exception as e:
+                if is_debug_enabled():
                     debug(f"Could not extract PIL EXIF metadata from {filepath}: {str(e)}")
+            
+            # Try exifread for additional metadata
+            try:
+                exifread = _lazy_import('exifread')
                 
-                # Try exifread for additional metadata
-                try:
-                    import exifread
-                    
+                if fd is not None:
+                    fd.seek(0)
+                    tags = exifread.process_file(fd)
+                else:
                     with open(filepath, 'rb') as f:
                         tags = exifread.process_file(f)
+                
+                if 'Image ImageDescription' in tags and not metadata['description']:
+                    metadata['description'] = str(tags['Image ImageDescription']).strip()
+                
+                if 'EXIF UserComment' in tags and not metadata['description']:
+                    user_comment = str(tags['EXIF UserComment'])
+                    if user_comment.startswith('ASCII'):
+                        user_comment = user_comment[5:].strip()
+                    metadata['description'] = user_comment.strip()
                         
-                        if 'Image ImageDescription' in tags and not metadata['description']:
-                            metadata['description'] = str(tags['Image ImageDescription']).strip()
-                        
-                        if 'EXIF UserComment' in tags and not metadata['description']:
-                            user_comment = str(tags['EXIF UserComment'])
-                            if user_comment.startswith('ASCII'):
-                                user_comment = user_comment[5:].strip()
-                            metadata['description'] = user_comment.strip()
-                            
-                except ImportError:
-                    debug("exifread module not available")
-                except Exception as e:
+            except ImportError:
+                debug("exifread module not available")
+            except Exception as e:
+                if is_debug_enabled():
                     debug(f"Could not extract exifread metadata from {filepath}: {str(e)}")
-        
+    
         except Exception as e:
-            debug(f"Could not extract pyexiv2 metadata from {filepath}: {str(e)}")
+            if is_debug_enabled():
+                debug(f"Could not extract pyexiv2 metadata from {filepath}: {str(e)}")
         
-        # Clean up metadata values
-        for key in metadata:
-            if metadata[key]:
-                # Remove null characters and extra whitespace
-                metadata[key] = str(metadata[key]).replace('\x00', '').strip()
-                # If empty after cleaning, set to None
-                if not metadata[key]:
-                    metadata[key] = None
+        # Clean up metadata values: remove null characters and extra whitespace,
+        # and set to None if empty after cleaning
+        for key, value in metadata.items():
+            if value:
+                metadata[key] = str(value).replace('\x00', '').strip() or None
         
-        debug(f"Extracted metadata from {filepath}: title='{metadata['title']}', description='{metadata['description']}', tags='{metadata['tags']}'")
+        if is_debug_enabled():
+            debug(f"Extracted metadata from {filepath}: title='{metadata['title']}', description='{metadata['description']}', tags='{metadata['tags']}'")
         
     except Exception as e:
         warning(f"Error extracting metadata from {filepath}: {str(e)}")
@@ -325,7 +665,29 @@ def extract_file_metadata(filepath):
     
     return metadata
 
-def get_file_details(filepath, operation_id=None, title=None, description=None, tags=None, category=None, sub_category=None):
+def get_date_parts():
+    """
+    Get the current date split into the parts stored with every project file.
+    
+    Returns:
+        tuple: (year, month, day) strings, e.g. ("2025", "May", "07")
+    """
+    now = datetime.datetime.now()
+    return str(now.year), now.strftime('%B'), f"{now.day:02d}"
+
+def format_timestamp(timestamp):
+    """
+    Format a POSIX timestamp as a local ISO 8601 string with second precision.
+    
+    Args:
+        timestamp (float): Seconds since the epoch, e.g. from os.stat
+        
+    Returns:
+        str: Timestamp formatted like "2025-05-07T14:03:21"
+    """
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(timestamp))
+
+def get_file_details(filepath, operation_id=None, title=None, description=None, tags=None, category=None, sub_category=None, date_parts=None, stat_info=None):
     """
     Extract file details from a given filepath with comprehensive metadata extraction.
     
@@ -337,29 +699,38 @@ def get_file_details(filepath, operation_id=None, title=None, description=None,
         tags (str, optional): Custom tags for the file (overrides extracted metadata)
         category (str, optional): Custom category override
         sub_category (str, optional): Custom sub-category override
+        date_parts (tuple, optional): (year, month, day) from get_date_parts, computed once per batch
+        stat_info (os.stat_result, optional): Stat result for filepath if the caller already has one
         
     Returns:
-        dict: Dictionary containing comprehensive file details
+        FileDetails: Comprehensive file details, or None if the file could not be read
     """
     try:
+        # basename handles both separators on Windows, then one rfind splits off the extension
         filename_with_ext = os.path.basename(filepath)
-        filename = os.path.splitext(filename_with_ext)[0]
-        extension = os.path.splitext(filename_with_ext)[1].lower().lstrip('.')
+        dot_index = filename_with_ext.rfind('.')
+        if dot_index > 0:
+            filename = filename_with_ext[:dot_index]
+            extension = filename_with_ext[dot_index + 1:].lower()
+        else:
+            filename, extension = filename_with_ext, ''
         
-        stat_info = os.stat(filepath)
+        if stat_info is None:
+            stat_info = os.stat(filepath)
         filesize = stat_info.st_size
-        created_time = datetime.datetime.fromtimestamp(stat_info.st_ctime).isoformat()
-        modified_time = datetime.datetime.fromtimestamp(stat_info.st_mtime).isoformat()
-        
-        # Create datetime objects for project data
-        now = datetime.datetime.now()
-        year = str(now.year)
-        month = now.strftime('%B')  # Full month name
-        day = str(now.day).zfill(2)  # Day with leading zero
+        created_time = format_timestamp(stat_info.st_ctime)
+        modified_time = format_timestamp(stat_info.st_mtime)
         
         # Use the provided operation ID or get the current one
         item_id = operation_id or get_current_operation_id()
         
+        # Date parts for project data: year, full month name and zero-padded day
+        if date_parts is None:
+            date_parts = _operation_date_cache.get(item_id)
+            if date_parts is None:
+                date_parts = _operation_date_cache.setdefault(item_id, get_date_parts())
+        year, month, day = date_parts
+        
         # Get file type and category information
         file_type, auto_category, auto_sub_category = get_file_type_category(extension)
         
@@ -367,11 +738,18 @@ def get_file_details(filepath, operation_id=None, title=None, description=None,
         final_category = category or auto_category
         final_sub_category = sub_category or auto_sub_category
         
-        # Get image dimensions if it's an image file
-        image_width, image_height, dimensions = get_image_dimensions(filepath)
-        
-        # Extract metadata from file
-        extracted_metadata = extract_file_metadata(filepath)
+        if auto_category == 'Video':
+            # Videos have no readable image dimensions or embedded image metadata
+            image_width, image_height, dimensions = None, None, None
+            extracted_metadata = {'title': None, 'description': None, 'tags': None}
+        else:
+            # Open the file once and share the handle between the dimension and metadata readers
+            with open(filepath, 'rb') as fd:
+                # Get image dimensions if it's an image file; this only parses the header, not the pixels
+                image_width, image_height, dimensions = get_image_dimensions(filepath, fd=fd, stat_info=stat_info)
+                
+                # Extract metadata from file
+                extracted_metadata = extract_file_metadata(filepath, fd=fd, stat_info=stat_info)
         
         # Use provided metadata or extracted metadata, with provided taking priority
         # Only use filename as fallback for title if explicitly provided as parameter
@@ -379,39 +757,67 @@ def get_file_details(filepath, operation_id=None, title=None, description=None,
         final_description = description or extracted_metadata['description']
         final_tags = tags or extracted_metadata['tags']
         
-        # Calculate title length and tags count
-        title_length = calculate_title_length(final_title)
-        tags_count = calculate_tags_count(final_tags)
-        
-        return {
-            "year": year,
-            "month": month,
-            "day": day,
-            "item_id": item_id,
-            "status": "draft",  # Default status
-            "title": final_title,
-            "description": final_description,
-            "tags": final_tags,
-            "filename": filename,
-            "extension": extension,
-            "filepath": filepath,
-            "filesize": filesize,
-            "file_type": file_type,
-            "image_width": image_width,
-            "image_height": image_height,
-            "dimensions": dimensions,
-            "category": final_category,
-            "sub_category": final_sub_category,
-            "title_length": title_length,
-            "tags_count": tags_count,
-            "created_at": created_time,
-            "updated_at": modified_time,
-            "deleted_at": None
-        }
+        # Calculate title length and tags count, coercing each field to a string only once
+        title_str = str(final_title) if final_title else ''
+        title_length = 0 if title_str == '-' else len(title_str)
+        tags_str = str(final_tags) if final_tags else ''
+        tags_count = 0 if tags_str == '-' else len(tags_str.replace(',', ' ').split())
+        
+        return FileDetails(
+            year=year,
+            month=month,
+            day=day,
+            item_id=item_id,
+            status="draft",  # Default status
+            title=final_title,
+            description=final_description,
+            tags=final_tags,
+            filename=filename,
+            extension=extension,
+            filepath=filepath,
+            filesize=filesize,
+            file_type=file_type,
+            image_width=image_width,
+            image_height=image_height,
+            dimensions=dimensions,
+            category=final_category,
+            sub_category=final_sub_category,
+            title_length=title_length,
+            tags_count=tags_count,
+            created_at=created_time,
+            updated_at=modified_time,
+            deleted_at=None
+        )
     except Exception as e:
         exception(e, f"Error getting file details for {filepath}")
         return None
 
+def get_multiple_file_details(filepaths, operation_id):
+    """
+    Extract file details for several files in parallel.
+    
+    Reading headers and metadata is I/O bound, so the files are processed by a
+    small thread pool. Results keep the order of filepaths.
+    
+    Args:
+        filepaths (list): Paths of the files to read
+        operation_id (str): Operation ID shared by all files
+        
+    Returns:
+        list: List of FileDetails objects for the files that could be read
+    """
+    if not filepaths:
+        return []
+    
+    # All files in this operation share the same date
+    date_parts = get_date_parts()
+    
+    def read_details(filepath):
+        return get_file_details(filepath, operation_id, date_parts=date_parts)
+    
+    with ThreadPoolExecutor(max_workers=min(_MAX_DETAIL_WORKERS, len(filepaths))) as executor:
+        return [details for details in executor.map(read_details, filepaths) if details]
+
 def select_image_file(parent=None, start_dir=None):
     """
     Open file dialog to select a single image file.
@@ -421,23 +827,20 @@ def select_image_file(parent=None, start_dir=None):
         start_dir: Starting directory for the dialog (defaults to user's home dir)
         
     Returns:
-        dict: File details if selected, None if canceled
+        FileDetails: File details if selected, None if canceled
     """
-    # Generate a new operation ID for this file selection
-    operation_id = get_new_operation_id()
+    start_dir = start_dir or _HOME_DIR
     
-    if start_dir is None:
-        start_dir = os.path.expanduser('~')
-        
-    file_filter = "Image Files (*.png *.jpg *.jpeg *.gif *.bmp *.tiff);;All Files (*.*)"
     filepath, _ = QFileDialog.getOpenFileName(
         parent,
         "Select Image File",
         start_dir,
-        file_filter
+        _IMAGE_FILE_FILTER
     )
     
     if filepath:
+        # Generate a new operation ID for this file selection, only once a file was chosen
+        operation_id = get_new_operation_id()
         log(f"Selected image file: {filepath} (Operation ID: {operation_id})")
         return get_file_details(filepath, operation_id)
     return None
@@ -451,28 +854,25 @@ def select_multiple_image_files(parent=None, start_dir=None):
         start_dir: Starting directory for the dialog (defaults to user's home dir)
         
     Returns:
-        list: List of file details dictionaries
+        list: List of FileDetails objects
     """
-    # Generate a new operation ID for this file selection operation
-    # All files selected in this operation will share the same ID
-    operation_id = get_new_operation_id()
+    start_dir = start_dir or _HOME_DIR
     
-    if start_dir is None:
-        start_dir = os.path.expanduser('~')
-        
-    file_filter = "Image Files (*.png *.jpg *.jpeg *.gif *.bmp *.tiff);;All Files (*.*)"
     filepaths, _ = QFileDialog.getOpenFileNames(
         parent,
         "Select Image Files",
         start_dir,
-        file_filter
+        _IMAGE_FILE_FILTER
     )
     
-    results = []
-    for filepath in filepaths:
-        details = get_file_details(filepath, operation_id)
-        if details:
-            results.append(details)
+    if not filepaths:
+        return []
+    
+    # Generate a new operation ID for this file selection operation, only once files were chosen
+    # All files selected in this operation will share the same ID
+    operation_id = get_new_operation_id()
+    
+    results = get_multiple_file_details(filepaths, operation_id)
     
     log(f"Selected {len(results)} image files (Operation ID: {operation_id})")
     return results
@@ -488,9 +888,8 @@ def select_folder(parent=None, start_dir=None):
     Returns:
         str: Selected folder path or None if canceled
     """
-    if start_dir is None:
-        start_dir = os.path.expanduser('~')
-        
+    start_dir = start_dir or _HOME_DIR
+    
     folder_path = QFileDialog.getExistingDirectory(
         parent,
         "Select Folder",
@@ -504,7 +903,10 @@ def select_folder(parent=None, start_dir=None):
 
 def select_multiple_folders(parent=None, start_dir=None):
     """
-    Open dialog to select multiple folders (using a workaround since Qt doesn't support this natively).
+    Open a single dialog to select multiple folders.
+    
+    Qt's native folder dialogs only allow one selection, so this uses Qt's own
+    dialog with its list and tree views switched to extended selection.
     
     Args:
         parent: Parent widget for the dialog
@@ -513,28 +915,20 @@ def select_multiple_folders(parent=None, start_dir=None):
     Returns:
         list: List of selected folder paths
     """
+    start_dir = start_dir or _HOME_DIR
+    
+    dialog = QFileDialog(parent, "Select Folders", start_dir)
+    dialog.setFileMode(QFileDialog.Directory)
+    dialog.setOption(QFileDialog.ShowDirsOnly, True)
+    dialog.setOption(QFileDialog.DontUseNativeDialog, True)
+    
+    # Allow Ctrl/Shift selection of several folders in both view modes
+    for view in dialog.findChildren(QListView) + dialog.findChildren(QTreeView):
+        view.setSelectionMode(QAbstractItemView.ExtendedSelection)
+    
     results = []
-    keep_selecting = True
-    
-    while keep_selecting:
-        folder_path = select_folder(parent, start_dir)
-        if folder_path:
-            results.append(folder_path)
-            from PySide6.QtWidgets import QMessageBox
-            reply = QMessageBox.question(
-                parent, 
-                "Select Another Folder?",
-                "Do you want to select another folder?",
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.No
-            )
-            keep_selecting = (reply == QMessageBox.Yes)
-            
-            # Update the start dir to the parent of the selected folder for convenience
-            if keep_selecting:
-                start_dir = os.path.dirname(folder_path)
-        else:
-            keep_selecting = False
+    if dialog.exec() == QDialog.Accepted:
+        results = [folder_path for folder_path in dialog.selectedFiles() if os.path.isdir(folder_path)]
     
     log(f"Selected {len(results)} folders")
     return results
@@ -548,23 +942,20 @@ def select_video_file(parent=None, start_dir=None):
         start_dir: Starting directory for the dialog (defaults to user's home dir)
         
     Returns:
-        dict: File details if selected, None if canceled
+        FileDetails: File details if selected, None if canceled
     """
-    # Generate a new operation ID for this file selection
-    operation_id = get_new_operation_id()
+    start_dir = start_dir or _HOME_DIR
     
-    if start_dir is None:
-        start_dir = os.path.expanduser('~')
-        
-    file_filter = "Video Files (*.mp4 *.mov *.avi *.mkv *.wmv);;All Files (*.*)"
     filepath, _ = QFileDialog.getOpenFileName(
         parent,
         "Select Video File",
         start_dir,
-        file_filter
+        _VIDEO_FILE_FILTER
     )
     
     if filepath:
+        # Generate a new operation ID for this file selection, only once a file was chosen
+        operation_id = get_new_operation_id()
         log(f"Selected video file: {filepath} (Operation ID: {operation_id})")
         return get_file_details(filepath, operation_id)
     return None
@@ -578,61 +969,131 @@ def select_multiple_video_files(parent=None, start_dir=None):
         start_dir: Starting directory for the dialog (defaults to user's home dir)
         
     Returns:
-        list: List of file details dictionaries
+        list: List of FileDetails objects
     """
-    # Generate a new operation ID for this file selection operation
-    # All files selected in this operation will share the same ID
-    operation_id = get_new_operation_id()
+    start_dir = start_dir or _HOME_DIR
     
-    if start_dir is None:
-        start_dir = os.path.expanduser('~')
-        
-    file_filter = "Video Files (*.mp4 *.mov *.avi *.mkv *.wmv);;All Files (*.*)"
     filepaths, _ = QFileDialog.getOpenFileNames(
         parent,
         "Select Video Files",
         start_dir,
-        file_filter
+        _VIDEO_FILE_FILTER
     )
     
-    results = []
-    for filepath in filepaths:
-        details = get_file_details(filepath, operation_id)
-        if details:
-            results.append(details)
+    if not filepaths:
+        return []
+    
+    # Generate a new operation ID for this file selection operation, only once files were chosen
+    # All files selected in this operation will share the same ID
+    operation_id = get_new_operation_id()
+    
+    results = get_multiple_file_details(filepaths, operation_id)
     
     log(f"Selected {len(results)} video files (Operation ID: {operation_id})")
     return results
 
 def get_image_extensions():
     """
-    Get a list of supported image file extensions.
+    Get the set of supported image file extensions.
     
     Returns:
-        list: List of image file extensions including the dot (e.g., ['.jpg', '.png'])
+        frozenset: Image file extensions including the dot (e.g., {'.jpg', '.png'}).
+                   The same shared set is returned on every call.
     """
-    return [
-        '.jpg', '.jpeg', '.png', '.gif', '.bmp', 
-        '.tiff', '.tif', '.webp', '.svg', '.raw',
-        '.heif', '.heic', '.ico', '.psd'
-    ]
+    return _IMAGE_EXTENSIONS
 
 
 def get_video_extensions():
     """
-    Get a list of supported video file extensions.
+    Get the set of supported video file extensions.
     
     Returns:
-        list: List of video file extensions including the dot (e.g., ['.mp4', '.avi'])
+        frozenset: Video file extensions including the dot (e.g., {'.mp4', '.avi'}).
+                   The same shared set is returned on every call.
     """
-    return [
-        '.mp4', '.avi', '.mov', '.wmv', '.flv',
-        '.webm', '.mkv', '.m4v', '.3gp', '.mpg',
-        '.mpeg', '.ts', '.mts'
-    ]
+    return _VIDEO_EXTENSIONS
 
+def get_media_extensions():
+    """
+    Get the set of all supported image and video file extensions.
+    
+    Returns:
+        frozenset: Image and video file extensions including the dot.
+                   The same shared set is returned on every call.
+    """
+    return _MEDIA_EXTENSIONS
+
+def iter_media_files(folder_path):
+    """
+    Yield every supported image and video file in a folder and its subfolders.
+    
+    Walks with os.scandir, whose entries carry the stat info from the directory
+    listing, so callers can pass it to get_file_details instead of stat-ing again.
+    Folders are visited top-down in the same order as os.walk.
+    
+    Args:
+        folder_path (str): Folder to search
+        
+    Yields:
+        tuple: (file_path, stat_info) for each supported file
+    """
+    pending_dirs = [folder_path]
+    while pending_dirs:
+        current_dir = pending_dirs.pop()
+        media_files = []
+        sub_dirs = []
+        try:
+            with os.scandir(current_dir) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            sub_dirs.append(entry.path)
+                        elif entry.is_file():
+                            ext = os.path.splitext(entry.name)[1].lower()
+                            if ext in _MEDIA_EXTENSIONS:
+                                media_files.append((entry.path, entry.stat()))
+                    except OSError as e:
+                        warning(f"Could not read {entry.path}: {e}")
+        except OSError as e:
+            warning(f"Could not read folder {current_dir}: {e}")
+            continue
+        
+        # Yield after the listing is closed, so no directory handle stays open
+        # while the caller processes the files
+        yield from media_files
+        
+        # Reversed so the first subfolder is popped first
+        pending_dirs.extend(reversed(sub_dirs))
+
+
+def _is_metadata_writable(filepath):
+    """
+    Check whether metadata can be written to the given file.
+    
+    Args:
+        filepath (str): Path to the image file
+        
+    Returns:
+        bool: True if the file is a supported, existing and writable image
+    """
+    # Check if it's a supported image file first, this needs no filesystem access
+    file_ext = os.path.splitext(filepath)[1].lower()
+    if file_ext not in _METADATA_WRITE_EXTENSIONS:
+        debug(f"Skipping metadata write for non-supported file type: {file_ext}")
+        return False
+    
+    # Check if file exists and is writable
+    if not os.path.exists(filepath):
+        warning(f"File does not exist: {filepath}")
+        return False
+    
+    if not os.access(filepath, os.W_OK):
+        warning(f"File is not writable: {filepath}")
+        return False
+    
+    return True
 
-def write_metadata_to_file(filepath, metadata):
+def write_metadata_to_file(filepath, metadata, validated=False):
     """
     Write metadata to an image file using pyexiv2 and other methods.
     
@@ -640,133 +1101,126 @@ def write_metadata_to_file(filepath, metadata):
         filepath (str): Path to the image file
         metadata (dict): Dictionary containing metadata to write
                         Expected keys: title, description, keywords/tags
+        validated (bool): True if the caller already checked the file with _is_metadata_writable
                         
     Returns:
         bool: True if successful, False otherwise
     """
     try:
-        # Check if file exists and is writable
-        if not os.path.exists(filepath):
-            warning(f"File does not exist: {filepath}")
-            return False
-        
-        if not os.access(filepath, os.W_OK):
-            warning(f"File is not writable: {filepath}")
-            return False
-        
-        # Check if it's an image file
-        image_extensions = ['.jpg', '.jpeg', '.png', '.tiff', '.tif']
-        file_ext = os.path.splitext(filepath)[1].lower()
-        
-        if file_ext not in image_extensions:
-            debug(f"Skipping metadata write for non-supported file type: {file_ext}")
+        if not validated and not _is_metadata_writable(filepath):
             return False
         
         success = False
         
         # Try pyexiv2 first (most comprehensive)
         try:
-            import pyexiv2
+            pyexiv2 = _lazy_import('pyexiv2')
             
-            with pyexiv2.Image(filepath) as img:
-                # Prepare metadata for writing with safe string conversion
-                xmp_data = {}
-                iptc_data = {}
-                exif_data = {}
+            # pyexiv2 is not thread-safe; file details are read on several threads at once
+            with _pyexiv2_lock:
+                with pyexiv2.Image(filepath) as img:
+                    # Prepare metadata for writing with safe string conversion
+                    xmp_data = {}
+                    iptc_data = {}
+                    exif_data = {}
                 
-                # Handle title with error handling (write as plain string, not dict)
-                if 'title' in metadata and metadata['title']:
-                    try:
-                        title = str(metadata['title']).strip()
-                        if title and len(title) < 250:  # Reasonable length limit
-                            xmp_data['Xmp.dc.title'] = title
-                            iptc_data['Iptc.Application2.ObjectName'] = title
-                            exif_data['Exif.Image.DocumentName'] = title
-                    except Exception as e:
-                        warning(f"Error processing title metadata: {e}")
+                    # Handle title with error handling (write as plain string, not dict)
+                    if 'title' in metadata and metadata['title']:
+                        try:
+                            title = str(metadata['title']).strip()
+                            if title and len(title) < 250:  # Reasonable length limit
+                                xmp_data['Xmp.dc.title'] = title
+                                iptc_data['Iptc.Application2.ObjectName'] = title
+                                exif_data['Exif.Image.DocumentName'] = title
+                        except Exception as e:
+                            warning(f"Error processing title metadata: {e}")
                 
-                # Handle description with error handling (write as plain string, not dict)
-                if 'description' in metadata and metadata['description']:
-                    try:
-                        description = str(metadata['description']).strip()
-                        if description and len(description) < 2000:  # Reasonable length limit
-                            xmp_data['Xmp.dc.description'] = description
-                            iptc_data['Iptc.Application2.Caption'] = description
-                            exif_data['Exif.Image.ImageDescription'] = description
-                    except Exception as e:
-                        warning(f"Error processing description metadata: {e}")
+                    # Handle description with error handling (write as plain string, not dict)
+                    if 'description' in metadata and metadata['description']:
+                        try:
+                            description = str(metadata['description']).strip()
+                            if description and len(description) < 2000:  # Reasonable length limit
+                                xmp_data['Xmp.dc.description'] = description
+                                iptc_data['Iptc.Application2.Caption'] = description
+                                exif_data['Exif.Image.ImageDescription'] = description
+                        except Exception as e:
+                            warning(f"Error processing description metadata: {e}")
                 
-                # Handle keywords/tags with error handling
-                keywords = []
-                try:
-                    if 'keywords' in metadata and metadata['keywords']:
-                        if isinstance(metadata['keywords'], list):
-                            keywords = [str(k).strip() for k in metadata['keywords'] if k and str(k).strip() and len(str(k).strip()) < 100]
-                        elif isinstance(metadata['keywords'], str):
-                            keywords = [k.strip() for k in metadata['keywords'].split(',') if k.strip() and len(k.strip()) < 100]
-                    elif 'tags' in metadata and metadata['tags']:
-                        if isinstance(metadata['tags'], list):
-                            keywords = [str(t).strip() for t in metadata['tags'] if t and str(t).strip() and len(str(t).strip()) < 100]
-                        elif isinstance(metadata['tags'], str):
-                            keywords = [t.strip() for t in metadata['tags'].split(',') if t.strip() and len(t.strip()) < 100]
-                    
-                    # Limit number of keywords
-                    keywords = keywords[:50]  # Max 50 keywords
-                    
-                except Exception as e:
-                    warning(f"Error processing keywords metadata: {e}")
+                    # Handle keywords/tags with error handling
                     keywords = []
-                
-                if keywords:
                     try:
-                        xmp_data['Xmp.dc.subject'] = keywords
-                        # IPTC keywords need to be set individually
-                        iptc_data['Iptc.Application2.Keywords'] = keywords
+                        if 'keywords' in metadata and metadata['keywords']:
+                            if isinstance(metadata['keywords'], list):
+                                keywords = [str(k).strip() for k in metadata['keywords'] if k and str(k).strip() and len(str(k).strip()) < 100]
+                            elif isinstance(metadata['keywords'], str):
+                                keywords = [k.strip() for k in metadata['keywords'].split(',') if k.strip() and len(k.strip()) < 100]
+                        elif 'tags' in metadata and metadata['tags']:
+                            if isinstance(metadata['tags'], list):
+                                keywords = [str(t).strip() for t in metadata['tags'] if t and str(t).strip() and len(str(t).strip()) < 100]
+                            elif isinstance(metadata['tags'], str):
+                                keywords = [t.strip() for t in metadata['tags'].split(',') if t.strip() and len(t.strip()) < 100]
+                    
+                        # Limit number of keywords
+                        keywords = keywords[:50]  # Max 50 keywords
+                    
                     except Exception as e:
-                        warning(f"Error setting keywords in metadata: {e}")
+                        warning(f"Error processing keywords metadata: {e}")
+                        keywords = []
                 
-                # Write XMP metadata with error handling
-                if xmp_data:
-                    try:
-                        img.modify_xmp(xmp_data)
-                        debug(f"Wrote XMP metadata to {filepath}")
-                    except Exception as e:
-                        warning(f"Failed to write XMP metadata: {e}")
+                    if keywords:
+                        try:
+                            xmp_data['Xmp.dc.subject'] = keywords
+                            # IPTC keywords need to be set individually
+                            iptc_data['Iptc.Application2.Keywords'] = keywords
+                        except Exception as e:
+                            warning(f"Error setting keywords in metadata: {e}")
                 
-                # Write IPTC metadata with error handling
-                if iptc_data:
-                    try:
-                        img.modify_iptc(iptc_data)
-                        debug(f"Wrote IPTC metadata to {filepath}")
-                    except Exception as e:
-                        warning(f"Failed to write IPTC metadata: {e}")
+                    # Write XMP metadata with error handling
+                    if xmp_data:
+                        try:
+                            img.modify_xmp(xmp_data)
+                            debug(f"Wrote XMP metadata to {filepath}")
+                        except Exception as e:
+                            warning(f"Failed to write XMP metadata: {e}")
                 
-                # Write EXIF metadata with error handling (be careful with EXIF as it can be more restrictive)
-                if exif_data:
-                    try:
-                        img.modify_exif(exif_data)
-                        debug(f"Wrote EXIF metadata to {filepath}")
-                    except Exception as e:
-                        warning(f"Failed to write EXIF metadata: {e}")
+                    # Write IPTC metadata with error handling
+                    if iptc_data:
+                        try:
+                            img.modify_iptc(iptc_data)
+                            debug(f"Wrote IPTC metadata to {filepath}")
+                        except Exception as e:
+                            warning(f"Failed to write IPTC metadata: {e}")
+                
+                    # Write EXIF metadata with error handling (be careful with EXIF as it can be more restrictive)
+                    if exif_data:
+                        try:
+                            img.modify_exif(exif_data)
+                            debug(f"Wrote EXIF metadata to {filepath}")
+                        except Exception as e:
+                            warning(f"Failed to write EXIF metadata: {e}")
                 
-                success = True
-                log(f"Successfully wrote metadata to {filepath}")
+                    success = True
+                    log(f"Successfully wrote metadata to {filepath}")
                 
         except ImportError:
             debug("pyexiv2 module not available, trying alternative methods")
             
             # Fallback to PIL method for basic metadata
             try:
-                from PIL import Image
-                from PIL.ExifTags import TAGS
-                import piexif
+                Image = _lazy_import('PIL.Image')
+                piexif = _lazy_import('piexif')
                 
-                # Read existing EXIF data
-                img = Image.open(filepath)
+                # Read existing EXIF data through a read-only memory map, so PIL's header
+                # parsing is served from the page cache instead of many small reads.
+                # The context managers guarantee the map and file handle are released.
+                with open(filepath, 'rb') as image_file, \
+                        mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as image_map:
+                    with Image.open(image_map) as img:
+                        existing_exif = img.info.get('exif')
                 
                 # Get existing EXIF or create new
-                if 'exif' in img.info:
-                    exif_dict = piexif.load(img.info['exif'])
+                if existing_exif:
+                    exif_dict = piexif.load(existing_exif)
                 else:
                     exif_dict = {"0th": {}, "Exif": {}, "GPS": {}, "1st": {}, "thumbnail": None}
                 
@@ -775,7 +1229,7 @@ def write_metadata_to_file(filepath, metadata):
                     try:
                         description = str(metadata['description']).strip()
                         if description and len(description) < 500:  # EXIF has smaller limits
-                            exif_dict["0th"][piexif.ImageIFD.ImageDescription] = description.encode('utf-8')
+                            exif_dict["0th"][_EXIF_IMAGE_DESCRIPTION_TAG] = description.encode('utf-8')
                     except Exception as e:
                         warning(f"Error adding description to EXIF: {e}")
                 
@@ -783,18 +1237,42 @@ def write_metadata_to_file(filepath, metadata):
                     try:
                         title = str(metadata['title']).strip()
                         if title and len(title) < 100:  # EXIF has smaller limits
-                            exif_dict["0th"][piexif.ImageIFD.DocumentName] = title.encode('utf-8')
+                            exif_dict["0th"][_EXIF_DOCUMENT_NAME_TAG] = title.encode('utf-8')
                     except Exception as e:
                         warning(f"Error adding title to EXIF: {e}")
                 
-                # Convert and save with error handling
+                # Convert and write with error handling
+                exif_bytes = piexif.dump(exif_dict)
                 try:
-                    exif_bytes = piexif.dump(exif_dict)
-                    img.save(filepath, exif=exif_bytes)
+                    # Replace only the EXIF segment in place, the pixel data is not re-encoded
+                    piexif.insert(exif_bytes, filepath)
                     success = True
-                    debug(f"Wrote basic metadata using PIL/piexif to {filepath}")
+                    debug(f"Wrote basic metadata using piexif to {filepath}")
                 except Exception as e:
-                    warning(f"Failed to save image with EXIF: {e}")
+                    # piexif.insert only handles JPEG and WebP, re-save other formats with PIL
+                    debug(f"Could not insert EXIF in place for {filepath}, re-saving with PIL: {e}")
+                    try:
+                        # Encode into memory first, then swap the new file in atomically
+                        buffer = io.BytesIO()
+                        with Image.open(filepath) as img:
+                            img.save(buffer, format=img.format, exif=exif_bytes)
+                        
+                        temp_fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(filepath), suffix='.tmp')
+                        try:
+                            with os.fdopen(temp_fd, 'wb') as temp_file:
+                                # getbuffer() hands the encoded bytes over without another copy
+                                temp_file.write(buffer.getbuffer())
+                            # mkstemp creates the file as 0600, keep the original file's permissions
+                            shutil.copymode(filepath, temp_path)
+                            os.replace(temp_path, filepath)
+                        finally:
+                            # Only left over if writing or replacing failed
+                            if os.path.exists(temp_path):
+                                os.remove(temp_path)
+                        success = True
+                        debug(f"Wrote basic metadata using PIL/piexif to {filepath}")
+                    except Exception as e:
+                        warning(f"Failed to save image with EXIF: {e}")
                 
             except ImportError:
                 debug("piexif module not available")
@@ -811,6 +1289,29 @@ def write_metadata_to_file(filepath, metadata):
         return False
 
 
+def write_metadata_batch(items):
+    """
+    Write metadata to several image files in one go.
+    
+    All files are validated up front, then written one after another.
+    
+    Args:
+        items (list): List of (filepath, metadata) tuples
+        
+    Returns:
+        int: Number of files successfully written
+    """
+    valid_items = [(filepath, metadata) for filepath, metadata in items if _is_metadata_writable(filepath)]
+    
+    written_count = 0
+    for filepath, metadata in valid_items:
+        if write_metadata_to_file(filepath, metadata, validated=True):
+            written_count += 1
+    
+    log(f"Wrote metadata to {written_count} of {len(items)} files")
+    return written_count
+
+
 def update_file_metadata_from_ai(filepath, ai_metadata):
     """
     Update file metadata both in database and in the actual file.
@@ -839,3 +1340,118 @@ def update_file_metadata_from_ai(filepath, ai_metadata):
     except Exception as e:
         exception(e, f"Error updating file metadata for {filepath}")
         return False
+
+
+def _get_metadata_fields(metadata):
+    """
+    Normalize title, description and keywords from a metadata dict for writing.
+    
+    Applies the same length limits as write_metadata_to_file.
+    
+    Args:
+        metadata (dict): Metadata with title, description and keywords/tags
+        
+    Returns:
+        tuple: (title, description, keywords) where title/description may be None
+    """
+    title = str(metadata.get('title') or '').strip()
+    description = str(metadata.get('description') or '').strip()
+    
+    raw_keywords = metadata.get('keywords') or metadata.get('tags') or []
+    if isinstance(raw_keywords, str):
+        raw_keywords = raw_keywords.split(',')
+    keywords = [str(k).strip() for k in raw_keywords if k and str(k).strip()]
+    keywords = [k for k in keywords if len(k) < 100][:50]  # Max 50 keywords
+    
+    return (
+        title if title and len(title) < 250 else None,
+        description if description and len(description) < 2000 else None,
+        keywords
+    )
+
+def _build_exiftool_args(filepath, metadata):
+    """
+    Build the exiftool argfile lines that write metadata to one file.
+    
+    Args:
+        filepath (str): Path to the image file
+        metadata (dict): Metadata with title, description and keywords/tags
+        
+    Returns:
+        list: Argfile lines, ending with the file path and -execute
+    """
+    title, description, keywords = _get_metadata_fields(metadata)
+    
+    args = []
+    # Argfiles are line based, so values must not contain line breaks
+    if title:
+        title = ' '.join(title.split())
+        args += [f'-XMP-dc:Title={title}', f'-IPTC:ObjectName={title}', f'-EXIF:DocumentName={title}']
+    if description:
+        description = ' '.join(description.split())
+        args += [f'-XMP-dc:Description={description}', f'-IPTC:Caption-Abstract={description}',
+                 f'-EXIF:ImageDescription={description}']
+    for keyword in keywords:
+        keyword = ' '.join(keyword.split())
+        args += [f'-XMP-dc:Subject={keyword}', f'-IPTC:Keywords={keyword}']
+    
+    if not args:
+        return []
+    return args + [filepath, '-execute']
+
+def update_file_metadata_from_ai_batch(items):
+    """
+    Write AI-generated metadata to several image files at once.
+    
+    All files are written by a single exiftool process driven by an argfile,
+    so the process start-up cost is paid once for the whole batch. Without
+    exiftool on the PATH this falls back to write_metadata_batch.
+    
+    Args:
+        items (list): List of (filepath, ai_metadata) tuples
+        
+    Returns:
+        int: Number of files successfully written
+    """
+    exiftool_path = shutil.which('exiftool')
+    if not exiftool_path:
+        debug("exiftool not available, writing metadata file by file")
+        return write_metadata_batch(items)
+    
+    argfile_lines = []
+    for filepath, ai_metadata in items:
+        if _is_metadata_writable(filepath):
+            argfile_lines += _build_exiftool_args(filepath, ai_metadata)
+    
+    if not argfile_lines:
+        return 0
+    
+    argfile_path = None
+    try:
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', suffix='.args', delete=False) as argfile:
+            argfile.write('\n'.join(argfile_lines) + '\n')
+            argfile_path = argfile.name
+        
+        command = [
+            exiftool_path, '-@', argfile_path,
+            '-common_args', '-overwrite_original', '-P',
+            '-charset', 'filename=utf8', '-charset', 'iptc=utf8', '-codedcharacterset=utf8'
+        ]
+        creation_flags = subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+        result = subprocess.run(command, capture_output=True, text=True, encoding='utf-8',
+                                errors='replace', creationflags=creation_flags)
+        
+        # Every -execute block prints its own "N image files updated" summary
+        written_count = sum(int(count) for count in re.findall(r'(\d+) image files? updated', result.stdout))
+        if result.returncode != 0:
+            warning(f"exiftool reported errors while writing metadata: {result.stderr.strip()}")
+        
+        log(f"Wrote metadata to {written_count} of {len(items)} files using exiftool")
+        return written_count
+        
+    except Exception as e:
+        exception(e, "Error writing metadata with exiftool")
+        return 0
+    finally:
+        if argfile_path and os.path.exists(argfile_path):
+            os.remove(argfile_path)
@@ -1,19 +1,39 @@
 import os
 import re
 import time
-import json
-import shutil
-import zipfile
-import tempfile
 import threading
-import subprocess
 from urllib.request import Request, urlopen
 from urllib.error import URLError, HTTPError
-from PySide6 import QtWidgets, QtUiTools, QtCore
-from PySide6.QtCore import Qt, QMetaObject, Signal, QObject, QUrl
+from PySide6 import QtWidgets, QtCore
+from PySide6.QtCore import Qt, QMetaObject, Signal, QObject
 from PySide6.QtWidgets import QMessageBox
-from PySide6.QtGui import QDesktopServices
 from core.helper._window_utils import center_window
+from core.helper._ui_cache import load_ui_cached
+
+# Read size for downloading and extracting the update package
+_DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# Update packages up to this size are downloaded into memory instead of a temp file
+_IN_MEMORY_PACKAGE_LIMIT = 128 << 20  # 128 MiB
+
+# Name prefix of the directory an update package is staged in, inside the application directory
+_STAGING_DIR_PREFIX = ".update-"
+
+# Minimum time in seconds between progress signals from the worker thread
+_PROGRESS_INTERVAL = 0.25
+
+# Username and repository name from a GitHub URL, without any .git suffix or
+# trailing path such as /releases or /tags
+_GITHUB_REPO_PATTERN = re.compile(r'github\.com/([^/]+)/([^/?#]+?)(?:\.git)?(?:[/?#]|$)')
+
+# A release's target_commitish when it names a commit rather than a branch
+_COMMIT_SHA_PATTERN = re.compile(r'^[0-9a-f]{7,40}$')
+
+# %version% and %hash% placeholders in the updater's explanation text
+_PLACEHOLDER_PATTERN = re.compile(r'%(version|hash)%')
+
+# Explanation text template from app_updater_window.ui, read on first open
+_explanation_template = None
 
 
 class UpdateSignals(QObject):
@@ -21,6 +41,28 @@ class UpdateSignals(QObject):
     progress = Signal(int, str)  # Progress value and status message
     complete = Signal(bool, str)  # Success status and message
     error = Signal(str)  # Error message
+    
+    def __init__(self):
+        super().__init__()
+        self._last_progress_time = 0.0
+    
+    def progress_due(self, final=False):
+        """Check whether a frequent progress update should be emitted now.
+        
+        Limits loop updates to one per _PROGRESS_INTERVAL, so the GUI event
+        queue isn't flooded with cross-thread signals.
+        
+        Args:
+            final: True for the last update of a loop, which is always emitted
+            
+        Returns:
+            bool: True if the caller should emit the progress signal
+        """
+        now = time.monotonic()
+        if final or now - self._last_progress_time >= _PROGRESS_INTERVAL:
+            self._last_progress_time = now
+            return True
+        return False
 
 
 def launch_app_updater(parent, config, base_dir):
@@ -34,11 +76,7 @@ def launch_app_updater(parent, config, base_dir):
     # Load the UI file for the app updater dialog
     ui_path = os.path.join(base_dir, "gui", "dialogs", "app_updater_window.ui")
     
-    loader = QtUiTools.QUiLoader()
-    ui_file = QtCore.QFile(ui_path)
-    ui_file.open(QtCore.QFile.ReadOnly)
-    dialog = loader.load(ui_file, parent)
-    ui_file.close()
+    dialog = load_ui_cached(ui_path, parent)
       # Set window title
     app_name = config.get("app_name", "Image Tea Mini")
     app_version = config.get("app_remote_version", "")
@@ -47,11 +85,13 @@ def launch_app_updater(parent, config, base_dir):
       # Display appropriate title and explanation
     dialog.lblTitle.setText(f"Updating {app_name} to v{app_version}")
     
-    # Replace placeholders in the explanation text
-    explanation_text = dialog.label.text()
-    explanation_text = explanation_text.replace("%version%", app_version)
-    explanation_text = explanation_text.replace("%hash%", app_hash[:7] if app_hash else "unknown")
-    dialog.label.setText(explanation_text)
+    # Replace placeholders in the explanation text in a single pass; the template
+    # from the .ui file is static, so it is only read from the label once
+    global _explanation_template
+    if _explanation_template is None:
+        _explanation_template = dialog.label.text()
+    placeholders = {"version": app_version, "hash": app_hash[:7] if app_hash else "unknown"}
+    dialog.label.setText(_PLACEHOLDER_PATTERN.sub(lambda match: placeholders[match.group(1)], _explanation_template))
     
     # Add status label for progress updates if not already in UI
     if not hasattr(dialog, 'lblStatus'):
@@ -146,6 +186,8 @@ def update_complete(dialog, success, message, base_dir):
         message: Message to display
         base_dir: Base directory of the application
     """
+    import subprocess
+    
     if success:
         # Complete the progress bar immediately
         dialog.progressBar.setValue(100)
@@ -232,93 +274,94 @@ def perform_update(config, base_dir, signals):
         base_dir: Base directory of the application
         signals: UpdateSignals instance for thread communication
     """
+    # Imported on use, the updater runs rarely and shouldn't slow down app startup
+    import tempfile
+    
     try:
-        # Step 1: Check internet connection (10%)
-        signals.progress.emit(5, "Checking internet connection...")
-        if not check_internet_connection():
-            signals.error.emit("No internet connection. Please check your connection and try again.")
-            return
-        
-        # Step 2: Check if GitHub is accessible (15%)
-        signals.progress.emit(10, "Checking GitHub accessibility...")
-        if not check_github_accessible():
-            signals.error.emit("Cannot access GitHub. Please check your internet connection and try again.")
-            return
-          # Step 3: Get latest release info (20%)
-        signals.progress.emit(15, "Getting latest release information...")
+        # Step 1: Get latest release info (15%)
+        signals.progress.emit(10, "Getting latest release information...")
         github_url = config.get("app_update_url", "")
         repo_info = extract_repo_info(github_url)
         if not repo_info:
             signals.error.emit("Failed to parse GitHub repository information.")
             return
         
+        # A successful API call proves both the connection and GitHub work, so the
+        # connectivity probes only run to explain a failure
         username, repo_name = repo_info
         latest_release = get_latest_release_info(username, repo_name)
         if not latest_release:
-            signals.error.emit("Failed to retrieve release information from GitHub.")
+            if not check_internet_connection():
+                signals.error.emit("No internet connection. Please check your connection and try again.")
+            elif not check_github_accessible():
+                signals.error.emit("Cannot access GitHub. Please check your internet connection and try again.")
+            else:
+                signals.error.emit("Failed to retrieve release information from GitHub.")
             return
         
-        # Step 4: Setup the download for source code ZIP from GitHub (25%)
+        # Step 2: Setup the download for source code ZIP from GitHub (25%)
         signals.progress.emit(20, "Finding download package...")
         tag_name = latest_release.get('tag_name')
         if not tag_name:
             signals.error.emit("No tag name found in the latest release.")
             return
             
-        # GitHub automatically provides source code archives for each release
-        # Format: https://github.com/{username}/{repo}/archive/refs/tags/{tag_name}.zip
-        download_url = f"https://github.com/{username}/{repo_name}/archive/refs/tags/{tag_name}.zip"
+        # GitHub automatically provides source code archives for each release.
+        # github.com only redirects to codeload.github.com, so go there directly and
+        # keep the github.com URL as a fallback
+        download_urls = (
+            f"https://codeload.github.com/{username}/{repo_name}/zip/refs/tags/{tag_name}",
+            f"https://github.com/{username}/{repo_name}/archive/refs/tags/{tag_name}.zip",
+        )
         zip_filename = f"{repo_name}-{tag_name}.zip"
-          # Step 5: Download the ZIP file (50%)
+          # Step 3: Download the ZIP file (50%)
         signals.progress.emit(25, f"Downloading {zip_filename}...")
-        temp_dir = tempfile.mkdtemp()
-        zip_path = os.path.join(temp_dir, zip_filename)
         
-        try:
-            download_file(download_url, zip_path, signals)
-        except Exception as e:
-            signals.error.emit(f"Failed to download update package: {str(e)}")
-            shutil.rmtree(temp_dir, ignore_errors=True)
-            return
-        
-        # Step 6: Extract the ZIP file (75%)
-        signals.progress.emit(60, "Extracting update package...")
-        extract_dir = os.path.join(temp_dir, "extract")
-        os.makedirs(extract_dir, exist_ok=True)
-        
-        try:
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(extract_dir)
-        except Exception as e:
-            signals.error.emit(f"Failed to extract update package: {str(e)}")
-            shutil.rmtree(temp_dir, ignore_errors=True)
-            return
-        
-        # Step 7: Find the root folder in the extracted content
-        root_folder = None
-        for item in os.listdir(extract_dir):
-            item_path = os.path.join(extract_dir, item)
-            if os.path.isdir(item_path):
-                root_folder = item_path
+        # Verify the archive before touching any application file; a truncated or
+        # corrupted download is discarded and downloaded once more
+        for attempt in range(2):
+            # Small archives stay in memory, larger ones spill over to a temp file
+            package_file = tempfile.SpooledTemporaryFile(max_size=_IN_MEMORY_PACKAGE_LIMIT)
+            download_error = None
+            for download_url in download_urls:
+                try:
+                    download_file(download_url, package_file, signals)
+                    download_error = None
+                    break
+                except Exception as e:
+                    # Discard any partial data before trying the next URL
+                    download_error = e
+                    package_file.seek(0)
+                    package_file.truncate()
+            
+            if download_error is not None:
+                package_file.close()
+                signals.error.emit(f"Failed to download update package: {str(download_error)}")
+                return
+            
+            signals.progress.emit(60, "Verifying update package...")
+            if verify_update_package(package_file):
                 break
+            
+            package_file.close()
+            if attempt == 0:
+                signals.progress.emit(25, "Update package is corrupted, downloading again...")
+        else:
+            signals.error.emit("The downloaded update package is corrupted. Please try again later.")
+            return
         
-        if not root_folder:
-            # If no root folder, use the extract directory itself
-            root_folder = extract_dir
-        
-        # Step 8: Replace application files (90%)
-        signals.progress.emit(75, "Updating application files...")
+        # Step 4: Extract the ZIP file and move it over the application directory (90%)
+        signals.progress.emit(60, "Updating application files...")
         try:
-            replace_application_files(root_folder, base_dir, signals)
+            extract_update_package(package_file, base_dir, signals)
         except Exception as e:
             signals.error.emit(f"Failed to update application files: {str(e)}")
-            shutil.rmtree(temp_dir, ignore_errors=True)
             return
+        finally:
+            # Step 5: Clean up the downloaded package
+            package_file.close()
         
-        # Step 9: Clean up temporary files
-        signals.progress.emit(95, "Cleaning up...")
-        shutil.rmtree(temp_dir, ignore_errors=True)
-          # Step 10: Update complete (100%)
+          # Step 6: Update complete (100%)
         signals.progress.emit(100, "Update completed successfully!")
           # Update the config with the new version information
         updated_config = config.copy()
@@ -328,41 +371,7 @@ def perform_update(config, base_dir, signals):
         updated_config['app_version'] = tag_name.lstrip('v')
         
         # Get the actual commit hash, not just target_commitish (which could be "main" or "master")
-        commit_hash = ''
-        target_commitish = latest_release.get('target_commitish', '')
-        
-        # If target_commitish is a commit hash (not "main" or "master"), use it
-        if target_commitish and not target_commitish.lower() in ['main', 'master', 'develop', 'trunk']:
-            commit_hash = target_commitish
-        
-        # If we don't have a proper commit hash, try to get it from the tag itself
-        if not commit_hash or len(commit_hash) < 7:
-            try:
-                # Get the commit SHA from the tag reference
-                tag_url = f"https://api.github.com/repos/{username}/{repo_name}/git/refs/tags/{tag_name}"
-                tag_req = Request(tag_url)
-                tag_req.add_header('User-Agent', 'Mozilla/5.0')
-                tag_response = urlopen(tag_req, timeout=5)
-                tag_data = json.loads(tag_response.read().decode())
-                
-                # If it's an annotated tag, we need to get the tagged object
-                if tag_data.get('object', {}).get('type') == 'tag':
-                    tag_sha = tag_data.get('object', {}).get('sha', '')
-                    if tag_sha:
-                        # Get the tag object
-                        tag_obj_url = f"https://api.github.com/repos/{username}/{repo_name}/git/tags/{tag_sha}"
-                        tag_obj_req = Request(tag_obj_url)
-                        tag_obj_req.add_header('User-Agent', 'Mozilla/5.0')
-                        tag_obj_response = urlopen(tag_obj_req, timeout=5)
-                        tag_obj_data = json.loads(tag_obj_response.read().decode())
-                        commit_hash = tag_obj_data.get('object', {}).get('sha', '')
-                else:
-                    # Lightweight tag points directly to the commit
-                    commit_hash = tag_data.get('object', {}).get('sha', '')
-            except Exception as e:
-                print(f"Error getting commit hash from tag: {e}")
-                # Fall back to target_commitish if we can't get the commit hash
-                commit_hash = target_commitish
+        commit_hash = get_release_commit_hash(username, repo_name, latest_release)
         
         # If we still don't have a commit hash, use remote_commit_hash from config
         if not commit_hash or commit_hash.lower() in ['main', 'master', 'develop', 'trunk']:
@@ -425,66 +434,99 @@ def check_github_accessible():
 
 def extract_repo_info(github_url):
     """Extract the username and repository name from a GitHub URL."""
-    github_patterns = [
-        r'github\.com/([^/]+)/([^/]+)',  # Standard GitHub URL
-        r'github\.com/([^/]+)/([^/]+)/?$',  # GitHub URL with optional trailing slash
-        r'github\.com/([^/]+)/([^/]+)/(?:releases|tags)',  # GitHub releases or tags page
-    ]
-    
-    for pattern in github_patterns:
-        match = re.search(pattern, github_url)
-        if match:
-            username, repo = match.groups()
-            # Remove any potential .git suffix
-            repo = repo.replace('.git', '')
-            return username, repo
+    match = _GITHUB_REPO_PATTERN.search(github_url)
+    if match:
+        return match.group(1), match.group(2)
     
     return None
 
 
 def get_latest_release_info(username, repo_name):
     """Get the latest release information from GitHub."""
+    import json
+    
     try:
         api_url = f"https://api.github.com/repos/{username}/{repo_name}/releases/latest"
         req = Request(api_url)
         req.add_header('User-Agent', 'Mozilla/5.0')
         response = urlopen(req, timeout=10)
-        data = json.loads(response.read().decode())
+        data = json.load(response)
         return data
     except Exception as e:
         print(f"Error getting latest release: {e}")
         return None
 
 
+def get_release_commit_hash(username, repo_name, release):
+    """
+    Get the commit hash a GitHub release points at.
+
+    Uses the release's target_commitish when it is already a commit hash, otherwise
+    resolves the tag with a single request to the commits endpoint, which accepts
+    both lightweight and annotated tags.
+
+    Args:
+        username: The repository owner
+        repo_name: The repository name
+        release: The release data from the GitHub API
+
+    Returns:
+        str: The commit hash, or an empty string if it couldn't be found
+    """
+    from urllib.parse import quote
+
+    target_commitish = release.get('target_commitish', '')
+    if _COMMIT_SHA_PATTERN.match(target_commitish):
+        return target_commitish
+
+    tag_name = release.get('tag_name', '')
+    if not tag_name:
+        return ''
+
+    try:
+        commit_url = f"https://api.github.com/repos/{username}/{repo_name}/commits/{quote(tag_name, safe='')}"
+        req = Request(commit_url)
+        req.add_header('User-Agent', 'Mozilla/5.0')
+        # Ask for the bare commit SHA instead of the full commit JSON
+        req.add_header('Accept', 'application/vnd.github.sha')
+        response = urlopen(req, timeout=5)
+        commit_hash = response.read().decode('ascii', 'replace').strip()
+        return commit_hash if _COMMIT_SHA_PATTERN.match(commit_hash) else ''
+    except Exception as e:
+        print(f"Error getting commit hash for tag {tag_name}: {e}")
+        return ''
+
+
 def download_file(url, destination, signals):
     """Download a file with progress updates.
     
     Args:
         url: URL to download from
-        destination: Path to save the file
+        destination: Writable binary file object to save the download into
         signals: UpdateSignals instance for thread communication
     """
     try:
         req = Request(url)
         req.add_header('User-Agent', 'Mozilla/5.0')
+        # The archive is already compressed, don't let the server gzip it again
+        req.add_header('Accept-Encoding', 'identity')
         response = urlopen(req, timeout=30)
         
         # Get file size if available
         file_size = int(response.info().get('Content-Length', 0))
         downloaded = 0
-        chunk_size = 8192
         
-        with open(destination, 'wb') as f:
+        with response:
             while True:
-                chunk = response.read(chunk_size)
+                chunk = response.read(_DOWNLOAD_CHUNK_SIZE)
                 if not chunk:
                     break
                 
-                f.write(chunk)
+                destination.write(chunk)
                 downloaded += len(chunk)
                 
-                # Update progress
-                if file_size > 0:
+                # Update progress, throttled by the signals object
+                if file_size > 0 and signals.progress_due(downloaded >= file_size):
                     progress = min(60, 25 + int(35 * downloaded / file_size))
                     progress_msg = f"Downloading... ({downloaded / (1024*1024):.1f} MB / {file_size / (1024*1024):.1f} MB)"
                     signals.progress.emit(progress, progress_msg)
@@ -494,70 +536,183 @@ def download_file(url, destination, signals):
         raise Exception(f"Download failed: {str(e)}")
 
 
-def replace_application_files(source_dir, dest_dir, signals):
-    """Replace application files with the new version.
+def verify_update_package(package):
+    """Check that the downloaded update package is a complete ZIP file.
+    
+    Only the archive's central directory is read, which catches a truncated
+    download; the CRC-32 of every member is checked while it is extracted.
     
     Args:
-        source_dir: Directory containing the new version files
+        package: Path or seekable file object of the downloaded ZIP file
+        
+    Returns:
+        bool: True if the archive can be opened, False otherwise
+    """
+    import zipfile
+    
+    try:
+        with zipfile.ZipFile(package, 'r'):
+            return True
+    except (zipfile.BadZipFile, OSError) as e:
+        print(f"Invalid update package: {e}")
+        return False
+
+
+def extract_update_package(package, dest_dir, signals):
+    """Extract the update package over the application files.
+    
+    GitHub source archives wrap everything in a single "{repo}-{tag}/" folder;
+    that root is stripped. All members are first extracted into a staging
+    directory inside dest_dir, which checks each member's CRC-32 as it is
+    read, and only then moved into place. A damaged archive or a failed write
+    leaves the application files untouched; if moving a file into place fails,
+    the files replaced so far are restored.
+    
+    Args:
+        package: Path or seekable file object of the downloaded ZIP file
         dest_dir: Base directory of the application
         signals: UpdateSignals instance for thread communication
     """
-    # Get total number of files to copy for progress tracking
-    total_files = 0
-    for root, _, files in os.walk(source_dir):
-        total_files += len(files)
+    import shutil
+    import zipfile
+    import tempfile
     
-    if total_files == 0:
-        raise Exception("No files found in the update package.")
+    dest_prefix = os.path.join(os.path.realpath(dest_dir), "")
     
-    # Copy files with progress updates
-    copied_files = 0
+    # Remove staging directories left behind by an update that was killed
+    for name in os.listdir(dest_prefix):
+        if name.startswith(_STAGING_DIR_PREFIX):
+            shutil.rmtree(os.path.join(dest_prefix, name), ignore_errors=True)
     
-    for root, dirs, files in os.walk(source_dir):
-        # Get the relative path from source_dir
-        rel_path = os.path.relpath(root, source_dir)
-        
-        # Skip if this is the source root directory
-        if rel_path == ".":
-            rel_path = ""
-        
-        # Create the destination directory if it doesn't exist
-        dest_path = os.path.join(dest_dir, rel_path)
-        os.makedirs(dest_path, exist_ok=True)
-        
-        # Copy each file
-        for file in files:
-            source_file = os.path.join(root, file)
-            dest_file = os.path.join(dest_path, file)
+    # Staged next to the application files, so moving them into place is a rename
+    staging_dir = tempfile.mkdtemp(prefix=_STAGING_DIR_PREFIX, dir=dest_prefix)
+    try:
+        with zipfile.ZipFile(package, 'r') as zip_ref:
+            members = zip_ref.infolist()
             
-            # Skip .git files and directories
-            if ".git" in source_file:
-                continue
+            # Strip the common root folder if every member lives inside one
+            names = [member.filename for member in members]
+            root_prefix = ""
+            if names and "/" in names[0]:
+                candidate = names[0].split("/", 1)[0] + "/"
+                if all(name.startswith(candidate) for name in names):
+                    root_prefix = candidate
+            
+            # Collect the files to write, skipping .git, .github and .git* files
+            extract_jobs = []
+            for member in members:
+                rel_name = member.filename[len(root_prefix):]
+                if not rel_name or member.is_dir():
+                    continue
+                if any(part.startswith(".git") for part in rel_name.split("/")):
+                    continue
                 
-            try:
-                # Copy the file, overwriting if it exists
-                shutil.copy2(source_file, dest_file)
+                # normpath is pure string work, unlike realpath it doesn't stat every component
+                dest_file = os.path.normpath(dest_prefix + rel_name)
+                # Never write outside the application directory
+                if not dest_file.startswith(dest_prefix):
+                    print(f"Skipping unsafe path in update package: {member.filename}")
+                    continue
+                staged_file = os.path.join(staging_dir, os.path.relpath(dest_file, dest_prefix))
+                extract_jobs.append((member, staged_file, dest_file))
+            
+            total_files = len(extract_jobs)
+            if total_files == 0:
+                raise Exception("No files found in the update package.")
+            
+            # Extract into the staging directory with progress updates; reading a
+            # member to the end raises BadZipFile if its CRC-32 doesn't match
+            extracted_files = 0
+            created_dirs = set()
+            
+            for member, staged_file, dest_file in extract_jobs:
+                # Create each staging directory only once
+                staged_path = os.path.dirname(staged_file)
+                if staged_path not in created_dirs:
+                    os.makedirs(staged_path, exist_ok=True)
+                    created_dirs.add(staged_path)
                 
-                # Update progress
-                copied_files += 1
-                progress = min(95, 75 + int(20 * copied_files / total_files))
-                signals.progress.emit(
-                    progress, 
-                    f"Updating files... ({copied_files}/{total_files})"
-                )
-            except Exception as e:
-                print(f"Error copying {source_file} to {dest_file}: {e}")
-                # Continue with other files even if one fails
+                with zip_ref.open(member) as source, open(staged_file, 'wb') as target:
+                    shutil.copyfileobj(source, target, _DOWNLOAD_CHUNK_SIZE)
+                
+                # Keep the modification time from the archive, like copy2 did
+                mtime = time.mktime(member.date_time + (0, 0, -1))
+                os.utime(staged_file, (mtime, mtime))
+                extracted_files += 1
+                
+                # Update progress, throttled by the signals object
+                if signals.progress_due(extracted_files == total_files):
+                    progress = min(90, 60 + int(30 * extracted_files / total_files))
+                    signals.progress.emit(
+                        progress, 
+                        f"Updating files... ({extracted_files}/{total_files})"
+                    )
+        
+        # Every file was extracted and verified, move them over the application files
+        signals.progress.emit(90, "Installing updated files...")
+        backup_dir = tempfile.mkdtemp(prefix="backup-", dir=staging_dir)
+        install_staged_files(
+            [(staged_file, dest_file) for _, staged_file, dest_file in extract_jobs],
+            dest_prefix, backup_dir
+        )
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
     
     return True
 
 
+def install_staged_files(install_jobs, dest_prefix, backup_dir):
+    """Move staged files over the application files, restoring all of them on failure.
+    
+    Each file that is replaced is first moved into backup_dir. If any move
+    fails, the files installed so far are put back the way they were before
+    the error is raised again.
+    
+    Args:
+        install_jobs: List of (staged file, destination file) pairs
+        dest_prefix: Base directory of the application, ending with a separator
+        backup_dir: Directory for the replaced files, on the same volume
+    """
+    # (destination file, backup file or None if the file is new) per installed file
+    installed = []
+    created_dirs = set()
+    try:
+        for staged_file, dest_file in install_jobs:
+            dest_path = os.path.dirname(dest_file)
+            if dest_path not in created_dirs:
+                os.makedirs(dest_path, exist_ok=True)
+                created_dirs.add(dest_path)
+            
+            backup_file = None
+            if os.path.lexists(dest_file):
+                backup_file = os.path.join(backup_dir, os.path.relpath(dest_file, dest_prefix))
+                os.makedirs(os.path.dirname(backup_file), exist_ok=True)
+                os.replace(dest_file, backup_file)
+            installed.append((dest_file, backup_file))
+            os.replace(staged_file, dest_file)
+    except Exception:
+        # Undo in reverse order; the last entry may not have been replaced yet
+        failed_restores = []
+        for dest_file, backup_file in reversed(installed):
+            try:
+                if backup_file is not None:
+                    os.replace(backup_file, dest_file)
+                elif os.path.lexists(dest_file):
+                    os.remove(dest_file)
+            except OSError as e:
+                failed_restores.append(dest_file)
+                print(f"Could not restore {dest_file}: {e}")
+        if failed_restores:
+            print(f"{len(failed_restores)} application files could not be restored after a failed update")
+        raise
+
+
 def save_config(config, base_dir):
     """Save the updated configuration to the config.json file."""
+    from core.config.config_manager import write_config_file
+    
     try:
-        config_path = os.path.join(base_dir, "config.json")
-        with open(config_path, 'w') as config_file:
-            json.dump(config, config_file, indent=4)
+        write_config_file(os.path.join(base_dir, "config.json"), config)
         return True
     except Exception as e:
         print(f"Error saving config: {e}")
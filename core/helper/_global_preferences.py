@@ -4,11 +4,24 @@ Helper module for managing global preferences dialog.
 This module handles loading, displaying, and saving global application preferences.
 """
 
-from PySide6 import QtWidgets, QtUiTools, QtCore
-from PySide6.QtGui import QIcon
+from PySide6 import QtWidgets
 import os
 import logging
+from types import SimpleNamespace
 from core.helper._window_utils import center_window
+from core.helper._icon_cache import get_icon
+from core.helper._ui_cache import load_ui_cached
+from core.utils.logger import set_log_level
+from core.config.config_manager import write_config_file
+
+# Directories already created for log files, so they aren't created again on every open
+_LOGS_DIR_ENSURED = set()
+
+def _ensure_dir(dir_path):
+    """Create a directory if needed, only once per directory."""
+    if dir_path not in _LOGS_DIR_ENSURED:
+        os.makedirs(dir_path, exist_ok=True)
+        _LOGS_DIR_ENSURED.add(dir_path)
 
 def show_global_preferences(parent, config, base_dir):
     """
@@ -24,60 +37,51 @@ def show_global_preferences(parent, config, base_dir):
     # Load the UI file
     ui_path = os.path.join(base_dir, "gui", "dialogs", "global_preferences_window.ui")
     
-    loader = QtUiTools.QUiLoader()
-    ui_file = QtCore.QFile(ui_path)
-    ui_file.open(QtCore.QFile.ReadOnly)
-    
     # Create the dialog
-    preferences_dialog = loader.load(ui_file, parent)
-    ui_file.close()
+    preferences_dialog = load_ui_cached(ui_path, parent)
     
     # Set dialog properties
     preferences_dialog.setWindowTitle("Global Preferences")
     
     # Set window icon from application config
     icon_path = os.path.join(base_dir, "res", config.get("app_icon", "image_tea.ico"))
-    if os.path.exists(icon_path):
-        preferences_dialog.setWindowIcon(QIcon(icon_path))
+    app_icon = get_icon(icon_path)
+    if app_icon is not None:
+        preferences_dialog.setWindowIcon(app_icon)
+    
+    # Look up the log setting widgets once; any of them may be missing from the UI file
+    widgets = get_preference_widgets(preferences_dialog)
     
     # Connect browse button for log location
-    if hasattr(preferences_dialog, 'logBrowseButton'):
-        preferences_dialog.logBrowseButton.clicked.connect(
-            lambda: browse_log_path(preferences_dialog, base_dir)
+    browse_button = getattr(preferences_dialog, 'logBrowseButton', None)
+    if browse_button is not None:
+        browse_button.clicked.connect(
+            lambda: browse_log_path(preferences_dialog, widgets, base_dir)
         )
     
     # Load current log settings
-    load_debug_log_settings(preferences_dialog, config, base_dir)
+    load_debug_log_settings(widgets, config, base_dir)
     
     # Configure buttons
-    if hasattr(preferences_dialog, 'pushButton'):
-        preferences_dialog.pushButton.setText("Reset Default")
-        preferences_dialog.pushButton.clicked.connect(
-            lambda: reset_to_defaults(preferences_dialog, base_dir)
+    reset_button = getattr(preferences_dialog, 'pushButton', None)
+    if reset_button is not None:
+        reset_button.setText("Reset Default")
+        reset_button.clicked.connect(
+            lambda: reset_to_defaults(widgets, base_dir)
         )
     
-    if hasattr(preferences_dialog, 'pushButton_3'):
-        preferences_dialog.pushButton_3.setText("Cancel")
-        preferences_dialog.pushButton_3.clicked.connect(preferences_dialog.reject)
+    cancel_button = getattr(preferences_dialog, 'pushButton_3', None)
+    if cancel_button is not None:
+        cancel_button.setText("Cancel")
+        cancel_button.clicked.connect(preferences_dialog.reject)
     
-    if hasattr(preferences_dialog, 'pushButton_2'):
-        preferences_dialog.pushButton_2.setText("Save")
-        preferences_dialog.pushButton_2.clicked.connect(
-            lambda: save_preferences(preferences_dialog, config, base_dir)
+    save_button = getattr(preferences_dialog, 'pushButton_2', None)
+    if save_button is not None:
+        save_button.setText("Save")
+        save_button.clicked.connect(
+            lambda: save_preferences(preferences_dialog, widgets, config, base_dir)
         )
     
-    # Add enableLoggingCheckBox if it exists
-    if hasattr(preferences_dialog, 'enableLoggingCheckBox'):
-        enabled = config.get("logging", {}).get("enabled", True)
-        preferences_dialog.enableLoggingCheckBox.setChecked(enabled)
-    
-    # Add log level combo box if it exists
-    if hasattr(preferences_dialog, 'logLevelComboBox'):
-        level = config.get("logging", {}).get("level", "INFO")
-        index = preferences_dialog.logLevelComboBox.findText(level)
-        if index >= 0:
-            preferences_dialog.logLevelComboBox.setCurrentIndex(index)
-    
     # Center the dialog on screen
     center_window(preferences_dialog)
     
@@ -90,24 +94,43 @@ def show_global_preferences(parent, config, base_dir):
     else:
         logging.debug("Preferences canceled")  # Change to debug level
 
-def browse_log_path(dialog, base_dir):
+def get_preference_widgets(dialog):
+    """
+    Collect the log setting widgets of the preferences dialog.
+    
+    Args:
+        dialog: The preferences dialog
+        
+    Returns:
+        SimpleNamespace: The widgets, None for any widget the UI file doesn't define
+    """
+    return SimpleNamespace(
+        log_location=getattr(dialog, 'logLocationInput', None),
+        max_size=getattr(dialog, 'maxLogSizeSpinBox', None),
+        max_count=getattr(dialog, 'maxLogCountSpinBox', None),
+        enabled=getattr(dialog, 'enableLoggingCheckBox', None),
+        level=getattr(dialog, 'logLevelComboBox', None),
+    )
+
+def browse_log_path(dialog, widgets, base_dir):
     """
     Open a file dialog to select log file location.
     
     Args:
         dialog: The preferences dialog
+        widgets: The log setting widgets from get_preference_widgets
         base_dir: Base directory path for the application
     """
-    if not hasattr(dialog, 'logLocationInput'):
+    if widgets.log_location is None:
         return
         
     # Get the current path or default to logs directory in base dir
-    current_path = dialog.logLocationInput.text() or os.path.join(base_dir, "logs")
+    current_path = widgets.log_location.text() or os.path.join(base_dir, "logs")
     
     # Make sure parent directory exists
     parent_dir = os.path.dirname(current_path)
     if parent_dir:
-        os.makedirs(parent_dir, exist_ok=True)
+        _ensure_dir(parent_dir)
     
     # Open file dialog to select a log file
     file_path, _ = QtWidgets.QFileDialog.getSaveFileName(
@@ -119,7 +142,7 @@ def browse_log_path(dialog, base_dir):
     
     # If a file was selected, update the line edit with the path
     if file_path:
-        dialog.logLocationInput.setText(file_path)
+        widgets.log_location.setText(file_path)
         logging.debug(f"Log file location set to: {file_path}")
 
 def get_default_log_path(base_dir):
@@ -134,17 +157,17 @@ def get_default_log_path(base_dir):
     """
     # Create logs directory in the base directory
     logs_dir = os.path.join(base_dir, "logs")
-    os.makedirs(logs_dir, exist_ok=True)
+    _ensure_dir(logs_dir)
     
     # Return default log file path
     return os.path.join(logs_dir, "image_tea_debug.log")
 
-def load_debug_log_settings(dialog, config, base_dir):
+def load_debug_log_settings(widgets, config, base_dir):
     """
     Load debug log settings from config into the dialog.
     
     Args:
-        dialog: The preferences dialog
+        widgets: The log setting widgets from get_preference_widgets
         config: Application configuration dictionary
         base_dir: Base directory path for the application
     """
@@ -152,75 +175,76 @@ def load_debug_log_settings(dialog, config, base_dir):
     log_config = config.get("logging", {})
     
     # Set log location
-    if hasattr(dialog, 'logLocationInput'):
+    if widgets.log_location is not None:
         default_log_path = get_default_log_path(base_dir)
         log_path = log_config.get("path", default_log_path)
         # Make path absolute if it's relative
         if not os.path.isabs(log_path):
             log_path = os.path.join(base_dir, log_path)
-        dialog.logLocationInput.setText(log_path)
+        widgets.log_location.setText(log_path)
     
     # Set max log size
-    if hasattr(dialog, 'maxLogSizeSpinBox'):
+    if widgets.max_size is not None:
         max_size = log_config.get("max_size_mb", 10)
-        dialog.maxLogSizeSpinBox.setValue(max_size)
+        widgets.max_size.setValue(max_size)
     
     # Set max log count
-    if hasattr(dialog, 'maxLogCountSpinBox'):
+    if widgets.max_count is not None:
         max_count = log_config.get("max_count", 5)
-        dialog.maxLogCountSpinBox.setValue(max_count)
+        widgets.max_count.setValue(max_count)
     
     # Set logging enabled
-    if hasattr(dialog, 'enableLoggingCheckBox'):
+    if widgets.enabled is not None:
         enabled = log_config.get("enabled", True)
-        dialog.enableLoggingCheckBox.setChecked(enabled)
+        widgets.enabled.setChecked(enabled)
     
     # Set log level
-    if hasattr(dialog, 'logLevelComboBox'):
+    if widgets.level is not None:
         level = log_config.get("level", "INFO")
-        index = dialog.logLevelComboBox.findText(level)
+        index = widgets.level.findText(level)
         if index >= 0:
-            dialog.logLevelComboBox.setCurrentIndex(index)
+            widgets.level.setCurrentIndex(index)
 
-def reset_to_defaults(dialog, base_dir):
+def reset_to_defaults(widgets, base_dir):
     """
     Reset the dialog settings to default values.
     
     Args:
-        dialog: The preferences dialog
+        widgets: The log setting widgets from get_preference_widgets
         base_dir: Base directory path for the application
     """
     logging.debug("Resetting preferences to defaults")
     
     # Reset log location
-    if hasattr(dialog, 'logLocationInput'):
+    if widgets.log_location is not None:
         default_log_path = get_default_log_path(base_dir)
-        dialog.logLocationInput.setText(default_log_path)
+        widgets.log_location.setText(default_log_path)
     
     # Reset max log size
-    if hasattr(dialog, 'maxLogSizeSpinBox'):
-        dialog.maxLogSizeSpinBox.setValue(10)
+    if widgets.max_size is not None:
+        widgets.max_size.setValue(10)
     
     # Reset max log count
-    if hasattr(dialog, 'maxLogCountSpinBox'):
-        dialog.maxLogCountSpinBox.setValue(5)
+    if widgets.max_count is not None:
+        widgets.max_count.setValue(5)
     
     # Reset logging enabled
-    if hasattr(dialog, 'enableLoggingCheckBox'):
-        dialog.enableLoggingCheckBox.setChecked(True)
+    if widgets.enabled is not None:
+        widgets.enabled.setChecked(True)
     
     # Reset log level
-    if hasattr(dialog, 'logLevelComboBox'):
-        index = dialog.logLevelComboBox.findText("INFO")
+    if widgets.level is not None:
+        index = widgets.level.findText("INFO")
         if index >= 0:
-            dialog.logLevelComboBox.setCurrentIndex(index)
+            widgets.level.setCurrentIndex(index)
 
-def save_preferences(dialog, config, base_dir):
+def save_preferences(dialog, widgets, config, base_dir):
     """
     Save preferences from the dialog to config.
     
     Args:
         dialog: The preferences dialog
+        widgets: The log setting widgets from get_preference_widgets
         config: Application configuration dictionary
         base_dir: Base directory path for the application
     """
@@ -231,8 +255,8 @@ def save_preferences(dialog, config, base_dir):
         config["logging"] = {}
     
     # Save log settings
-    if hasattr(dialog, 'logLocationInput'):
-        log_path = dialog.logLocationInput.text()
+    if widgets.log_location is not None:
+        log_path = widgets.log_location.text()
         # Convert to relative path if it's inside the base directory
         if log_path.startswith(base_dir):
             rel_path = os.path.relpath(log_path, base_dir)
@@ -243,27 +267,25 @@ def save_preferences(dialog, config, base_dir):
             config["logging"]["path"] = log_path
     
     # Save max log size
-    if hasattr(dialog, 'maxLogSizeSpinBox'):
-        config["logging"]["max_size_mb"] = dialog.maxLogSizeSpinBox.value()
+    if widgets.max_size is not None:
+        config["logging"]["max_size_mb"] = widgets.max_size.value()
     
     # Save max log count
-    if hasattr(dialog, 'maxLogCountSpinBox'):
-        config["logging"]["max_count"] = dialog.maxLogCountSpinBox.value()
+    if widgets.max_count is not None:
+        config["logging"]["max_count"] = widgets.max_count.value()
     
     # Save logging enabled
-    if hasattr(dialog, 'enableLoggingCheckBox'):
-        config["logging"]["enabled"] = dialog.enableLoggingCheckBox.isChecked()
+    if widgets.enabled is not None:
+        config["logging"]["enabled"] = widgets.enabled.isChecked()
     
     # Save log level
-    if hasattr(dialog, 'logLevelComboBox'):
-        config["logging"]["level"] = dialog.logLevelComboBox.currentText()
+    if widgets.level is not None:
+        config["logging"]["level"] = widgets.level.currentText()
+        set_log_level(config["logging"]["level"])
     
     # Save config to file
     try:
-        config_path = os.path.join(base_dir, "config.json")
-        with open(config_path, 'w') as config_file:
-            import json
-            json.dump(config, config_file, indent=4)
+        write_config_file(os.path.join(base_dir, "config.json"), config)
         logging.debug("Config saved successfully")  # Change to debug level
     except Exception as e:
         error_msg = f"Error saving config: {e}"
@@ -0,0 +1,52 @@
+"""
+Helper module for cached icons.
+
+This module keeps one shared QIcon per icon file, so dialogs don't load the
+same icon from disk every time they open, and one shared QIcon per QtAwesome
+icon, so the menu and the status bar don't each build their own copy.
+"""
+
+import os
+from PySide6.QtGui import QIcon
+import qtawesome as qta
+
+# QIcon per absolute icon path, or None if the file doesn't exist
+_ICON_CACHE = {}
+
+# QIcon per (QtAwesome icon name, options)
+_QTA_ICON_CACHE = {}
+
+def get_icon(icon_path):
+    """
+    Get the icon for a file path, loading it only on first use.
+
+    Args:
+        icon_path: Path to the icon file
+
+    Returns:
+        QIcon: The shared icon, or None if the file doesn't exist
+    """
+    icon_path = os.path.abspath(icon_path)
+
+    if icon_path not in _ICON_CACHE:
+        _ICON_CACHE[icon_path] = QIcon(icon_path) if os.path.exists(icon_path) else None
+
+    return _ICON_CACHE[icon_path]
+
+def get_qta_icon(name, **kwargs):
+    """
+    Get a QtAwesome icon, building it only on first use.
+
+    Args:
+        name: The QtAwesome icon name, e.g. 'fa6s.heart'
+        **kwargs: Options passed on to qta.icon, e.g. color
+
+    Returns:
+        QIcon: The shared icon
+    """
+    key = (name, tuple(sorted(kwargs.items())))
+    icon = _QTA_ICON_CACHE.get(key)
+    if icon is None:
+        icon = qta.icon(name, **kwargs)
+        _QTA_ICON_CACHE[key] = icon
+    return icon
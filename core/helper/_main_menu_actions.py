@@ -7,32 +7,127 @@ while maintaining separation of concerns.
 
 from PySide6.QtWidgets import QMainWindow, QStatusBar
 from PySide6 import QtWidgets  # Import QtWidgets as a module, not a class
-from PySide6.QtCore import QObject
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, QMetaObject, Qt, Q_ARG
 import sys
 import os
+from functools import partial
 
-# Import necessary helper modules
-from core.helper.dialogs._about_dialog import show_about_dialog
-from core.helper.dialogs._license_dialog import show_license_dialog
-from core.helper.dialogs._contributors_dialog import show_contributors_dialog
-from core.helper.dialogs._updater_dialog import show_updater_dialog
+# Import necessary helper modules; the dialog modules are imported by their handlers on first use
 from core.helper._url_handler import open_url
-from core.helper.dialogs._donation_dialog import show_donation_dialog
 from core.helper._window_utils import center_window
 from core.utils.logger import log, debug, warning, error, exception
+from core.utils.event_system import EventSystem
 
 # Import the new modules we created
 from core.global_operations.file_operations import (
     select_image_file, select_multiple_image_files,
     select_folder, select_multiple_folders,
-    select_video_file, select_multiple_video_files,
-    get_image_extensions, get_video_extensions
+    select_video_file, select_multiple_video_files
 )
 from database.db_project_files import ProjectFilesModel
 
+# File dialog per (file kind, multiple selection) used by the open file handlers
+_FILE_SELECTORS = {
+    ("image", False): select_image_file,
+    ("image", True): select_multiple_image_files,
+    ("video", False): select_video_file,
+    ("video", True): select_multiple_video_files,
+}
+
+# Article used in status messages for a single file of each kind
+_FILE_KIND_ARTICLES = {"image": "an", "video": "a"}
+
+# Menu actions that start a folder scan, disabled while one is running
+_FOLDER_SCAN_ACTIONS = ('actionOpen_Folder', 'actionOpen_Multiple_Folders')
+
+class _FolderScanSignals(QObject):
+    """Signals used by a folder scan to report back to the UI thread."""
+    finished = Signal(object)  # The finished _FolderScanRunnable
+
+class _FolderScanRunnable(QRunnable):
+    """Runs a project_files_model folder scan on the global thread pool."""
+    
+    def __init__(self, scan, folders, on_done):
+        """Initialize the folder scan.
+        
+        Args:
+            scan: The scan function, called with folders and publish_event=False
+            folders: Folder path or list of folder paths passed to scan
+            on_done: Handler called on the UI thread with (folders, result)
+        """
+        super().__init__()
+        self.scan = scan
+        self.folders = folders
+        self.on_done = on_done
+        self.result = None
+        self.signals = _FolderScanSignals()
+    
+    def run(self):
+        """Run the scan and emit the finished signal."""
+        try:
+            # The data changed event is published from the UI thread once the scan is done
+            self.result = self.scan(self.folders, publish_event=False)
+        except Exception as e:
+            exception(e, f"Error processing folders {self.folders}")
+        self.signals.finished.emit(self)
+
 class MenuActionHandler(QObject):
     """Class that handles menu actions for the main window."""
     
+    # (action attribute, handler method, extra handler arguments) per menu action;
+    # actions missing from the UI file are skipped with a warning
+    _ACTION_BINDINGS = (
+        # File menu
+        ('actionNew', 'handle_new'),
+        ('actionOpen_Image', 'handle_open_image'),
+        ('actionOpen_Multiple_Images', 'handle_open_multiple_images'),
+        ('actionOpen_Folder', 'handle_open_folder'),
+        ('actionOpen_Multiple_Folders', 'handle_open_multiple_folders'),
+        ('actionOpen_Video', 'handle_open_video'),
+        ('actionOpen_Multiple_Videos', 'handle_open_multiple_videos'),
+        ('actionSave_Logs', 'handle_save_logs'),
+        ('actionExport_CSV_Freepik', '_handle_export_csv', 'Freepik'),
+        ('actionExport_CSV_Shutterstock', '_handle_export_csv', 'Shutterstock'),
+        ('actionExport_CSV_Adobe_Stock', '_handle_export_csv', 'Adobe Stock'),
+        ('actionExport_CSV_iStock', '_handle_export_csv', 'iStock'),
+        ('actionQuit', 'handle_quit'),
+        # Edit menu
+        ('actionCut', '_forward_to_focused_widget', 'cut'),
+        ('actionCopy', '_forward_to_focused_widget', 'copy'),
+        ('actionPaste', '_forward_to_focused_widget', 'paste'),
+        ('actionDelete', '_forward_to_focused_widget', 'delete'),
+        ('actionSelect_All', '_forward_to_focused_widget', 'selectAll'),
+        ('actionDeselect_All', 'handle_deselect_all'),
+        ('actionRefresh', 'handle_refresh'),
+        ('actionClear', 'handle_clear'),
+        ('actionRename', 'handle_rename'),
+        ('actionRename_All', 'handle_rename_all'),
+        # View menu
+        ('actionFull_Screen', 'handle_full_screen'),
+        ('actionWindowed', 'handle_windowed'),
+        ('actionCenter', 'handle_center'),
+        ('actionDefault', 'handle_default_layout'),
+        ('actionBatch_Processing', 'handle_batch_processing_layout'),
+        ('actionMetadata_Editing', 'handle_metadata_editing_layout'),
+        ('actionMetadata_Analysis', 'handle_metadata_analysis_layout'),
+        # Settings menu
+        ('actionPreferences', 'handle_preferences'),
+        ('actionGoogle_Gemini', 'handle_google_gemini_settings'),
+        ('actionOpen_AI', 'handle_open_ai_settings'),
+        # Prompt menu
+        ('actionPrompt_Manager', 'handle_prompt_manager'),
+        ('actionAPI_Keys_Manager', 'handle_api_keys_manager'),
+        # Help menu
+        ('actionAbout_2', 'handle_about'),
+        ('actionLicense', 'handle_license'),
+        ('actionContributors', 'handle_contributors'),
+        ('actionWhatsApp_Group', 'handle_whatsapp_group'),
+        ('actionGithub_Repository', 'handle_github_repository'),
+        ('actionReport_Issue', 'handle_report_issue'),
+        ('actionCheck_for_Updates', 'handle_check_for_updates'),
+        ('actionDonate', 'handle_donate'),
+    )
+    
     def __init__(self, main_window, config, base_dir, layout_controller=None):
         """Initialize the menu action handler.
         
@@ -48,103 +143,29 @@ class MenuActionHandler(QObject):
         self.BASE_DIR = base_dir
         self.layout_controller = layout_controller
         self.project_files_model = ProjectFilesModel()
+        
+        # The home directory doesn't change while the app runs, so look it up once
+        # os.path.expanduser('~') works on Windows, macOS, and Linux
+        self._home_dir = os.path.expanduser('~')
+        
+        # The window keeps the same status bar for its lifetime, so fetch it once
+        status_bar = getattr(main_window, 'statusBar', None)
+        self._status_bar = status_bar() if callable(status_bar) else None
+        
+        # Folder scans running on the thread pool, kept referenced until they report back
+        self._folder_scans = set()
     
     def connect_all_actions(self):
         """Connect all menu actions to their respective handlers."""
-        self.connect_file_menu_actions()
-        self.connect_edit_menu_actions()
-        self.connect_view_menu_actions()
-        self.connect_settings_menu_actions()
-        self.connect_prompt_menu_actions()
-        self.connect_help_menu_actions()
-        
-    def connect_file_menu_actions(self):
-        """Connect File menu actions to their handlers."""
-        # Connect File menu actions
-        self.window.actionNew.triggered.connect(self.handle_new)
-        self.window.actionOpen_Image.triggered.connect(self.handle_open_image)
-        self.window.actionOpen_Multiple_Images.triggered.connect(self.handle_open_multiple_images)
-        self.window.actionOpen_Folder.triggered.connect(self.handle_open_folder)
-        self.window.actionOpen_Multiple_Folders.triggered.connect(self.handle_open_multiple_folders)
-        self.window.actionOpen_Video.triggered.connect(self.handle_open_video)
-        self.window.actionOpen_Multiple_Videos.triggered.connect(self.handle_open_multiple_videos)
-        
-        # Connect logs action
-        self.window.actionSave_Logs.triggered.connect(self.handle_save_logs)
-        
-        # Connect export actions
-        self.window.actionExport_CSV_Freepik.triggered.connect(self.handle_export_csv_freepik)
-        self.window.actionExport_CSV_Shutterstock.triggered.connect(self.handle_export_csv_shutterstock)
-        self.window.actionExport_CSV_Adobe_Stock.triggered.connect(self.handle_export_csv_adobe_stock)
-        self.window.actionExport_CSV_iStock.triggered.connect(self.handle_export_csv_istock)
-        
-        # Connect Quit action
-        self.window.actionQuit.triggered.connect(self.handle_quit)
-        
-    def connect_edit_menu_actions(self):
-        """Connect Edit menu actions to their handlers."""
-        # Connect basic edit actions
-        self.window.actionCut.triggered.connect(self.handle_cut)
-        self.window.actionCopy.triggered.connect(self.handle_copy)
-        self.window.actionPaste.triggered.connect(self.handle_paste)
-        self.window.actionDelete.triggered.connect(self.handle_delete)
-        
-        # Connect selection actions
-        self.window.actionSelect_All.triggered.connect(self.handle_select_all)
-        self.window.actionDeselect_All.triggered.connect(self.handle_deselect_all)
-        
-        # Connect other edit actions
-        self.window.actionRefresh.triggered.connect(self.handle_refresh)
-        self.window.actionClear.triggered.connect(self.handle_clear)
-        self.window.actionRename.triggered.connect(self.handle_rename)
-        self.window.actionRename_All.triggered.connect(self.handle_rename_all)
-        
-    def connect_view_menu_actions(self):
-        """Connect View menu actions to their handlers."""
-        # Connect appearance actions
-        self.window.actionFull_Screen.triggered.connect(self.handle_full_screen)
-        self.window.actionWindowed.triggered.connect(self.handle_windowed)
-        self.window.actionCenter.triggered.connect(self.handle_center)
-        
-        # Connect layout actions
-        self.window.actionDefault.triggered.connect(self.handle_default_layout)
-        if hasattr(self.window, 'actionBatch_Processing'):
-            self.window.actionBatch_Processing.triggered.connect(self.handle_batch_processing_layout)
-        if hasattr(self.window, 'actionMetadata_Editing'):
-            self.window.actionMetadata_Editing.triggered.connect(self.handle_metadata_editing_layout)
-        if hasattr(self.window, 'actionMetadata_Analysis'):
-            self.window.actionMetadata_Analysis.triggered.connect(self.handle_metadata_analysis_layout)
-    
-    def connect_settings_menu_actions(self):
-        """Connect Settings menu actions to their handlers.""" 
-        # Connect preferences action
-        self.window.actionPreferences.triggered.connect(self.handle_preferences)
-        
-        # Connect AI settings actions
-        if hasattr(self.window, 'actionGoogle_Gemini'):
-            self.window.actionGoogle_Gemini.triggered.connect(self.handle_google_gemini_settings)
-        if hasattr(self.window, 'actionOpen_AI'):
-            self.window.actionOpen_AI.triggered.connect(self.handle_open_ai_settings)
-    
-    def connect_prompt_menu_actions(self):
-        """Connect Prompt menu actions to their handlers."""
-        # Only connect to Prompt Manager and API Keys Manager
-        if hasattr(self.window, 'actionPrompt_Manager'):
-            self.window.actionPrompt_Manager.triggered.connect(self.handle_prompt_manager)
-        if hasattr(self.window, 'actionAPI_Keys_Manager'):
-            self.window.actionAPI_Keys_Manager.triggered.connect(self.handle_api_keys_manager)
-    
-    def connect_help_menu_actions(self):
-        """Connect Help menu actions to their handlers."""
-        # Connect Help menu actions
-        self.window.actionAbout_2.triggered.connect(self.handle_about)
-        self.window.actionLicense.triggered.connect(self.handle_license)
-        self.window.actionContributors.triggered.connect(self.handle_contributors)
-        self.window.actionWhatsApp_Group.triggered.connect(self.handle_whatsapp_group)
-        self.window.actionGithub_Repository.triggered.connect(self.handle_github_repository)
-        self.window.actionReport_Issue.triggered.connect(self.handle_report_issue)
-        self.window.actionCheck_for_Updates.triggered.connect(self.handle_check_for_updates)
-        self.window.actionDonate.triggered.connect(self.handle_donate)
+        for action_name, handler_name, *handler_args in self._ACTION_BINDINGS:
+            action = getattr(self.window, action_name, None)
+            if action is None:
+                warning(f"Menu action '{action_name}' not found in the UI file, '{handler_name}' is not connected")
+                continue
+            handler = getattr(self, handler_name)
+            if handler_args:
+                handler = partial(handler, *handler_args)
+            action.triggered.connect(handler)
 
     # Updated File menu handlers
     def handle_new(self):
@@ -152,76 +173,73 @@ class MenuActionHandler(QObject):
         log("Creating new project")
         # Implement specific New functionality
         self.show_status_message("Creating new project...")
+    
     def handle_open_image(self):
         """Handle Open Image action."""
-        log("Opening image file dialog")
-        self.show_status_message("Select an image file...")
-        
-        # Get the user's home directory for dialog starting location
-        start_dir = self._get_user_home_directory()
-        
-        # Open file dialog to select an image, starting from the home directory
-        file_details = select_image_file(self.window, start_dir)
-        
-        if file_details:
-            # Get the operation ID that was assigned to this file
-            operation_id = file_details.get('item_id')
-            
-            # Add the file to the database
-            result = self.project_files_model.add_file(file_details)
-            if result:  # result will be the record ID if successful
-                self.show_status_message(f"Opened image: {file_details['filename']} (ID: {result})")
-                log(f"Added image file '{file_details['filename']}' to project with ID: {result}")
-                
-                # Manually trigger refresh on explorer widget
-                if hasattr(self.window, 'explorer_widget') and self.window.explorer_widget:
-                    self.window.explorer_widget.refresh_data()
-                    
-                # Open a tab for this operation, like the drag and drop behavior
-                self._open_tab_for_operation(operation_id)
-            else:
-                self.show_status_message("Failed to add image to project")
-        else:
-            self.show_status_message("No image selected")
+        self._open_files("image", multiple=False)
     
     def handle_open_multiple_images(self):
         """Handle Open Multiple Images action."""
-        log("Opening multiple images file dialog")
-        self.show_status_message("Select image files...")
+        self._open_files("image", multiple=True)
+    
+    def handle_open_video(self):
+        """Handle Open Video action."""
+        self._open_files("video", multiple=False)
+    
+    def handle_open_multiple_videos(self):
+        """Handle Open Multiple Videos action."""
+        self._open_files("video", multiple=True)
+    
+    def _open_files(self, kind, multiple):
+        """Let the user pick image or video files and add them to the project.
+        
+        Args:
+            kind: "image" or "video"
+            multiple: Whether the user can pick several files
+        """
+        article = _FILE_KIND_ARTICLES[kind]
+        if multiple:
+            log(f"Opening multiple {kind}s file dialog")
+            self.show_status_message(f"Select {kind} files...")
+        else:
+            log(f"Opening {kind} file dialog")
+            self.show_status_message(f"Select {article} {kind} file...")
         
         # Get the user's home directory for dialog starting location
         start_dir = self._get_user_home_directory()
         
-        # Open file dialog to select multiple images, starting from the home directory
-        file_details_list = select_multiple_image_files(self.window, start_dir)
+        # Open file dialog to select the files, starting from the home directory
+        selected = _FILE_SELECTORS[kind, multiple](self.window, start_dir)
+        if not selected:
+            self.show_status_message(f"No {kind}s selected" if multiple else f"No {kind} selected")
+            return
         
-        if file_details_list:
+        if multiple:
             # Get the operation ID from the first file (all files in this operation share the same ID)
-            operation_id = file_details_list[0].get('item_id') if file_details_list else None
+            operation_id = selected[0].item_id
             
             # Add the files to the database
-            success_ids = self.project_files_model.add_multiple_files(file_details_list)
-            self.show_status_message(f"Added {len(success_ids)} of {len(file_details_list)} images to project")
-            log(f"Added {len(success_ids)} of {len(file_details_list)} image files to project")
-            
-            # Manually trigger refresh on explorer widget
-            if hasattr(self.window, 'explorer_widget') and self.window.explorer_widget:
-                self.window.explorer_widget.refresh_data()
-                
-            # Open a tab for this operation, like the drag and drop behavior
-            if operation_id:
-                self._open_tab_for_operation(operation_id)
+            success_ids = self.project_files_model.add_multiple_files(selected)
+            self.show_status_message(f"Added {len(success_ids)} of {len(selected)} {kind}s to project")
+            log(f"Added {len(success_ids)} of {len(selected)} {kind} files to project")
         else:
-            self.show_status_message("No images selected")
-    
-    def _process_files_in_folder(self, folder_path):
-        """
-        Process all image and video files in a folder and add them to the database.
-        This method has been deprecated. Use project_files_model.process_folder instead.
-        """
-        warning("Using deprecated _process_files_in_folder method")
-        _, processed_count = self.project_files_model.process_folder(folder_path)
-        return processed_count
+            # Get the operation ID that was assigned to this file
+            operation_id = selected.item_id
+            
+            # Add the file to the database
+            result = self.project_files_model.add_file(selected)
+            if not result:  # result will be the record ID if successful
+                self.show_status_message(f"Failed to add {kind} to project")
+                return
+            self.show_status_message(f"Opened {kind}: {selected.filename} (ID: {result})")
+            log(f"Added {kind} file '{selected.filename}' to project with ID: {result}")
+        
+        # Refresh the explorer once control returns to the event loop
+        self._schedule_explorer_refresh()
+            
+        # Open a tab for this operation, like the drag and drop behavior
+        if operation_id:
+            self._open_tab_for_operation(operation_id)
     
     def _get_user_home_directory(self):
         """
@@ -230,11 +248,14 @@ class MenuActionHandler(QObject):
         Returns:
             str: Path to the user's home directory
         """
-        # os.path.expanduser('~') works on Windows, macOS, and Linux
-        return os.path.expanduser('~')
+        return self._home_dir
     
     def handle_open_folder(self):
         """Handle Open Folder action."""
+        if self._folder_scans:
+            self.show_status_message("Still processing folders, please wait...")
+            return
+        
         log("Opening folder dialog")
         self.show_status_message("Select a folder...")
         
@@ -243,28 +264,45 @@ class MenuActionHandler(QObject):
         
         # Open dialog to select a folder
         folder_path = select_folder(self.window, start_dir)
-        if folder_path and os.path.isdir(folder_path):
-            # Process the folder using the database model (no folder details needed)
-            result, processed_files = self.project_files_model.process_folder(folder_path)
+        # getExistingDirectory only returns existing directories, so no isdir check is needed
+        if folder_path:
+            # Process the folder using the database model on a worker thread, so the window stays responsive
+            self.show_status_message(f"Processing folder: {os.path.basename(folder_path)}...", 0)
+            self._start_folder_scan(
+                self.project_files_model.process_folder, folder_path, self._on_folder_processed
+            )
+        else:
+            self.show_status_message("No folder selected")
+    
+    def _on_folder_processed(self, folder_path, scan_result):
+        """Report the result of a single folder scan, called on the UI thread.
+        
+        Args:
+            folder_path: The scanned folder
+            scan_result: (dict, processed_count) from process_folder, or None if it failed
+        """
+        result, processed_files = scan_result if scan_result else ({}, 0)
+        
+        if processed_files > 0:
+            EventSystem.publish('project_data_changed')
+            self.show_status_message(f"Processed folder: {os.path.basename(folder_path)} - Added {processed_files} files to project")
+            log(f"Added {processed_files} files from folder '{os.path.basename(folder_path)}' to project")
             
-            if processed_files > 0:
-                self.show_status_message(f"Processed folder: {os.path.basename(folder_path)} - Added {processed_files} files to project")
-                log(f"Added {processed_files} files from folder '{os.path.basename(folder_path)}' to project")
+            # Refresh the explorer once control returns to the event loop
+            self._schedule_explorer_refresh()
                 
-                # Manually trigger refresh on explorer widget
-                if hasattr(self.window, 'explorer_widget') and self.window.explorer_widget:
-                    self.window.explorer_widget.refresh_data()
-                    
-                # Open a tab for this operation if we have a valid result with item_id
-                if result and isinstance(result, dict) and 'item_id' in result:
-                    self._open_tab_for_operation(result['item_id'])
-            else:
-                self.show_status_message(f"No compatible files found in folder: {os.path.basename(folder_path)}")
+            # Open a tab for this operation if we have a valid result with item_id
+            if result and isinstance(result, dict) and 'item_id' in result:
+                self._open_tab_for_operation(result['item_id'])
         else:
-            self.show_status_message("No folder selected")
+            self.show_status_message(f"No compatible files found in folder: {os.path.basename(folder_path)}")
     
     def handle_open_multiple_folders(self):
         """Handle Open Multiple Folders action."""
+        if self._folder_scans:
+            self.show_status_message("Still processing folders, please wait...")
+            return
+        
         log("Opening multiple folders dialog")
         self.show_status_message("Select folders...")
         
@@ -274,87 +312,37 @@ class MenuActionHandler(QObject):
         # Open dialog to select multiple folders
         folder_paths = select_multiple_folders(self.window, start_dir)
         if folder_paths:
-            # Process all folders using the database model
-            results = self.project_files_model.process_multiple_folders(folder_paths)
-            
-            if results['total_files'] > 0:
-                self.show_status_message(f"Processed {results['total_folders']} folders - Added {results['total_files']} files to project")
-                log(f"Added {results['total_files']} files from {results['total_folders']} folders to project")
-                
-                # Manually trigger refresh on explorer widget
-                if hasattr(self.window, 'explorer_widget') and self.window.explorer_widget:
-                    self.window.explorer_widget.refresh_data()
-                    
-                # Open tabs for processed folders if we have item_ids
-                if 'item_ids' in results and results['item_ids']:
-                    # Just open the first one for simplicity
-                    first_item_id = results['item_ids'][0] if results['item_ids'] else None
-                    if first_item_id:
-                        self._open_tab_for_operation(first_item_id)
-            else:
-                self.show_status_message(f"No compatible files found in selected folders")
+            # Process all folders using the database model on a worker thread
+            self.show_status_message(f"Processing {len(folder_paths)} folders...", 0)
+            self._start_folder_scan(
+                self.project_files_model.process_multiple_folders, folder_paths, self._on_folders_processed
+            )
         else:
             self.show_status_message("No folders selected")
     
-    def handle_open_video(self):
-        """Handle Open Video action."""
-        log("Opening video file dialog")
-        self.show_status_message("Select a video file...")
-        
-        # Get the user's home directory for dialog starting location
-        start_dir = self._get_user_home_directory()
+    def _on_folders_processed(self, folder_paths, results):
+        """Report the result of a multiple folder scan, called on the UI thread.
         
-        # Open file dialog to select a video, starting from the home directory
-        file_details = select_video_file(self.window, start_dir)
-        if file_details:
-            # Get the operation ID that was assigned to this file
-            operation_id = file_details.get('item_id')
-            
-            # Add the file to the database
-            result = self.project_files_model.add_file(file_details)
-            if result:  # result will be the record ID if successful
-                self.show_status_message(f"Opened video: {file_details['filename']} (ID: {result})")
-                log(f"Added video file '{file_details['filename']}' to project with ID: {result}")
-                
-                # Manually trigger refresh on explorer widget
-                if hasattr(self.window, 'explorer_widget') and self.window.explorer_widget:
-                    self.window.explorer_widget.refresh_data()
-                    
-                # Open a tab for this operation, like the drag and drop behavior
-                self._open_tab_for_operation(operation_id)
-            else:
-                self.show_status_message("Failed to add video to project")
-        else:
-            self.show_status_message("No video selected")
-    
-    def handle_open_multiple_videos(self):
-        """Handle Open Multiple Videos action."""
-        log("Opening multiple videos file dialog")
-        self.show_status_message("Select video files...")
-        
-        # Get the user's home directory for dialog starting location
-        start_dir = self._get_user_home_directory()
-        
-        # Open file dialog to select multiple videos, starting from the home directory
-        file_details_list = select_multiple_video_files(self.window, start_dir)
-        if file_details_list:
-            # Get the operation ID from the first file (all files in this operation share the same ID)
-            operation_id = file_details_list[0].get('item_id') if file_details_list else None
-            
-            # Add the files to the database
-            success_ids = self.project_files_model.add_multiple_files(file_details_list)
-            self.show_status_message(f"Added {len(success_ids)} of {len(file_details_list)} videos to project")
-            log(f"Added {len(success_ids)} of {len(file_details_list)} video files to project")
+        Args:
+            folder_paths: The scanned folders
+            results: Summary dict from process_multiple_folders, or None if it failed
+        """
+        if results and results['total_files'] > 0:
+            EventSystem.publish('project_data_changed')
+            self.show_status_message(f"Processed {results['total_folders']} folders - Added {results['total_files']} files to project")
+            log(f"Added {results['total_files']} files from {results['total_folders']} folders to project")
             
-            # Manually trigger refresh on explorer widget
-            if hasattr(self.window, 'explorer_widget') and self.window.explorer_widget:
-                self.window.explorer_widget.refresh_data()
+            # Refresh the explorer once control returns to the event loop
+            self._schedule_explorer_refresh()
                 
-            # Open a tab for this operation, like the drag and drop behavior
-            if operation_id:
-                self._open_tab_for_operation(operation_id)
+            # Open tabs for processed folders if we have item_ids
+            if 'item_ids' in results and results['item_ids']:
+                # Just open the first one for simplicity
+                first_item_id = results['item_ids'][0] if results['item_ids'] else None
+                if first_item_id:
+                    self._open_tab_for_operation(first_item_id)
         else:
-            self.show_status_message("No videos selected")
+            self.show_status_message(f"No compatible files found in selected folders")
     
     def handle_save_logs(self):
         """Handle Save Logs action."""
@@ -375,29 +363,17 @@ class MenuActionHandler(QObject):
             warning("Could not find output logs widget")
             self.show_status_message("Could not find output logs widget")
     
-    def handle_export_csv_freepik(self):
-        """Handle Export CSV Freepik action."""
-        log("Exporting CSV for Freepik")
-        # Implement specific Export CSV Freepik functionality
-        self.show_status_message("Exporting CSV for Freepik...")
-    
-    def handle_export_csv_shutterstock(self):
-        """Handle Export CSV Shutterstock action."""
-        log("Exporting CSV for Shutterstock")
-        # Implement specific Export CSV Shutterstock functionality
-        self.show_status_message("Exporting CSV for Shutterstock...")
-    
-    def handle_export_csv_adobe_stock(self):
-        """Handle Export CSV Adobe Stock action."""
-        log("Exporting CSV for Adobe Stock")
-        # Implement specific Export CSV Adobe Stock functionality
-        self.show_status_message("Exporting CSV for Adobe Stock...")
-    
-    def handle_export_csv_istock(self):
-        """Handle Export CSV iStock action."""
-        log("Exporting CSV for iStock")
-        # Implement specific Export CSV iStock functionality
-        self.show_status_message("Exporting CSV for iStock...")
+    def _handle_export_csv(self, platform, checked=False):
+        """Handle the Export CSV actions.
+        
+        The unused checked argument absorbs the value passed by QAction.triggered.
+        
+        Args:
+            platform: Name of the stock platform to export for, e.g. "Freepik"
+        """
+        log(f"Exporting CSV for {platform}")
+        # Implement specific Export CSV functionality per platform
+        self.show_status_message(f"Exporting CSV for {platform}...")
     
     def handle_quit(self):
         """Handle Quit action."""
@@ -406,50 +382,22 @@ class MenuActionHandler(QObject):
         self.window.close()
 
     # Edit menu handlers
-    def handle_cut(self):
-        """Handle Cut action.""" 
-        # This needs to be connected to the currently focused widget
-        try:
-            focused_widget = self.window.focusWidget()
-            if hasattr(focused_widget, "cut"):
-                focused_widget.cut()
-        except Exception as e:
-            warning(f"Clipboard operation failed: {e}")
-    
-    def handle_copy(self):
-        """Handle Copy action."""
+    def _forward_to_focused_widget(self, method_name, checked=False):
+        """Call a method such as cut or paste on the focused widget, if it has one.
+        
+        The unused checked argument absorbs the value passed by QAction.triggered.
+        
+        Args:
+            method_name: Name of the method to call on the focused widget
+        """
         # This needs to be connected to the currently focused widget
         try:
-            focused_widget = self.window.focusWidget()
-            if hasattr(focused_widget, "copy"):
-                focused_widget.copy()
+            method = getattr(self.window.focusWidget(), method_name, None)
+            if method is not None:
+                method()
         except Exception as e:
             # Handle clipboard errors gracefully
-            warning(f"Clipboard operation failed: {e}")
-    
-    def handle_paste(self):
-        """Handle Paste action."""
-        # This needs to be connected to the currently focused widget
-        try:
-            focused_widget = self.window.focusWidget()
-            if hasattr(focused_widget, "paste"):
-                focused_widget.paste()
-        except Exception as e:
-            warning(f"Clipboard operation failed: {e}")
-    
-    def handle_delete(self):
-        """Handle Delete action."""
-        # This needs to be connected to the currently focused widget
-        focused_widget = self.window.focusWidget()
-        if hasattr(focused_widget, "delete"):
-            focused_widget.delete()
-    
-    def handle_select_all(self):
-        """Handle Select All action."""
-        # This needs to be connected to the currently focused widget
-        focused_widget = self.window.focusWidget()
-        if hasattr(focused_widget, "selectAll"):
-            focused_widget.selectAll()
+            warning(f"{method_name} on focused widget failed: {e}")
     
     def handle_deselect_all(self):
         """Handle Deselect All action."""
@@ -462,15 +410,12 @@ class MenuActionHandler(QObject):
         log("Refreshing view")
         self.show_status_message("Refreshing view...")
         
-        # Refresh explorer widget if it exists
-        if hasattr(self.window, 'explorer_widget') and self.window.explorer_widget:
-            self.window.explorer_widget.refresh_data()
+        # Refresh the explorer once control returns to the event loop
+        self._schedule_explorer_refresh()
     
     def handle_clear(self):
         """Handle Clear action."""
-        focused_widget = self.window.focusWidget()
-        if hasattr(focused_widget, "clear"):
-            focused_widget.clear()
+        self._forward_to_focused_widget("clear")
         self.show_status_message("Cleared content")
     
     def handle_rename(self):
@@ -587,14 +532,17 @@ class MenuActionHandler(QObject):
     # Help menu handlers  
     def handle_about(self):
         """Handle About action."""
+        from core.helper.dialogs._about_dialog import show_about_dialog
         show_about_dialog(self.window, self.config, self.BASE_DIR)
     
     def handle_license(self):
         """Handle License action."""
+        from core.helper.dialogs._license_dialog import show_license_dialog
         show_license_dialog(self.window, self.config, self.BASE_DIR)
     
     def handle_contributors(self):
         """Handle Contributors action."""
+        from core.helper.dialogs._contributors_dialog import show_contributors_dialog
         show_contributors_dialog(self.window, self.config, self.BASE_DIR)
     
     def handle_whatsapp_group(self):
@@ -627,13 +575,61 @@ class MenuActionHandler(QObject):
     def handle_check_for_updates(self):
         """Handle Check for Updates action."""
         log("Checking for updates...")
+        from core.helper.dialogs._updater_dialog import show_updater_dialog
         show_updater_dialog(self.window, self.config, self.BASE_DIR)
     
     def handle_donate(self):
         """Handle Donate action."""
+        from core.helper.dialogs._donation_dialog import show_donation_dialog
         show_donation_dialog(self.window, self.config, self.BASE_DIR)
     
     # Utility methods
+    def _start_folder_scan(self, scan, folders, on_done):
+        """Run a folder scan on the global thread pool and hand its result to on_done.
+        
+        Args:
+            scan: process_folder or process_multiple_folders of the project files model
+            folders: Folder path or list of folder paths to scan
+            on_done: Handler method called on the UI thread with (folders, result)
+        """
+        runnable = _FolderScanRunnable(scan, folders, on_done)
+        # Keep the runnable alive until it reports back instead of letting the pool delete it
+        runnable.setAutoDelete(False)
+        self._folder_scans.add(runnable)
+        self._set_folder_scan_actions_enabled(False)
+        
+        # This handler lives on the UI thread, so the finished signal is queued to it
+        runnable.signals.finished.connect(self._on_folder_scan_finished)
+        QThreadPool.globalInstance().start(runnable)
+    
+    def _on_folder_scan_finished(self, runnable):
+        """Hand a finished folder scan's result to its handler.
+        
+        Args:
+            runnable: The finished _FolderScanRunnable
+        """
+        self._folder_scans.discard(runnable)
+        if not self._folder_scans:
+            self._set_folder_scan_actions_enabled(True)
+        runnable.on_done(runnable.folders, runnable.result)
+    
+    def _set_folder_scan_actions_enabled(self, enabled):
+        """Enable or disable the menu actions that start a folder scan.
+        
+        Args:
+            enabled: Whether the actions can be triggered
+        """
+        for action_name in _FOLDER_SCAN_ACTIONS:
+            action = getattr(self.window, action_name, None)
+            if action is not None:
+                action.setEnabled(enabled)
+    
+    def _schedule_explorer_refresh(self):
+        """Refresh the explorer on the next event loop pass, merging requests made before then."""
+        explorer_widget = getattr(self.window, 'explorer_widget', None)
+        if explorer_widget:
+            explorer_widget.debounced_refresh_data(0)
+    
     def show_status_message(self, message, timeout=3000):
         """Show a message in the status bar.
         
@@ -641,9 +637,16 @@ class MenuActionHandler(QObject):
             message: The message to show
             timeout: The timeout in milliseconds (default: 3000)
         """
-        status_bar = getattr(self.window, 'statusBar', None)
-        if status_bar and callable(status_bar):
-            status_bar().showMessage(message, timeout)
+        if self._status_bar is not None:
+            # Queue the update; showMessage repaints the message area immediately, which would
+            # otherwise stall the handler that reported the status
+            QMetaObject.invokeMethod(
+                self._status_bar,
+                "showMessage",
+                Qt.ConnectionType.QueuedConnection,
+                Q_ARG(str, message),
+                Q_ARG(int, timeout)
+            )
     def _open_tab_for_operation(self, operation_id):
         """Open a new tab for an operation ID, similar to drag and drop behavior.
         
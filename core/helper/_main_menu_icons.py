@@ -5,7 +5,7 @@ This module keeps the icon definitions separate from the controller logic,
 making the code more maintainable and easier to update.
 """
 
-import qtawesome as qta
+from core.helper._icon_cache import get_qta_icon
 
 def apply_icons(window):
     """
@@ -34,65 +34,65 @@ def apply_icons(window):
 
 def _apply_file_menu_icons(window):
     """Apply icons to File menu actions."""
-    window.actionNew.setIcon(qta.icon('fa6s.file'))
-    window.actionOpen_Image.setIcon(qta.icon('fa6s.image'))
-    window.actionOpen_Multiple_Images.setIcon(qta.icon('fa6s.images'))
-    window.actionOpen_Folder.setIcon(qta.icon('fa6s.folder-open'))
-    window.actionOpen_Multiple_Folders.setIcon(qta.icon('fa6s.folder-tree'))
-    window.actionOpen_Video.setIcon(qta.icon('fa6s.video'))
-    window.actionOpen_Multiple_Videos.setIcon(qta.icon('fa6s.film'))
-    window.actionQuit.setIcon(qta.icon('fa6s.right-from-bracket'))
+    window.actionNew.setIcon(get_qta_icon('fa6s.file'))
+    window.actionOpen_Image.setIcon(get_qta_icon('fa6s.image'))
+    window.actionOpen_Multiple_Images.setIcon(get_qta_icon('fa6s.images'))
+    window.actionOpen_Folder.setIcon(get_qta_icon('fa6s.folder-open'))
+    window.actionOpen_Multiple_Folders.setIcon(get_qta_icon('fa6s.folder-tree'))
+    window.actionOpen_Video.setIcon(get_qta_icon('fa6s.video'))
+    window.actionOpen_Multiple_Videos.setIcon(get_qta_icon('fa6s.film'))
+    window.actionQuit.setIcon(get_qta_icon('fa6s.right-from-bracket'))
     
     # Export actions
-    window.actionExport_CSV_Freepik.setIcon(qta.icon('fa6s.file-export'))
-    window.actionExport_CSV_Shutterstock.setIcon(qta.icon('fa6s.file-export'))
-    window.actionExport_CSV_Adobe_Stock.setIcon(qta.icon('fa6s.file-export'))
-    window.actionExport_CSV_iStock.setIcon(qta.icon('fa6s.file-export'))
+    window.actionExport_CSV_Freepik.setIcon(get_qta_icon('fa6s.file-export'))
+    window.actionExport_CSV_Shutterstock.setIcon(get_qta_icon('fa6s.file-export'))
+    window.actionExport_CSV_Adobe_Stock.setIcon(get_qta_icon('fa6s.file-export'))
+    window.actionExport_CSV_iStock.setIcon(get_qta_icon('fa6s.file-export'))
 
 def _apply_edit_menu_icons(window):
     """Apply icons to Edit menu actions."""
-    window.actionCut.setIcon(qta.icon('fa6s.scissors'))
-    window.actionCopy.setIcon(qta.icon('fa6s.copy'))
-    window.actionPaste.setIcon(qta.icon('fa6s.paste'))
-    window.actionDelete.setIcon(qta.icon('fa6s.trash'))
-    window.actionSelect_All.setIcon(qta.icon('fa6s.check-double'))
-    window.actionDeselect_All.setIcon(qta.icon('fa6s.xmark'))
-    window.actionRefresh.setIcon(qta.icon('fa6s.arrows-rotate'))
-    window.actionClear.setIcon(qta.icon('fa6s.broom'))
-    window.actionRename.setIcon(qta.icon('fa6s.pen-to-square'))
-    window.actionRename_All.setIcon(qta.icon('fa6s.pen-clip'))
+    window.actionCut.setIcon(get_qta_icon('fa6s.scissors'))
+    window.actionCopy.setIcon(get_qta_icon('fa6s.copy'))
+    window.actionPaste.setIcon(get_qta_icon('fa6s.paste'))
+    window.actionDelete.setIcon(get_qta_icon('fa6s.trash'))
+    window.actionSelect_All.setIcon(get_qta_icon('fa6s.check-double'))
+    window.actionDeselect_All.setIcon(get_qta_icon('fa6s.xmark'))
+    window.actionRefresh.setIcon(get_qta_icon('fa6s.arrows-rotate'))
+    window.actionClear.setIcon(get_qta_icon('fa6s.broom'))
+    window.actionRename.setIcon(get_qta_icon('fa6s.pen-to-square'))
+    window.actionRename_All.setIcon(get_qta_icon('fa6s.pen-clip'))
 
 def _apply_view_menu_icons(window):
     """Apply icons to View menu actions."""
     # Appearance submenu
-    window.actionFull_Screen.setIcon(qta.icon('fa6s.expand'))
-    window.actionWindowed.setIcon(qta.icon('fa6s.compress'))
-    window.actionCenter.setIcon(qta.icon('fa6s.crosshairs'))
+    window.actionFull_Screen.setIcon(get_qta_icon('fa6s.expand'))
+    window.actionWindowed.setIcon(get_qta_icon('fa6s.compress'))
+    window.actionCenter.setIcon(get_qta_icon('fa6s.crosshairs'))
     
     # Layout submenu
-    window.actionDefault.setIcon(qta.icon('fa6s.table-cells'))
-    window.actionBatch_Processing.setIcon(qta.icon('fa6s.table-list'))
-    window.actionMetadata_Editing.setIcon(qta.icon('fa6s.file-pen'))
-    window.actionMetadata_Analysis.setIcon(qta.icon('fa6s.chart-column'))
+    window.actionDefault.setIcon(get_qta_icon('fa6s.table-cells'))
+    window.actionBatch_Processing.setIcon(get_qta_icon('fa6s.table-list'))
+    window.actionMetadata_Editing.setIcon(get_qta_icon('fa6s.file-pen'))
+    window.actionMetadata_Analysis.setIcon(get_qta_icon('fa6s.chart-column'))
 
 def _apply_settings_menu_icons(window):
     """Apply icons to Settings menu actions."""
-    window.actionPreferences.setIcon(qta.icon('fa6s.gear'))
-    window.actionGoogle_Gemini.setIcon(qta.icon('fa6s.star'))
-    window.actionOpen_AI.setIcon(qta.icon('fa6s.brain'))
+    window.actionPreferences.setIcon(get_qta_icon('fa6s.gear'))
+    window.actionGoogle_Gemini.setIcon(get_qta_icon('fa6s.star'))
+    window.actionOpen_AI.setIcon(get_qta_icon('fa6s.brain'))
 
 def _apply_prompt_menu_icons(window):
     """Apply icons to Prompt menu actions."""
-    window.actionPrompt_Manager.setIcon(qta.icon('fa6s.sliders'))
-    window.actionAPI_Keys_Manager.setIcon(qta.icon('fa6s.key'))
+    window.actionPrompt_Manager.setIcon(get_qta_icon('fa6s.sliders'))
+    window.actionAPI_Keys_Manager.setIcon(get_qta_icon('fa6s.key'))
 
 def _apply_help_menu_icons(window):
     """Apply icons to Help menu actions."""
-    window.actionWhatsApp_Group.setIcon(qta.icon('fa6b.whatsapp'))
-    window.actionLicense.setIcon(qta.icon('fa6s.certificate'))
-    window.actionContributors.setIcon(qta.icon('fa6s.users'))
-    window.actionReport_Issue.setIcon(qta.icon('fa6s.bug'))
-    window.actionGithub_Repository.setIcon(qta.icon('fa6b.github'))
-    window.actionCheck_for_Updates.setIcon(qta.icon('fa6s.download'))
-    window.actionDonate.setIcon(qta.icon('fa6s.heart', color='#ff1764'))
-    window.actionAbout_2.setIcon(qta.icon('fa6s.circle-info'))
+    window.actionWhatsApp_Group.setIcon(get_qta_icon('fa6b.whatsapp'))
+    window.actionLicense.setIcon(get_qta_icon('fa6s.certificate'))
+    window.actionContributors.setIcon(get_qta_icon('fa6s.users'))
+    window.actionReport_Issue.setIcon(get_qta_icon('fa6s.bug'))
+    window.actionGithub_Repository.setIcon(get_qta_icon('fa6b.github'))
+    window.actionCheck_for_Updates.setIcon(get_qta_icon('fa6s.download'))
+    window.actionDonate.setIcon(get_qta_icon('fa6s.heart', color='#ff1764'))
+    window.actionAbout_2.setIcon(get_qta_icon('fa6s.circle-info'))
@@ -8,14 +8,12 @@ license, current version, commit hash, and GitHub repository link.
 
 from PySide6.QtWidgets import QPushButton, QLabel, QHBoxLayout, QWidget
 from PySide6.QtCore import Qt
-import qtawesome as qta
+from core.helper._icon_cache import get_qta_icon
 from core.helper._url_handler import open_url
 from core.helper.dialogs._about_dialog import show_about_dialog
 from core.helper.dialogs._license_dialog import show_license_dialog
 # Update import to use the new function
 from core.helper.dialogs._donation_dialog import show_donation_dialog
-from PySide6 import QtUiTools, QtCore
-from core.helper._window_utils import center_window
 
 def setup_status_bar(window, config, base_dir):
     """
@@ -44,7 +42,7 @@ def setup_status_bar(window, config, base_dir):
     if commit_hash and repo_url:
         # Display only first 7 characters of the hash
         short_hash = commit_hash[:7] if len(commit_hash) > 7 else commit_hash
-        commit_icon = qta.icon('fa6s.code-commit')
+        commit_icon = get_qta_icon('fa6s.code-commit')
         commit_btn = QPushButton(commit_icon, f" {short_hash}")
         commit_btn.setFlat(True)
         commit_btn.setToolTip(f"View commit: {commit_hash}")
@@ -56,29 +54,29 @@ def setup_status_bar(window, config, base_dir):
     
     # Add GitHub repository button
     if repo_url:
-        github_btn = create_button(qta.icon('fa6b.github'), "GitHub Repository")
+        github_btn = create_button(get_qta_icon('fa6b.github'), "GitHub Repository")
         github_btn.clicked.connect(lambda: open_url(repo_url))
         layout.addWidget(github_btn)
     
     # Add WhatsApp button
     whatsapp_url = config.get("app_whatsapp", "")
     if whatsapp_url:
-        whatsapp_btn = create_button(qta.icon('fa6b.whatsapp', color='green'), "WhatsApp Group")
+        whatsapp_btn = create_button(get_qta_icon('fa6b.whatsapp', color='green'), "WhatsApp Group")
         whatsapp_btn.clicked.connect(lambda: open_url(whatsapp_url))
         layout.addWidget(whatsapp_btn)
     
     # Add About button
-    about_btn = create_button(qta.icon('fa6s.circle-info'), "About")
+    about_btn = create_button(get_qta_icon('fa6s.circle-info'), "About")
     about_btn.clicked.connect(lambda: show_about_dialog(window, config, base_dir))
     layout.addWidget(about_btn)
     
     # Add License button
-    license_btn = create_button(qta.icon('fa6s.scale-balanced'), "License")
+    license_btn = create_button(get_qta_icon('fa6s.scale-balanced'), "License")
     license_btn.clicked.connect(lambda: show_license_dialog(window, config, base_dir))
     layout.addWidget(license_btn)
     
     # Add Donate button
-    donate_btn = create_button(qta.icon('fa6s.heart', color='#ff1764'), "Donate")
+    donate_btn = create_button(get_qta_icon('fa6s.heart', color='#ff1764'), "Donate")
     donate_btn.clicked.connect(lambda: show_donation_dialog_wrapper(window, config, base_dir))
     layout.addWidget(donate_btn)
     
@@ -92,7 +90,7 @@ def create_button(icon, tooltip):
     Create a flat button for the status bar with an icon.
     
     Args:
-        icon: The QtAwesome icon to use
+        icon: The icon to use
         tooltip: The tooltip text for the button
         
     Returns:
@@ -0,0 +1,69 @@
+"""
+Helper module for loading .ui files with caching.
+
+This module compiles each .ui file once and reuses the generated form class,
+so reopening a dialog doesn't read and parse its XML from disk again.
+"""
+
+import os
+from PySide6 import QtUiTools, QtCore
+from core.utils.logger import warning
+
+# (FormClass, BaseClass) per .ui path, or None if the file could not be compiled
+_UI_CACHE = {}
+
+# Raw .ui file contents per path, for files loaded with QUiLoader instead
+_UI_BYTES = {}
+
+def load_ui_cached(ui_path, parent=None):
+    """
+    Create a widget from a .ui file, compiling the file only on first use.
+
+    The named child widgets and layouts are set as attributes on the returned
+    widget, the same way QUiLoader exposes them.
+
+    Args:
+        ui_path: Path to the .ui file
+        parent: Parent widget for the created widget
+
+    Returns:
+        QWidget: The created widget
+    """
+    ui_path = os.path.abspath(ui_path)
+
+    if ui_path not in _UI_CACHE:
+        try:
+            _UI_CACHE[ui_path] = QtUiTools.loadUiType(ui_path)
+        except Exception as e:
+            # loadUiType needs the uic tool, which packaged builds may not ship
+            warning(f"Could not compile UI file {ui_path}, loading it directly: {e}")
+            _UI_CACHE[ui_path] = None
+
+    ui_type = _UI_CACHE[ui_path]
+    if ui_type is None:
+        return _load_ui_file(ui_path, parent)
+
+    form_class, base_class = ui_type
+    widget = base_class(parent)
+    form = form_class()
+    form.setupUi(widget)
+
+    # Expose the children on the widget itself, like QUiLoader does
+    for name, child in vars(form).items():
+        setattr(widget, name, child)
+
+    return widget
+
+def _load_ui_file(ui_path, parent=None):
+    """Load a .ui file with QUiLoader, reading the file from disk only once."""
+    if ui_path not in _UI_BYTES:
+        with open(ui_path, 'rb') as f:
+            _UI_BYTES[ui_path] = QtCore.QByteArray(f.read())
+
+    loader = QtUiTools.QUiLoader()
+    ui_buffer = QtCore.QBuffer()
+    ui_buffer.setData(_UI_BYTES[ui_path])
+    ui_buffer.open(QtCore.QIODevice.ReadOnly)
+    widget = loader.load(ui_buffer, parent)
+    ui_buffer.close()
+    return widget
@@ -13,9 +13,6 @@ def center_window(window):
     Args:
         window: The window to center
     """
-    # Process any pending events to ensure window geometry is updated
-    QtWidgets.QApplication.processEvents()
-    
     # Get the available screen geometry
     screen = QtWidgets.QApplication.primaryScreen()
     screen_geometry = screen.availableGeometry()
@@ -26,12 +23,9 @@ def center_window(window):
         # If the window size isn't valid yet, adjust it
         window.adjustSize()
     
-    # Calculate the center position
-    window_geometry = window.frameGeometry()
-    center_point = screen_geometry.center()
-    
     # Move the window's center point to the screen's center point
-    window_geometry.moveCenter(center_point)
+    window_geometry = window.frameGeometry()
+    window_geometry.moveCenter(screen_geometry.center())
     
     # Move the window to the center position
     window.move(window_geometry.topLeft())
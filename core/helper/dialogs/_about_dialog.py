@@ -4,14 +4,29 @@ Helper module for the About dialog.
 This module contains functions to show the About dialog with information from config.json.
 """
 
-from PySide6 import QtWidgets, QtUiTools, QtCore
-from PySide6.QtGui import QIcon
+from PySide6 import QtWidgets, QtCore
 import os
 
 # Import the license dialog helper and URL opener
 from core.helper.dialogs._license_dialog import show_license_dialog
 from core.helper._url_handler import open_url
 from core.helper._window_utils import center_window
+from core.helper._icon_cache import get_icon
+from core.helper._ui_cache import load_ui_cached
+
+# Values shown when a key is missing from config.json
+_ABOUT_DEFAULTS = {
+    "app_icon": "image_tea.ico",
+    "app_name": "Application Name",
+    "app_version": "1.0.0",
+    "app_description": "Description not available",
+    "app_author": "Unknown",
+    "app_author_email": "",
+    "app_copyright": "",
+    "app_license": "Unknown",
+    "app_commit_hash": "",
+    "app_commit_date": "",
+}
 
 def show_about_dialog(parent, config, base_dir):
     """
@@ -24,29 +39,28 @@ def show_about_dialog(parent, config, base_dir):
     """
     # Load the About window UI
     ui_path = os.path.join(base_dir, "gui", "dialogs", "about_window.ui")
-    loader = QtUiTools.QUiLoader()
-    ui_file = QtCore.QFile(ui_path)
-    ui_file.open(QtCore.QFile.ReadOnly)
-    about_dialog = loader.load(ui_file, parent)
-    ui_file.close()
+    about_dialog = load_ui_cached(ui_path, parent)
+    
+    # Merge the config over the defaults once instead of a get() per field
+    values = {**_ABOUT_DEFAULTS, **config}
     
     # Set window icon
-    icon_path = os.path.join(base_dir, "res", config.get("app_icon", "image_tea.ico"))
-    if os.path.exists(icon_path):
-        about_dialog.setWindowIcon(QIcon(icon_path))
+    icon_path = os.path.join(base_dir, "res", values["app_icon"])
+    app_icon = get_icon(icon_path)
+    if app_icon is not None:
+        about_dialog.setWindowIcon(app_icon)
     
     # Set values from config
-    about_dialog.lblAppName.setText(config.get("app_name", "Application Name"))
-    about_dialog.lblVersion.setText(f"Version {config.get('app_version', '1.0.0')}")
-    about_dialog.lblDescription.setText(config.get("app_description", "Description not available"))
-    about_dialog.lblAuthor.setText(f"Developed by {config.get('app_author', 'Unknown')}")
-    about_dialog.lblEmail.setText(config.get("app_author_email", ""))
-    about_dialog.lblCopyright.setText(config.get("app_copyright", ""))
-    about_dialog.lblLicense.setText(f"Licensed under {config.get('app_license', 'Unknown')}")
+    about_dialog.lblAppName.setText(values["app_name"])
+    about_dialog.lblVersion.setText(f"Version {values['app_version']}")
+    about_dialog.lblDescription.setText(values["app_description"])
+    about_dialog.lblAuthor.setText(f"Developed by {values['app_author']}")
+    about_dialog.lblCopyright.setText(values["app_copyright"])
+    about_dialog.lblLicense.setText(f"Licensed under {values['app_license']}")
     
     # Set commit info if available
-    commit_hash = config.get("app_commit_hash", "")
-    commit_date = config.get("app_commit_date", "")
+    commit_hash = values["app_commit_hash"]
+    commit_date = values["app_commit_date"]
     if commit_hash and commit_date:
         about_dialog.lblCommitInfo.setText(f"Build: {commit_hash[:7]} ({commit_date})")
     else:
@@ -59,10 +73,12 @@ def show_about_dialog(parent, config, base_dir):
     about_dialog.btnSeeLicense.clicked.connect(lambda: show_license_dialog(parent, config, base_dir))
     
     # If we have email info, make it clickable
-    email = config.get("app_author_email", "")
+    email = values["app_author_email"]
     if email:
         about_dialog.lblEmail.setText(f'<a href="mailto:{email}">{email}</a>')
         about_dialog.lblEmail.setOpenExternalLinks(True)
+    else:
+        about_dialog.lblEmail.setText("")
     
     # Center the dialog on the screen using the helper function
     center_window(about_dialog)
@@ -4,10 +4,35 @@ Helper module for the Contributors dialog.
 This module contains functions to show the Contributors dialog with content from CONTRIBUTORS.txt.
 """
 
-from PySide6 import QtWidgets, QtUiTools, QtCore
-from PySide6.QtGui import QIcon
 import os
 from core.helper._window_utils import center_window
+from core.helper._icon_cache import get_icon
+from core.helper._ui_cache import load_ui_cached
+
+# Text of CONTRIBUTORS.txt per path, read once per run since the file doesn't change
+_CONTRIBUTORS_CACHE = {}
+
+def _read_contributors_text(contributors_path):
+    """
+    Read the contributors text, using the cached text after the first read.
+    
+    Args:
+        contributors_path: Path to CONTRIBUTORS.txt
+        
+    Returns:
+        str: The contributors text, or a message explaining why it couldn't be read
+    """
+    contributors_text = _CONTRIBUTORS_CACHE.get(contributors_path)
+    if contributors_text is None:
+        try:
+            with open(contributors_path, 'r', encoding='utf-8', errors='replace') as contributors_file:
+                contributors_text = contributors_file.read()
+        except FileNotFoundError:
+            return f"Contributors file not found at: {contributors_path}"
+        except Exception as e:
+            return f"Error reading contributors file: {str(e)}"
+        _CONTRIBUTORS_CACHE[contributors_path] = contributors_text
+    return contributors_text
 
 def show_contributors_dialog(parent, config, base_dir):
     """
@@ -20,16 +45,13 @@ def show_contributors_dialog(parent, config, base_dir):
     """
     # Load the Contributors window UI
     ui_path = os.path.join(base_dir, "gui", "dialogs", "contributors_window.ui")
-    loader = QtUiTools.QUiLoader()
-    ui_file = QtCore.QFile(ui_path)
-    ui_file.open(QtCore.QFile.ReadOnly)
-    contributors_dialog = loader.load(ui_file, parent)
-    ui_file.close()
+    contributors_dialog = load_ui_cached(ui_path, parent)
     
     # Set window icon
     icon_path = os.path.join(base_dir, "res", config.get("app_icon", "image_tea.ico"))
-    if os.path.exists(icon_path):
-        contributors_dialog.setWindowIcon(QIcon(icon_path))
+    app_icon = get_icon(icon_path)
+    if app_icon is not None:
+        contributors_dialog.setWindowIcon(app_icon)
     
     # Set the window title
     app_name = config.get("app_name", "Application")
@@ -37,16 +59,7 @@ def show_contributors_dialog(parent, config, base_dir):
     
     # Load contributors text from CONTRIBUTORS.txt
     contributors_path = os.path.join(base_dir, "CONTRIBUTORS.txt")
-    contributors_text = "No contributors information available."
-    
-    try:
-        if os.path.exists(contributors_path):
-            with open(contributors_path, 'r') as contributors_file:
-                contributors_text = contributors_file.read()
-        else:
-            contributors_text = f"Contributors file not found at: {contributors_path}"
-    except Exception as e:
-        contributors_text = f"Error reading contributors file: {str(e)}"
+    contributors_text = _read_contributors_text(contributors_path)
     
     # Display the contributors text
     contributors_dialog.textContributors.setPlainText(contributors_text)
@@ -5,11 +5,92 @@ This module handles populating the donation dialog with content from the config
 """
 
 import os
+import re
+import copy
+import functools
 from PySide6.QtWidgets import QLabel, QVBoxLayout, QWidget, QHBoxLayout, QPushButton, QApplication, QToolTip
 from PySide6.QtGui import QPixmap, QCursor
-from PySide6 import QtCore, QtWidgets, QtUiTools
-import qtawesome as qta
+from PySide6 import QtCore, QtWidgets
 from core.helper._window_utils import center_window
+from core.helper._ui_cache import load_ui_cached
+
+# Pixmaps keyed by (image path, max width, transformation mode), already scaled; the images don't change at runtime
+_PIXMAP_CACHE = {}
+
+# Copy button icon, created on first use and shared by all copy buttons
+_COPY_ICON = None
+
+# "Copied" popup label and the timer that hides it, created on the first copy
+_COPIED_TOAST = None
+_COPIED_TOAST_TIMER = None
+
+# Folders under the base dir searched for a donation image by its file name
+_IMAGE_SEARCH_SUBDIRS = ("res", "assets", "images")
+
+# Resolved full image path (or None if not found) keyed by (base dir, configured image path)
+_RESOLVED_IMAGE_PATHS = {}
+
+# Styling for every payment card, set once on the tab; only the header color varies per card.
+# Cards get a light outline instead of a drop shadow effect, which would render each card
+# offscreen on every repaint.
+_CARD_STYLESHEET = """
+    QWidget#paymentCard, QWidget#paymentCard * {
+        background-color: white;
+        border-radius: 8px;
+        padding: 0px;
+        margin: 0px;
+    }
+    QWidget#paymentCard {
+        border: 1px solid #e0e0e0;
+    }
+    QWidget#paymentCardHeader, QWidget#paymentCardHeader * {
+        border-top-left-radius: 8px;
+        border-top-right-radius: 8px;
+    }
+    QLabel#paymentCardName {
+        font-size: 14pt;
+        color: white;
+    }
+    QWidget#paymentCardContent {
+        border-bottom-left-radius: 8px;
+        border-bottom-right-radius: 8px;
+    }
+    QLabel#paymentCardAccount {
+        font-size: 11pt;
+        color: #555555;
+    }
+    QWidget#paymentCardNumberBox, QWidget#paymentCardNumberBox * {
+        background-color: #f8f9fa;
+        border-radius: 4px;
+        padding: 5px;
+    }
+    QLabel#paymentCardNumber {
+        font-size: 12pt;
+        color: #333333;
+        font-weight: 500;
+    }
+    QPushButton#paymentCardCopy {
+        background-color: transparent;
+        border: none;
+        border-radius: 4px;
+        padding: 4px;
+    }
+    QPushButton#paymentCardCopy:hover {
+        background-color: #e0e0e0;
+    }
+    QPushButton#paymentCardCopy:pressed {
+        background-color: #d0d0d0;
+    }
+"""
+
+# One supporter name per line, trimmed; blank lines and // comment lines don't match
+_SUPPORTER_PATTERN = re.compile(r'^\s*(?!//)(\S.*?)\s*$', re.MULTILINE)
+
+# (mtime, html) of the rendered supporters list per supporters.txt path
+_SUPPORTERS_HTML_CACHE = {}
+
+# The donation dialog, kept after closing so it can be shown again without rebuilding it
+_DONATION_DIALOG = None
 
 def show_donation_dialog(parent, config, base_dir):
     """
@@ -20,22 +101,23 @@ def show_donation_dialog(parent, config, base_dir):
         config: The application configuration dictionary
         base_dir: Base directory path
     """
-    # Load the donation UI file
-    ui_path = os.path.join(base_dir, "gui", "dialogs", "donation_window.ui")
+    global _DONATION_DIALOG
+    donation_dialog = _get_reusable_dialog(parent)
     
-    loader = QtUiTools.QUiLoader()
-    ui_file = QtCore.QFile(ui_path)
-    ui_file.open(QtCore.QFile.ReadOnly)
-    donation_dialog = loader.load(ui_file, parent)
-    ui_file.close()
+    if donation_dialog is None:
+        # Load the donation UI file
+        ui_path = os.path.join(base_dir, "gui", "dialogs", "donation_window.ui")
+        donation_dialog = load_ui_cached(ui_path, parent)
+        
+        # Connect the Close button to close the dialog
+        if hasattr(donation_dialog, 'closeButton'):
+            donation_dialog.closeButton.clicked.connect(donation_dialog.close)
+        
+        _DONATION_DIALOG = donation_dialog
     
-    # Populate the dialog with content from config
+    # Populate the dialog with content from config; skipped if it already shows this config
     populate_donation_dialog(donation_dialog, config, base_dir)
     
-    # Connect the Close button to close the dialog
-    if hasattr(donation_dialog, 'closeButton'):
-        donation_dialog.closeButton.clicked.connect(donation_dialog.close)
-    
     # Process events to ensure the dialog has its final size
     QtWidgets.QApplication.processEvents()
     
@@ -61,10 +143,24 @@ def show_donation_dialog(parent, config, base_dir):
     # Show the dialog as modal
     donation_dialog.exec()
 
+def _get_reusable_dialog(parent):
+    """Get the previously built donation dialog if it still exists and has the same parent."""
+    if _DONATION_DIALOG is None:
+        return None
+    try:
+        if _DONATION_DIALOG.parent() is parent:
+            return _DONATION_DIALOG
+    except RuntimeError:
+        # The underlying C++ dialog was deleted along with its parent
+        pass
+    return None
+
 def populate_donation_dialog(dialog, config, base_dir):
     """
     Populate the donation dialog with content from the config file.
     
+    Does nothing if the dialog was already populated from the same donation settings.
+    
     Args:
         dialog: The donation dialog to populate
         config: The application configuration dictionary
@@ -72,6 +168,12 @@ def populate_donation_dialog(dialog, config, base_dir):
     """
     donation_config = config.get("donation_dialog", {})
     
+    # Compare against a copy, since the config dict may be edited in place
+    populated_from = (base_dir, donation_config)
+    if getattr(dialog, '_donation_populated_from', None) == populated_from:
+        return
+    dialog._donation_populated_from = (base_dir, copy.deepcopy(donation_config))
+    
     # Set the dialog title
     title = donation_config.get("title", "Support Image Tea Mini")
     dialog.setWindowTitle(title)
@@ -85,11 +187,11 @@ def populate_donation_dialog(dialog, config, base_dir):
     
     # Populate e-wallet tab
     if hasattr(dialog, 'tab') and "ewallet" in donation_config:
-        _populate_payment_tab(dialog.tab, donation_config["ewallet"])
+        _populate_payment_tab(dialog.tab, donation_config["ewallet"], base_dir)
     
     # Populate bank tab
     if hasattr(dialog, 'tab_2') and "bank" in donation_config:
-        _populate_payment_tab(dialog.tab_2, donation_config["bank"])
+        _populate_payment_tab(dialog.tab_2, donation_config["bank"], base_dir)
     
     # Populate QRIS tab
     if hasattr(dialog, 'tab_3') and "QRIS" in donation_config:
@@ -99,13 +201,96 @@ def populate_donation_dialog(dialog, config, base_dir):
     if hasattr(dialog, 'scrollAreaWidgetContents'):
         _populate_thank_you_tab(dialog.scrollAreaWidgetContents, base_dir)
 
-def _copy_to_clipboard(text):
-    """Copy text to clipboard and show a tooltip."""
+def _copy_to_clipboard(text, checked=False):
+    """Copy text to clipboard and show a tooltip.
+    
+    The unused checked argument absorbs the value passed by QPushButton.clicked.
+    """
+    global _COPIED_TOAST, _COPIED_TOAST_TIMER
     clipboard = QApplication.clipboard()
     clipboard.setText(text)
-    QToolTip.showText(QCursor.pos(), "Copied to clipboard!", None)
+    
+    # Reuse one tooltip-style label instead of having QToolTip build its popup on every click
+    if _COPIED_TOAST is None:
+        _COPIED_TOAST = QLabel("Copied to clipboard!", None, QtCore.Qt.ToolTip)
+        _COPIED_TOAST.setPalette(QToolTip.palette())
+        _COPIED_TOAST.setFont(QToolTip.font())
+        _COPIED_TOAST.setMargin(4)
+        _COPIED_TOAST.adjustSize()
+        _COPIED_TOAST_TIMER = QtCore.QTimer()
+        _COPIED_TOAST_TIMER.setSingleShot(True)
+        _COPIED_TOAST_TIMER.timeout.connect(_COPIED_TOAST.hide)
+    
+    _COPIED_TOAST.move(QCursor.pos() + QtCore.QPoint(12, 12))
+    _COPIED_TOAST.show()
+    # Restarting the timer keeps the popup up for the full time after repeated clicks
+    _COPIED_TOAST_TIMER.start(1500)
 
-def _populate_payment_tab(tab, payment_methods):
+def _get_copy_icon():
+    """Get the shared copy button icon, importing qtawesome on first use."""
+    global _COPY_ICON
+    if _COPY_ICON is None:
+        import qtawesome as qta
+        _COPY_ICON = qta.icon('fa5s.copy', color="#555555")
+    return _COPY_ICON
+
+def _resolve_image_path(image_path, base_dir):
+    """
+    Find a configured donation image on disk, checking the candidate folders only once.
+    
+    Args:
+        image_path: Image path from the config, relative to base_dir
+        base_dir: The application base directory
+        
+    Returns:
+        str: Full path of the first existing candidate, or None if none exists
+    """
+    key = (base_dir, image_path)
+    if key not in _RESOLVED_IMAGE_PATHS:
+        # Try the direct path from config first, then the file name in each image folder
+        image_name = os.path.basename(image_path)
+        possible_paths = [os.path.join(base_dir, image_path)]
+        possible_paths.extend(os.path.join(base_dir, sub_dir, image_name) for sub_dir in _IMAGE_SEARCH_SUBDIRS)
+        
+        # Find the first path that exists
+        _RESOLVED_IMAGE_PATHS[key] = next((path for path in possible_paths if os.path.exists(path)), None)
+    return _RESOLVED_IMAGE_PATHS[key]
+
+def _load_scaled_pixmap(path, max_width, mode=QtCore.Qt.SmoothTransformation):
+    """
+    Load an image scaled down to max_width, using the cached pixmap after the first load.
+    
+    Args:
+        path: Path to the image file
+        max_width: Maximum width in pixels, wider images are scaled down keeping their aspect ratio
+        mode: Transformation mode used for scaling
+        
+    Returns:
+        QPixmap: The pixmap, null if the image couldn't be loaded
+    """
+    key = (path, max_width, mode)
+    pixmap = _PIXMAP_CACHE.get(key)
+    if pixmap is None:
+        pixmap = QPixmap(path)
+        if not pixmap.isNull() and pixmap.width() > max_width:
+            pixmap = pixmap.scaledToWidth(max_width, mode)
+        _PIXMAP_CACHE[key] = pixmap
+    return pixmap
+
+def _clear_layout(widget):
+    """Delete the widget's layout and the child widgets it was showing."""
+    old_layout = widget.layout()
+    if old_layout is None:
+        return
+    
+    # The laid out widgets are children of the widget itself, not of its layout
+    for child in widget.findChildren(QWidget, options=QtCore.Qt.FindDirectChildrenOnly):
+        child.deleteLater()
+    
+    # Moving the layout to a temporary widget detaches it here and deletes it with that widget
+    QWidget().setLayout(old_layout)
+
+def _populate_payment_tab(tab, payment_methods, base_dir):
     """Create a layout with modern payment method cards."""
 
     layout = QVBoxLayout()
@@ -122,23 +307,7 @@ def _populate_payment_tab(tab, payment_methods):
         
         # Create a container for each payment method with modern card styling
         method_widget = QWidget()
-        
-        # Modern card styling with subtle shadow
-        shadow = QtWidgets.QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(10)
-        shadow.setColor(QtCore.Qt.gray)
-        shadow.setOffset(0, 2)
-        method_widget.setGraphicsEffect(shadow)
-        
-        # Clean, modern card style
-        style = """
-            background-color: white;
-            border-radius: 8px;
-            padding: 0px;
-            margin: 0px;
-        """
-        
-        method_widget.setStyleSheet(style)
+        method_widget.setObjectName("paymentCard")
         
         # Main layout for the card
         card_layout = QVBoxLayout(method_widget)
@@ -147,49 +316,28 @@ def _populate_payment_tab(tab, payment_methods):
         
         # Create a colored header
         header_widget = QWidget()
-        if color:
-            header_widget.setStyleSheet(f"background-color: {color}; border-top-left-radius: 8px; border-top-right-radius: 8px;")
-        else:
-            header_widget.setStyleSheet("background-color: #f5f5f5; border-top-left-radius: 8px; border-top-right-radius: 8px;")
+        header_widget.setObjectName("paymentCardHeader")
+        header_widget.setStyleSheet(f"background-color: {color or '#f5f5f5'};")
         
         header_layout = QHBoxLayout(header_widget)
         header_layout.setContentsMargins(15, 10, 15, 10)
         
         # Add logo if available
         if image_path:
-            # Try to find the image
-            base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            possible_paths = [
-                os.path.join(base_dir, image_path),
-                os.path.join(base_dir, "res", os.path.basename(image_path)),
-                os.path.join(base_dir, "assets", os.path.basename(image_path)),
-                os.path.join(base_dir, "images", os.path.basename(image_path)),
-            ]
-            
-            # Find the first path that exists
-            full_path = None
-            for path in possible_paths:
-                if os.path.exists(path):
-                    full_path = path
-                    break
-            
+            full_path = _resolve_image_path(image_path, base_dir)
             if full_path:
-                pixmap = QPixmap(full_path)
+                # Scaled while maintaining aspect ratio; smooth filtering isn't visible on small logos
+                pixmap = _load_scaled_pixmap(full_path, max_width, QtCore.Qt.FastTransformation)
                 if not pixmap.isNull():
                     logo_label = QLabel()
-                    # Scale the pixmap while maintaining aspect ratio
-                    if pixmap.width() > max_width:
-                        pixmap_scaled = pixmap.scaledToWidth(max_width, QtCore.Qt.SmoothTransformation)
-                        logo_label.setPixmap(pixmap_scaled)
-                    else:
-                        logo_label.setPixmap(pixmap)
+                    logo_label.setPixmap(pixmap)
                     
                     header_layout.addWidget(logo_label)
                     header_layout.addSpacing(10)
         
         # Add name to header
         name_label = QLabel(f"<b>{name}</b>")
-        name_label.setStyleSheet("font-size: 14pt; color: white;")
+        name_label.setObjectName("paymentCardName")
         header_layout.addWidget(name_label)
         header_layout.addStretch()
         
@@ -198,7 +346,7 @@ def _populate_payment_tab(tab, payment_methods):
         
         # Create content area
         content_widget = QWidget()
-        content_widget.setStyleSheet("background-color: white; border-bottom-left-radius: 8px; border-bottom-right-radius: 8px;")
+        content_widget.setObjectName("paymentCardContent")
         
         content_layout = QVBoxLayout(content_widget)
         content_layout.setContentsMargins(15, 15, 15, 15)
@@ -207,16 +355,12 @@ def _populate_payment_tab(tab, payment_methods):
         # Add account name if provided
         if account_name:
             account_label = QLabel(f"{account_name}")
-            account_label.setStyleSheet("font-size: 11pt; color: #555555;")
+            account_label.setObjectName("paymentCardAccount")
             content_layout.addWidget(account_label)
         
         # Create a horizontal layout for the number and copy button
         number_container = QWidget()
-        number_container.setStyleSheet("""
-            background-color: #f8f9fa;
-            border-radius: 4px;
-            padding: 5px;
-        """)
+        number_container.setObjectName("paymentCardNumberBox")
         
         number_layout = QHBoxLayout(number_container)
         number_layout.setContentsMargins(10, 5, 10, 5)
@@ -224,7 +368,7 @@ def _populate_payment_tab(tab, payment_methods):
         
         # Add method number with monospace font for better readability
         number_label = QLabel(f"<span style='font-family: monospace;'>{number}</span>")
-        number_label.setStyleSheet("font-size: 12pt; color: #333333; font-weight: 500;")
+        number_label.setObjectName("paymentCardNumber")
         number_label.setCursor(QtCore.Qt.IBeamCursor)  # Show text cursor on hover
         
         # Make the number selectable
@@ -234,27 +378,14 @@ def _populate_payment_tab(tab, payment_methods):
         
         # Add a modern copy button
         copy_button = QPushButton("")
-        copy_button.setIcon(qta.icon('fa5s.copy', color="#555555"))
+        copy_button.setIcon(_get_copy_icon())
         copy_button.setToolTip("Copy to clipboard")
         copy_button.setFixedSize(28, 28)
         copy_button.setCursor(QtCore.Qt.PointingHandCursor)
-        copy_button.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                border-radius: 4px;
-                padding: 4px;
-            }
-            QPushButton:hover {
-                background-color: #e0e0e0;
-            }
-            QPushButton:pressed {
-                background-color: #d0d0d0;
-            }
-        """)
+        copy_button.setObjectName("paymentCardCopy")
         
         # Connect copy button to clipboard function
-        copy_button.clicked.connect(lambda checked=False, text=number: _copy_to_clipboard(text))
+        copy_button.clicked.connect(functools.partial(_copy_to_clipboard, number))
         
         number_layout.addWidget(copy_button)
         
@@ -270,20 +401,12 @@ def _populate_payment_tab(tab, payment_methods):
     # Add stretch to push all items to the top
     layout.addStretch()
     
-    # Set the layout on the tab
-    if tab.layout():
-        # Clear existing layout if there is one
-        while tab.layout().count():
-            item = tab.layout().takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        # Delete the old layout
-        old_layout = tab.layout()
-        tab.setLayout(layout)
-        old_layout.deleteLater()
-    else:
-        # Set new layout if there isn't one
-        tab.setLayout(layout)
+    # Style all cards with one stylesheet
+    tab.setStyleSheet(_CARD_STYLESHEET)
+    
+    # Replace any existing layout on the tab
+    _clear_layout(tab)
+    tab.setLayout(layout)
 
 def _populate_qris_tab(tab, qris_data, base_dir):
     """Create a layout with QRIS image."""
@@ -292,38 +415,20 @@ def _populate_qris_tab(tab, qris_data, base_dir):
     for qris in qris_data:
         image_path = qris.get("image", "")
         
-        # Construct full path to image
-        # Try multiple possible locations for the image
-        possible_paths = [
-            os.path.join(base_dir, image_path),                 # Direct path from config
-            os.path.join(base_dir, "res", os.path.basename(image_path)),  # In res folder
-            os.path.join(base_dir, "assets", os.path.basename(image_path)),  # In assets folder
-            os.path.join(base_dir, "images", os.path.basename(image_path)),  # In images folder
-        ]
-        
-        # Find the first path that exists
-        full_path = None
-        for path in possible_paths:
-            if os.path.exists(path):
-                full_path = path
-                break
+        # Find the image in the folders it may be stored in
+        full_path = _resolve_image_path(image_path, base_dir)
         
         # If image exists, add it to the layout
         if full_path:
-            pixmap = QPixmap(full_path)
+            # Get the max width from config or use default
+            max_width = qris.get("max_width", 300)
+            
+            # Scaled while maintaining aspect ratio
+            pixmap = _load_scaled_pixmap(full_path, max_width)
             if not pixmap.isNull():
-                # Get the max width from config or use default
-                max_width = qris.get("max_width", 300)
-                
                 # Create a QLabel for the image
                 image_label = QLabel()
-                
-                # Scale the pixmap while maintaining aspect ratio
-                if pixmap.width() > max_width:
-                    pixmap_scaled = pixmap.scaledToWidth(max_width, QtCore.Qt.SmoothTransformation)
-                    image_label.setPixmap(pixmap_scaled)
-                else:
-                    image_label.setPixmap(pixmap)
+                image_label.setPixmap(pixmap)
                 
                 # Don't scale the contents (prevents squishing)
                 image_label.setScaledContents(False)
@@ -352,20 +457,43 @@ def _populate_qris_tab(tab, qris_data, base_dir):
     # Add stretch to push everything to the top
     layout.addStretch()
     
-    # Set the layout on the tab
-    if tab.layout():
-        # Clear existing layout if there is one
-        while tab.layout().count():
-            item = tab.layout().takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        # Delete the old layout
-        old_layout = tab.layout()
-        tab.setLayout(layout)
-        old_layout.deleteLater()
-    else:
-        # Set new layout if there isn't one
-        tab.setLayout(layout)
+    # Replace any existing layout on the tab
+    _clear_layout(tab)
+    tab.setLayout(layout)
+
+def _get_supporters_html(supporters_file):
+    """
+    Build the supporters list HTML, reusing the cached HTML while the file is unchanged.
+    
+    Args:
+        supporters_file: Path to supporters.txt
+        
+    Returns:
+        str: HTML for the supporters list
+    """
+    try:
+        mtime = os.stat(supporters_file).st_mtime
+    except OSError:
+        return "<p><i>Be the first to support us!</i></p>"
+    
+    cached = _SUPPORTERS_HTML_CACHE.get(supporters_file)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    try:
+        with open(supporters_file, 'r', encoding='utf-8') as file:
+            # Collect the trimmed names in one pass, skipping empty lines and comments
+            supporters = _SUPPORTER_PATTERN.findall(file.read())
+            
+            if supporters:
+                supporters_text = "<ul>" + "".join(f"<li>{supporter}</li>" for supporter in supporters) + "</ul>"
+            else:
+                supporters_text = "<p><i>Be the first to support us!</i></p>"
+    except Exception as e:
+        return f"<p><i>Error loading supporters list: {str(e)}</i></p>"
+    
+    _SUPPORTERS_HTML_CACHE[supporters_file] = (mtime, supporters_text)
+    return supporters_text
 
 def _populate_thank_you_tab(content_widget, base_dir):
     """Populate the thank you tab with a message and supporters list."""
@@ -383,49 +511,19 @@ def _populate_thank_you_tab(content_widget, base_dir):
     # Add supporters list from supporters.txt
     supporters_label = QLabel("<h3>Our Awesome Supporters:</h3>")
     layout.addWidget(supporters_label)
-      # Use the base_dir passed from the function parameters
+    # Use the base_dir passed from the function parameters
     supporters_file = os.path.join(base_dir, "supporters.txt")
-    supporters_text = ""    
-    if os.path.exists(supporters_file):
-        try:
-            with open(supporters_file, 'r', encoding='utf-8') as file:
-                supporters = file.read().strip().split('\n')
-                
-                # Filter out empty lines and comments, properly trimming each line
-                supporters = [s.strip() for s in supporters if s.strip() and not s.strip().startswith('//')]
-                
-                if supporters:
-                    supporters_text = "<ul>"
-                    for supporter in supporters:
-                        supporters_text += f"<li>{supporter}</li>"
-                    supporters_text += "</ul>"
-                else:
-                    supporters_text = "<p><i>Be the first to support us!</i></p>"
-        except Exception as e:
-            supporters_text = f"<p><i>Error loading supporters list: {str(e)}</i></p>"
-    else:
-        supporters_text = "<p><i>Be the first to support us!</i></p>"
-    
-    # Create and add the supporters list
-    supporters_list = QLabel(supporters_text)
-    supporters_list.setWordWrap(True)
-    supporters_list.setTextFormat(QtCore.Qt.RichText)
-    layout.addWidget(supporters_list)
+    supporters_text = _get_supporters_html(supporters_file)
     
-    # Add stretch to push content to the top
-    layout.addStretch()
+    # Create and add the supporters list; a text browser lays out a long list incrementally
+    # and only paints the visible part, unlike a rich text label
+    supporters_list = QtWidgets.QTextBrowser()
+    supporters_list.setFrameShape(QtWidgets.QFrame.NoFrame)
+    supporters_list.setStyleSheet("background: transparent;")
+    supporters_list.setOpenExternalLinks(True)
+    supporters_list.setHtml(supporters_text)
+    layout.addWidget(supporters_list)
     
-    # Set the layout on the content widget
-    if content_widget.layout():
-        # Clear existing layout if there is one
-        while content_widget.layout().count():
-            item = content_widget.layout().takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        # Delete the old layout
-        old_layout = content_widget.layout()
-        content_widget.setLayout(layout)
-        old_layout.deleteLater()
-    else:
-        # Set new layout if there isn't one
-        content_widget.setLayout(layout)
+    # Replace any existing layout on the content widget
+    _clear_layout(content_widget)
+    content_widget.setLayout(layout)
@@ -4,10 +4,46 @@ Helper module for the License dialog.
 This module contains functions to show the License dialog with content from LICENSE.txt.
 """
 
-from PySide6 import QtWidgets, QtUiTools, QtCore
-from PySide6.QtGui import QIcon
+from PySide6 import QtGui
 import os
 from core.helper._window_utils import center_window
+from core.helper._icon_cache import get_icon
+from core.helper._ui_cache import load_ui_cached
+
+# (mtime, text) of LICENSE.txt per path, so reopening the dialog skips the read
+_LICENSE_CACHE = {}
+
+# (text, QTextDocument) last shown in the dialog; the document has no parent, so it outlives each dialog
+_LICENSE_DOCUMENT = None
+
+def _read_license_text(license_path):
+    """
+    Read the license text, reusing the cached text while the file is unchanged.
+    
+    Args:
+        license_path: Path to LICENSE.txt
+        
+    Returns:
+        str: The license text, or a message explaining why it couldn't be read
+    """
+    try:
+        mtime = os.stat(license_path).st_mtime
+    except OSError:
+        return f"License file not found at: {license_path}"
+    
+    cached = _LICENSE_CACHE.get(license_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    try:
+        # Decode as UTF-8 explicitly; the platform default encoding differs on Windows
+        with open(license_path, 'rb') as license_file:
+            license_text = license_file.read().decode('utf-8', 'replace')
+    except Exception as e:
+        return f"Error reading license file: {str(e)}"
+    
+    _LICENSE_CACHE[license_path] = (mtime, license_text)
+    return license_text
 
 def show_license_dialog(parent, config, base_dir):
     """
@@ -20,16 +56,13 @@ def show_license_dialog(parent, config, base_dir):
     """
     # Load the License window UI
     ui_path = os.path.join(base_dir, "gui", "dialogs", "license_window.ui")
-    loader = QtUiTools.QUiLoader()
-    ui_file = QtCore.QFile(ui_path)
-    ui_file.open(QtCore.QFile.ReadOnly)
-    license_dialog = loader.load(ui_file, parent)
-    ui_file.close()
+    license_dialog = load_ui_cached(ui_path, parent)
     
     # Set window icon
     icon_path = os.path.join(base_dir, "res", config.get("app_icon", "image_tea.ico"))
-    if os.path.exists(icon_path):
-        license_dialog.setWindowIcon(QIcon(icon_path))
+    app_icon = get_icon(icon_path)
+    if app_icon is not None:
+        license_dialog.setWindowIcon(app_icon)
     
     # Set the window title
     app_name = config.get("app_name", "Application")
@@ -41,19 +74,15 @@ def show_license_dialog(parent, config, base_dir):
     
     # Load license text from LICENSE.txt
     license_path = os.path.join(base_dir, "LICENSE.txt")
-    license_text = "License file not found."
-    
-    try:
-        if os.path.exists(license_path):
-            with open(license_path, 'r') as license_file:
-                license_text = license_file.read()
-        else:
-            license_text = f"License file not found at: {license_path}"
-    except Exception as e:
-        license_text = f"Error reading license file: {str(e)}"
+    license_text = _read_license_text(license_path)
     
-    # Display the license text
-    license_dialog.textLicense.setPlainText(license_text)
+    # Display the license text, reusing the laid out document while the text is unchanged
+    global _LICENSE_DOCUMENT
+    if _LICENSE_DOCUMENT is None or _LICENSE_DOCUMENT[0] != license_text:
+        document = QtGui.QTextDocument()
+        document.setPlainText(license_text)
+        _LICENSE_DOCUMENT = (license_text, document)
+    license_dialog.textLicense.setDocument(_LICENSE_DOCUMENT[1])
     
     # Center the dialog on screen
     center_window(license_dialog)
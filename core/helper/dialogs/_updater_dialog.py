@@ -1,18 +1,19 @@
 import os
-import re
 import json
-import time
 import threading
 import datetime
 import webbrowser
 from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
-from PySide6 import QtWidgets, QtUiTools, QtCore
+from PySide6 import QtWidgets, QtCore
 from PySide6.QtCore import Qt
 
 # Import the app updater module
-from core.helper._app_updater import launch_app_updater
+from core.helper._app_updater import (
+    launch_app_updater, extract_repo_info, check_internet_connection, save_config,
+    get_release_commit_hash
+)
 from core.helper._window_utils import center_window
+from core.helper._ui_cache import load_ui_cached
 
 
 def get_current_datetime_iso():
@@ -33,18 +34,6 @@ def get_formatted_datetime(iso_datetime=None):
         return iso_datetime or datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
 
-def save_config(config, base_dir):
-    """Save the updated configuration to the config.json file."""
-    try:
-        config_path = os.path.join(base_dir, "config.json")
-        with open(config_path, 'w') as config_file:
-            json.dump(config, config_file, indent=4)
-        return True
-    except Exception as e:
-        print(f"Error saving config: {e}")
-        return False
-
-
 def reload_config(base_dir):
     """Reload the configuration from the config.json file."""
     try:
@@ -105,11 +94,7 @@ def show_updater_dialog(parent, config, base_dir):
     # Load the UI file for the updater dialog
     updater_ui_path = os.path.join(base_dir, "gui", "dialogs", "updater_window.ui")
     
-    loader = QtUiTools.QUiLoader()
-    ui_file = QtCore.QFile(updater_ui_path)
-    ui_file.open(QtCore.QFile.ReadOnly)
-    dialog = loader.load(ui_file, parent)
-    ui_file.close()
+    dialog = load_ui_cached(updater_ui_path, parent)
     
     # Set up the dialog with current version information
     current_version = config.get("app_version", "Unknown")
@@ -196,43 +181,28 @@ def check_for_updates(dialog, config, base_dir):
 def update_check_worker(dialog, config, base_dir):
     """Worker function to check for updates."""
     try:
-        # Step 1: Check internet connection (10%)
-        update_progress(dialog, 10, "Checking internet connection...")
-        if not check_internet_connection():
-            show_update_result(dialog, config, False, 
-                              config.get("app_update_message_no_internet", 
-                                        "No internet connection. Please check your connection and try again."))
-            return
-        
-        time.sleep(0.5)  # Small delay for UI update
-        
-        # Step 2: Check if update URL is accessible (30%)
-        update_progress(dialog, 30, "Checking update source...")
+        # Step 1: Get latest version from GitHub (60%)
+        update_progress(dialog, 30, "Retrieving latest version...")
         update_url = config.get("app_update_url", "")
-        if not update_url or not check_url_accessible(update_url):
-            show_update_result(dialog, config, False, 
-                              config.get("app_update_message_error", 
-                                        "Error checking for updates. Please try again later."))
-            return
-        
-        time.sleep(0.5)  # Small delay for UI update
-        
-        # Step 3: Get latest version from GitHub (60%)
-        update_progress(dialog, 60, "Retrieving latest version...")
-        latest_version_info = get_latest_github_release(update_url)
+        latest_version_info = get_latest_github_release(update_url) if update_url else None
         if not latest_version_info or not latest_version_info.get('version'):
-            show_update_result(dialog, config, False, 
-                              config.get("app_update_message_error", 
-                                        "Error checking for updates. Please try again later."))
+            # A successful release lookup proves the connection works, so the
+            # connectivity probe only runs to explain a failure
+            if update_url and not check_internet_connection():
+                show_update_result(dialog, config, False, 
+                                  config.get("app_update_message_no_internet", 
+                                            "No internet connection. Please check your connection and try again."))
+            else:
+                show_update_result(dialog, config, False, 
+                                  config.get("app_update_message_error", 
+                                            "Error checking for updates. Please try again later."))
             return
         
         latest_version = latest_version_info.get('version')
         latest_hash = latest_version_info.get('hash', '')
         latest_date = latest_version_info.get('date', '')
         
-        time.sleep(0.5)  # Small delay for UI update
-        
-        # Step 4: Compare versions (90%)
+        # Step 2: Compare versions (90%)
         update_progress(dialog, 90, "Comparing versions...")
         current_version = config.get("app_version", "0.0.0")
         
@@ -328,53 +298,15 @@ def show_update_result(dialog, config, update_available, message):
     )
 
 
-def check_internet_connection():
-    """Check if there's an active internet connection."""
-    try:
-        # Try to reach a reliable server
-        urlopen("https://www.google.com", timeout=3)
-        return True
-    except URLError:
-        return False
-
-
-def check_url_accessible(url):
-    """Check if the given URL is accessible."""
-    try:
-        # Extract the base URL (domain) in case the URL includes paths
-        if "github.com" in url:
-            # For GitHub URLs, we want to make sure we can access the API
-            api_url = "https://api.github.com"
-            req = Request(api_url)
-            req.add_header('User-Agent', 'Mozilla/5.0')
-            urlopen(req, timeout=5)
-            return True
-        else:
-            # For other URLs, just check if we can access the given URL
-            req = Request(url)
-            req.add_header('User-Agent', 'Mozilla/5.0')
-            urlopen(req, timeout=5)
-            return True
-    except (URLError, HTTPError):
-        return False
-
-
 def get_latest_github_release(github_url):
     """Get the latest release version and details from GitHub."""
     try:
         # Extract the username and repository name from the GitHub URL
         # The URL format is typically: https://github.com/username/repository
-        match = re.search(r'github.com/([^/]+)/([^/]+)', github_url)
-        if match:
-            username, repo = match.groups()
+        repo_info = extract_repo_info(github_url)
+        if repo_info:
+            username, repo = repo_info
             
-            # Remove any potential .git suffix
-            repo = repo.replace('.git', '')
-            
-            # If the URL points to the releases page, extract the repo name
-            if 'releases' in repo:
-                repo = repo.split('/releases')[0]
-                
             # Construct the API URL for the latest release
             api_url = f"https://api.github.com/repos/{username}/{repo}/releases/latest"
             
@@ -384,7 +316,7 @@ def get_latest_github_release(github_url):
             response = urlopen(req, timeout=5)
             
             # Parse the JSON response
-            data = json.loads(response.read().decode())
+            data = json.load(response)
             
             # Get the tag name (version)
             tag_name = data.get('tag_name', '')
@@ -394,45 +326,10 @@ def get_latest_github_release(github_url):
             if version.startswith('v'):
                 version = version[1:]
             
-            # Get the commit information if available
-            commit_hash = ''
+            # Get the commit the release points at; at most one more request
+            commit_hash = get_release_commit_hash(username, repo, data)
             commit_date = ''
             
-            # First, try to get commit details from the release API response
-            # Use target_commitish if it looks like a commit hash (not "main" or "master")
-            target_commitish = data.get('target_commitish', '')
-            if target_commitish and not target_commitish.lower() in ['main', 'master', 'develop', 'trunk']:
-                commit_hash = target_commitish
-            
-            # If we don't have a proper commit hash, try to get it from the tag itself
-            if not commit_hash or len(commit_hash) < 7:
-                try:
-                    # Get the commit SHA from the tag reference
-                    tag_url = f"https://api.github.com/repos/{username}/{repo}/git/refs/tags/{tag_name}"
-                    tag_req = Request(tag_url)
-                    tag_req.add_header('User-Agent', 'Mozilla/5.0')
-                    tag_response = urlopen(tag_req, timeout=5)
-                    tag_data = json.loads(tag_response.read().decode())
-                    
-                    # If it's an annotated tag, we need to get the tagged object
-                    if tag_data.get('object', {}).get('type') == 'tag':
-                        tag_sha = tag_data.get('object', {}).get('sha', '')
-                        if tag_sha:
-                            # Get the tag object
-                            tag_obj_url = f"https://api.github.com/repos/{username}/{repo}/git/tags/{tag_sha}"
-                            tag_obj_req = Request(tag_obj_url)
-                            tag_obj_req.add_header('User-Agent', 'Mozilla/5.0')
-                            tag_obj_response = urlopen(tag_obj_req, timeout=5)
-                            tag_obj_data = json.loads(tag_obj_response.read().decode())
-                            commit_hash = tag_obj_data.get('object', {}).get('sha', '')
-                    else:
-                        # Lightweight tag points directly to the commit
-                        commit_hash = tag_data.get('object', {}).get('sha', '')
-                except:
-                    # If we can't get the commit hash from the tag, fall back to the target_commitish
-                    if not commit_hash:
-                        commit_hash = target_commitish
-            
             # Get the published date
             published_at = data.get('published_at', '')
             if published_at:
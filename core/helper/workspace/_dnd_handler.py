@@ -5,8 +5,7 @@ from core.utils.logger import log, debug, warning, error, exception
 from core.global_operations.file_operations import (
     get_new_operation_id,
     get_file_details,
-    get_image_extensions,
-    get_video_extensions
+    get_media_extensions
 )
 from database.db_workspace import WorkspaceDataModel
 
@@ -83,16 +82,12 @@ class DropAreaHandler(QtCore.QObject):
         Args:
             urls: List of QUrls representing the dropped files/folders
         """
-        # Generate a single operation ID for all files in this drop
-        operation_id = get_new_operation_id()
-        
         # Sort URLs into files and folders
         file_paths = []
         folder_paths = []
         
         # Get supported extensions
-        image_extensions = get_image_extensions()
-        video_extensions = get_video_extensions()
+        media_extensions = get_media_extensions()
         
         # Categorize the dropped items
         for url in urls:
@@ -101,11 +96,17 @@ class DropAreaHandler(QtCore.QObject):
             if os.path.isfile(path):
                 # Check if it's a supported file type
                 _, ext = os.path.splitext(path)
-                if ext.lower() in image_extensions or ext.lower() in video_extensions:
+                if ext.lower() in media_extensions:
                     file_paths.append(path)
             elif os.path.isdir(path):
                 folder_paths.append(path)
         
+        if not file_paths and not folder_paths:
+            return
+        
+        # Generate a single operation ID for all files in this drop
+        operation_id = get_new_operation_id()
+        
         # Process files first
         if file_paths:
             self._process_dropped_files(file_paths, operation_id)
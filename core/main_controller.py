@@ -3,15 +3,15 @@ import os
 import json
 from PySide6 import QtWidgets, QtUiTools, QtCore
 from PySide6.QtWidgets import QApplication, QDialog
-from PySide6.QtGui import QIcon
 
 # Import our helpers
 from core.helper._main_menu_icons import apply_icons
 from core.helper._main_menu_actions import MenuActionHandler
 from core.helper._status_bar_actions import setup_status_bar
 from core.helper._window_utils import center_window
+from core.helper._icon_cache import get_icon
 from core.layout_controller import LayoutController
-from core.utils.logger import log, debug, warning, error, exception
+from core.utils.logger import log, debug, warning, error, exception, set_log_level
 from database import db_config  # Import the database module
 
 class MainController:
@@ -80,6 +80,11 @@ class MainController:
             with open(config_path, 'r', encoding='utf-8') as config_file:
                 config = json.load(config_file)
                 log(f"{config.get('app_name')} {config.get('app_version')}")
+                
+                # Only emit the messages the configured log level asks for
+                log_level = config.get("logging", {}).get("level")
+                if log_level:
+                    set_log_level(log_level)
                 return config
         except FileNotFoundError:
             error(f"Configuration file missing: {config_path}")
@@ -107,8 +112,8 @@ class MainController:
             
         icon_path = os.path.join(self.BASE_DIR, "res", self.config.get("app_icon", "image_tea.ico"))
         
-        if os.path.exists(icon_path):
-            app_icon = QIcon(icon_path)
+        app_icon = get_icon(icon_path)
+        if app_icon is not None:
             self.app.setWindowIcon(app_icon)
         else:
             warning(f"Application icon not found at {icon_path}")
@@ -141,8 +146,8 @@ class MainController:
             
             # Add the program icon
             icon_path = os.path.join(self.BASE_DIR, "res", self.config.get("app_icon", "image_tea.ico"))
-            if os.path.exists(icon_path):
-                window_icon = QIcon(icon_path)
+            window_icon = get_icon(icon_path)
+            if window_icon is not None:
                 self.window.setWindowIcon(window_icon)
             
             # Apply icons to menus
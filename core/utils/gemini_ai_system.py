@@ -5,6 +5,9 @@ from google.genai import types
 from PySide6.QtCore import QThread, Signal
 from core.utils.logger import log, debug, warning, error, exception
 
+# Number of AI results whose metadata is written to the image files in one batch
+_METADATA_WRITE_BATCH_SIZE = 20
+
 
 class GeminiAIProcessor(QThread):
     """
@@ -26,6 +29,8 @@ class GeminiAIProcessor(QThread):
         self.files_data = files_data
         self.client = None
         self.should_stop = False
+        # (file path, metadata) pairs waiting to be written back to the image files
+        self.pending_metadata_writes = []
         
     def setup_gemini_client(self):
         """Setup Gemini client with API key from config."""
@@ -230,6 +235,8 @@ class GeminiAIProcessor(QThread):
             exception(e, "Error in Gemini AI processing thread")
             self.error_occurred.emit(str(e))
         finally:
+            # Write the metadata of the last results, also when processing was stopped
+            self.flush_metadata_writes()
             self.processing_finished.emit()
     
     def update_file_status(self, file_id, status):
@@ -370,11 +377,10 @@ class GeminiAIProcessor(QThread):
                 if success:
                     debug(f"Updated database for file ID {file_id} with AI metadata")
                     
-                    # Also write metadata back to the image file
-                    try:
-                        self.write_metadata_to_file(file_path, ai_metadata)
-                    except Exception as e:
-                        warning(f"Failed to write metadata to file {file_path}: {e}")
+                    # Also write metadata back to the image file, together with the next results
+                    self.pending_metadata_writes.append((file_path, ai_metadata))
+                    if len(self.pending_metadata_writes) >= _METADATA_WRITE_BATCH_SIZE:
+                        self.flush_metadata_writes()
                     
                 else:
                     warning(f"Failed to update database for file ID {file_id}")
@@ -385,26 +391,23 @@ class GeminiAIProcessor(QThread):
         except Exception as e:
             exception(e, f"Error updating file {file_id} with AI metadata")
     
-    def write_metadata_to_file(self, file_path, metadata):
-        """
-        Write metadata back to the image file.
+    def flush_metadata_writes(self):
+        """Write the metadata of the pending AI results back to their image files."""
+        if not self.pending_metadata_writes:
+            return
         
-        Args:
-            file_path (str): Path to the image file
-            metadata (dict): Metadata to write
-        """
+        items = self.pending_metadata_writes
+        self.pending_metadata_writes = []
         try:
-            # Write metadata using the file operations module
-            from core.global_operations.file_operations import write_metadata_to_file
-            success = write_metadata_to_file(file_path, metadata)
+            # One exiftool run writes the whole batch; without exiftool the files are written one by one
+            from core.global_operations.file_operations import update_file_metadata_from_ai_batch
+            written_count = update_file_metadata_from_ai_batch(items)
             
-            if success:
-                debug(f"Successfully wrote metadata to file: {file_path}")
-            else:
-                warning(f"Failed to write metadata to file: {file_path}")
+            if written_count < len(items):
+                warning(f"Failed to write metadata to {len(items) - written_count} of {len(items)} files")
                 
         except Exception as e:
-            exception(e, f"Error writing metadata to file {file_path}")
+            exception(e, f"Error writing metadata to {len(items)} files")
 
 
 class GeminiAISystem:
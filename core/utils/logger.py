@@ -8,32 +8,85 @@ from anywhere in the application to log messages to the Output Logs widget.
 from datetime import datetime
 import sys
 import traceback
+from PySide6.QtCore import QObject, Signal, Slot
 
 # Reference to the output logs widget instance
 _global_output_logs = None
 
+# Forwards log lines to the output logs widget on the thread that set it up
+_log_dispatcher = None
+
+# Whether DEBUG messages are emitted at all
+_debug_enabled = True
+
+# Whether INFO messages are emitted at all
+_info_enabled = True
+
+class _LogDispatcher(QObject):
+    """Delivers log lines to the output logs widget in the UI thread.
+
+    Messages logged from worker threads are queued to the thread the dispatcher
+    lives in; messages logged from that thread are delivered directly.
+    """
+    message = Signal(str, str, str)  # Operation, details and level
+
+    def __init__(self):
+        super().__init__()
+        self.message.connect(self._append_log)
+
+    @Slot(str, str, str)
+    def _append_log(self, operation, details, level):
+        """Append a log line to the output logs widget."""
+        if _global_output_logs:
+            _global_output_logs.append_log(operation, details, level)
+
 def set_output_logs(output_logs_instance):
-    """Set the global output logs instance for logging."""
-    global _global_output_logs
+    """Set the global output logs instance for logging; call this from the UI thread."""
+    global _global_output_logs, _log_dispatcher
     _global_output_logs = output_logs_instance
+    if _log_dispatcher is None:
+        _log_dispatcher = _LogDispatcher()
+
+def _send_to_output_logs(operation, details, level):
+    """Send a log line to the output logs widget, if one is set."""
+    if _global_output_logs:
+        _log_dispatcher.message.emit(operation, details, level)
+
+def is_debug_enabled():
+    """Check whether DEBUG messages are emitted, so hot paths can skip building them."""
+    return _debug_enabled
+
+def set_log_level(level):
+    """Emit only messages at or above a level name such as "DEBUG", "INFO" or "WARNING"."""
+    global _debug_enabled, _info_enabled
+    _debug_enabled = level == "DEBUG"
+    _info_enabled = level in ("DEBUG", "INFO")
+
+def is_info_enabled():
+    """Check whether INFO messages are emitted, so hot paths can skip building them."""
+    return _info_enabled
 
 def log(message):
     """Log an INFO message."""
+    if not _info_enabled:
+        return
+    
     # Print to console for fallback
     print(message)
     
     # Send to output logs widget if available
-    if _global_output_logs:
-        _global_output_logs.append_log("Info", message, "INFO")
+    _send_to_output_logs("Info", message, "INFO")
 
 def debug(message):
     """Log a DEBUG message."""
+    if not _debug_enabled:
+        return
+    
     # Print to console for fallback
     print(f"[DEBUG] {message}")
     
     # Send to output logs widget if available
-    if _global_output_logs:
-        _global_output_logs.append_log("Debug", message, "DEBUG")
+    _send_to_output_logs("Debug", message, "DEBUG")
 
 def warning(message):
     """Log a WARNING message."""
@@ -41,8 +94,7 @@ def warning(message):
     print(f"[WARNING] {message}")
     
     # Send to output logs widget if available
-    if _global_output_logs:
-        _global_output_logs.append_log("Warning", message, "WARNING")
+    _send_to_output_logs("Warning", message, "WARNING")
 
 def error(message):
     """Log an ERROR message."""
@@ -50,8 +102,7 @@ def error(message):
     print(f"[ERROR] {message}")
     
     # Send to output logs widget if available
-    if _global_output_logs:
-        _global_output_logs.append_log("Error", message, "ERROR")
+    _send_to_output_logs("Error", message, "ERROR")
 
 def exception(e, message="An exception occurred"):
     """Log an exception with traceback."""
@@ -64,6 +115,5 @@ def exception(e, message="An exception occurred"):
     print(tb_str)
     
     # Send to output logs widget if available
-    if _global_output_logs:
-        _global_output_logs.append_log("Exception", f"{message}: {str(e)}", "ERROR")
-        _global_output_logs.append_log("Exception", f"Traceback: {tb_str}", "ERROR")
+    _send_to_output_logs("Exception", f"{message}: {str(e)}", "ERROR")
+    _send_to_output_logs("Exception", f"Traceback: {tb_str}", "ERROR")
@@ -2,7 +2,7 @@ import os
 import sqlite3
 import random
 from datetime import datetime
-from core.utils.logger import log, debug, warning, error, exception
+from core.utils.logger import log, debug, warning, error, exception, is_info_enabled
 from database.db_config import connect_to_database, close_database_connection
 from core.utils.event_system import EventSystem
 
@@ -93,51 +93,39 @@ class ProjectFilesModel:
         Get the last used item_id from the database and convert to int.
         
         Returns:
-            int: The last used item_id as an integer, or 0 if no items found
+            int: The last used item_id as an integer, 0 if no items found, or None if
+                the database couldn't be read
         """
         try:
             conn = connect_to_database()
             cursor = conn.cursor()
             
-            # Query for the maximum numeric item_id from the database
+            # Let SQLite compute the maximum numeric item_id in a single row
+            # instead of fetching every item_id and parsing them in Python.
+            # Expected format: four digits like "0001", "0023", etc.; non-numeric ids are ignored
             query = """
-                SELECT item_id FROM project_data 
+                SELECT MAX(CAST(item_id AS INTEGER)) FROM project_data 
                 WHERE deleted_at IS NULL
+                AND item_id != ''
+                AND item_id NOT GLOB '*[^0-9]*'
             """
             
             cursor.execute(query)
-            
-            # Fetch all item_ids
-            rows = cursor.fetchall()
+            row = cursor.fetchone()
             close_database_connection(conn)
             
             # If no records found, start with 0
-            if not rows:
+            if not row or row[0] is None:
                 return 0
             
-            # Extract numeric value from each item_id
-            # Expected format: four digits like "0001", "0023", etc.
-            max_id = 0
-            for row in rows:
-                item_id = row[0]
-                if item_id and isinstance(item_id, str):
-                    try:
-                        # Try to convert the string to an integer
-                        id_value = int(item_id)
-                        if id_value > max_id:
-                            max_id = id_value
-                    except ValueError:
-                        # If conversion fails, ignore this item_id
-                        continue
-            
-            return max_id
+            return int(row[0])
             
         except sqlite3.Error as e:
             error(f"Database error when retrieving last item_id: {e}")
-            return 0
+            return None
         except Exception as e:
             exception(e, "Error retrieving last item_id")
-            return 0
+            return None
             
     def get_next_item_id(self):
         """
@@ -146,7 +134,8 @@ class ProjectFilesModel:
         Returns:
             str: The next available item_id (e.g., "0001", "0002", etc.)
         """
-        last_id = self.get_last_item_id()
+        # Start at "0001" if the database can't be read, as before
+        last_id = self.get_last_item_id() or 0
         next_id = last_id + 1
         
         # Format as 4-digit string with leading zeros
@@ -157,13 +146,17 @@ class ProjectFilesModel:
         Add a file to the project database.
         
         Args:
-            file_details (dict): Dictionary containing file details
+            file_details (dict or FileDetails): File details to insert
             publish_event (bool): Whether to publish a data changed event (default: True)
             
         Returns:
             bool or int: Record ID if successful, False otherwise
         """
         try:
+            # FileDetails objects from get_file_details are converted to a dict at this seam
+            if hasattr(file_details, 'to_dict'):
+                file_details = file_details.to_dict()
+            
             # Generate random colors for year, month, and day if not provided
             if 'year_color' not in file_details:
                 file_details['year_color'] = str(generate_year_color())
@@ -179,6 +172,9 @@ class ProjectFilesModel:
             # Generate the next item_id if not provided
             if 'item_id' not in file_details:
                 file_details['item_id'] = self.get_next_item_id()
+                # Keep the operation ID counter ahead of the ID assigned here
+                from core.global_operations.file_operations import advance_operation_id
+                advance_operation_id(file_details['item_id'])
             
             conn = connect_to_database()
             cursor = conn.cursor()
@@ -228,7 +224,7 @@ class ProjectFilesModel:
         Add multiple files to the project database.
         
         Args:
-            file_details_list (list): List of dictionaries containing file details
+            file_details_list (list): List of dicts or FileDetails objects
             
         Returns:
             list: List of IDs for successfully added files
@@ -478,13 +474,14 @@ class ProjectFilesModel:
             if conn:
                 close_database_connection(conn)
             return False    
-    def process_folder(self, folder_path, folder_details=None):
+    def process_folder(self, folder_path, folder_details=None, publish_event=True):
         """
         Process a folder and add all supported files to the database.
         
         Args:
             folder_path (str): Path to the folder
             folder_details (dict, optional): Dictionary with folder metadata (not used)
+            publish_event (bool): Whether to publish a data changed event (default: True)
             
         Returns:
             tuple: (dict, processed_count) - dict contains folder metadata including item_id, and count of processed files
@@ -495,8 +492,7 @@ class ProjectFilesModel:
         
         try:
             from core.global_operations.file_operations import (
-                get_image_extensions, get_video_extensions, 
-                get_file_details, get_new_operation_id
+                iter_media_files, get_file_details, get_new_operation_id
             )
             
             # Generate a new operation ID for all files in this folder
@@ -508,38 +504,30 @@ class ProjectFilesModel:
             month_color = generate_month_color()  # Not based on year_color
             day_color = generate_day_color()      # Not based on month_color
             
-            # Get supported extensions
-            image_extensions = get_image_extensions()
-            video_extensions = get_video_extensions()
-            supported_extensions = image_extensions + video_extensions
-            
-            # Walk through the folder and its subfolders
-            for root, dirs, files in os.walk(folder_path):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    ext = os.path.splitext(file)[1].lower()
-                    
-                    # Only process files with supported extensions
-                    if ext in supported_extensions:
-                        try:
-                            # Use get_file_details which now extracts metadata from files
-                            file_details = get_file_details(file_path, operation_id)
-                            if file_details:
-                                # Add colors to the file details
-                                file_details['year_color'] = str(year_color)
-                                file_details['month_color'] = str(month_color)
-                                file_details['day_color'] = str(day_color)
-                                
-                                # Add file individually using add_file but don't publish events for each one
-                                file_id = self.add_file(file_details, publish_event=False)
-                                if file_id:
-                                    processed_count += 1
-                                    log(f"Added file with extracted metadata: {file_details.get('title', 'Unknown')} from {file_path}")
-                        except Exception as e:
-                            warning(f"Error processing file {file_path}: {str(e)}")
+            # Walk through the folder and its subfolders; only supported files are returned
+            for file_path, stat_info in iter_media_files(folder_path):
+                try:
+                    # Use get_file_details which now extracts metadata from files
+                    file_details = get_file_details(file_path, operation_id, stat_info=stat_info)
+                    if file_details:
+                        file_details = file_details.to_dict()
+                        
+                        # Add colors to the file details
+                        file_details['year_color'] = str(year_color)
+                        file_details['month_color'] = str(month_color)
+                        file_details['day_color'] = str(day_color)
+                        
+                        # Add file individually using add_file but don't publish events for each one
+                        file_id = self.add_file(file_details, publish_event=False)
+                        if file_id:
+                            processed_count += 1
+                            if is_info_enabled():
+                                log(f"Added file with extracted metadata: {file_details.get('title', 'Unknown')} from {file_path}")
+                except Exception as e:
+                    warning(f"Error processing file {file_path}: {str(e)}")
             
             # Publish event only after processing all files in the folder
-            if processed_count > 0:
+            if processed_count > 0 and publish_event:
                 EventSystem.publish('project_data_changed')
         except Exception as e:
             exception(e, f"Error processing folder {folder_path}")
@@ -548,12 +536,13 @@ class ProjectFilesModel:
         folder_data = {'item_id': operation_id} if processed_count > 0 else {}
         return folder_data, processed_count
         
-    def process_multiple_folders(self, folder_paths):
+    def process_multiple_folders(self, folder_paths, publish_event=True):
         """
         Process multiple folders and add their files to the database.
         
         Args:
             folder_paths (list): List of folder paths to process
+            publish_event (bool): Whether to publish a data changed event (default: True)
             
         Returns:
             dict: Summary of processed folders with counts
@@ -586,41 +575,31 @@ class ProjectFilesModel:
                 
             try:
                 from core.global_operations.file_operations import (
-                    get_image_extensions, get_video_extensions,
-                    get_file_details
+                    iter_media_files, get_file_details
                 )
                 
-                # Get supported extensions
-                image_extensions = get_image_extensions()
-                video_extensions = get_video_extensions()
-                supported_extensions = image_extensions + video_extensions
-                
                 folder_processed_count = 0
                 
-                # Walk through the folder and its subfolders
-                for root, dirs, files in os.walk(folder_path):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        ext = os.path.splitext(file)[1].lower()
-                        
-                        # Only process files with supported extensions
-                        if ext in supported_extensions:
-                            try:
-                                # Use the multi-folder operation ID for all files
-                                file_details = get_file_details(file_path, multi_folder_operation_id)
-                                if file_details:
-                                    # Add colors to the file details
-                                    file_details['year_color'] = str(year_color)
-                                    file_details['month_color'] = str(month_color)
-                                    file_details['day_color'] = str(day_color)
-                                    
-                                    # Add file individually using add_file but don't publish events for each one
-                                    file_id = self.add_file(file_details, publish_event=False)
-                                    if file_id:
-                                        folder_processed_count += 1
-                                        total_processed_files += 1
-                            except Exception as e:
-                                warning(f"Error processing file {file_path}: {str(e)}")
+                # Walk through the folder and its subfolders; only supported files are returned
+                for file_path, stat_info in iter_media_files(folder_path):
+                    try:
+                        # Use the multi-folder operation ID for all files
+                        file_details = get_file_details(file_path, multi_folder_operation_id, stat_info=stat_info)
+                        if file_details:
+                            file_details = file_details.to_dict()
+                            
+                            # Add colors to the file details
+                            file_details['year_color'] = str(year_color)
+                            file_details['month_color'] = str(month_color)
+                            file_details['day_color'] = str(day_color)
+                            
+                            # Add file individually using add_file but don't publish events for each one
+                            file_id = self.add_file(file_details, publish_event=False)
+                            if file_id:
+                                folder_processed_count += 1
+                                total_processed_files += 1
+                    except Exception as e:
+                        warning(f"Error processing file {file_path}: {str(e)}")
                   # Add to results
                 results['total_folders'] += 1
                 results['total_files'] += folder_processed_count
@@ -640,7 +619,7 @@ class ProjectFilesModel:
                 exception(e, f"Error processing folder {folder_path}")
         
         # Publish event only once after all folders have been processed
-        if total_processed_files > 0:
+        if total_processed_files > 0 and publish_event:
             EventSystem.publish('project_data_changed')
             
         return results
\ No newline at end of file
@@ -23,7 +23,7 @@ class WorkspaceDataModel:
         Add files from a drag-and-drop operation to the database.
         
         Args:
-            file_details_list (list): List of dictionaries containing file details
+            file_details_list (list): List of FileDetails objects
             
         Returns:
             str: Item ID used for the operation
@@ -37,7 +37,7 @@ class WorkspaceDataModel:
             self.project_model.add_multiple_files(file_details_list)
             
             # Return the item_id that was used
-            return file_details_list[0]['item_id']
+            return file_details_list[0].item_id
         except Exception as e:
             exception(e, "Error adding files from drop operation")
             return None